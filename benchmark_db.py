@@ -0,0 +1,84 @@
+"""
+SQLite 동시 읽기 벤치마크 (Flask v2 서버용 DB 계층)
+동기화(쓰기)가 계속 도는 동안 여러 스레드가 기자/날짜 조회를 반복
+- 기존: 기본 설정(rollback journal) + 조회마다 새 연결
+- 개선: WAL 등 성능 설정(database.PRAGMAS) + 요청(스레드)당 연결 1개
+"""
+import os
+import sys
+import glob
+import time
+import shutil
+import tempfile
+import threading
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+import database
+from xml_parser import parse_local_xml
+
+READERS = 8
+DURATION = 3.0
+WRITE_BATCH = 200
+
+xml_files = sorted(glob.glob(os.path.join(ROOT, 'November_xml', '*.xml')) + glob.glob(os.path.join(ROOT, 'XML', '*.xml')))
+articles = [a for f in xml_files for a in parse_local_xml(f)]
+reporters = sorted({a['reporter_name'] for a in articles if a['reporter_name']})
+dates = sorted({a['pub_date'] for a in articles if a['pub_date']})
+
+
+def run(label, pragmas, per_request):
+    workdir = tempfile.mkdtemp()
+    database.DB_PATH = os.path.join(workdir, 'bench.db')
+    database.PRAGMAS = pragmas
+    database.init_db()
+    database.insert_articles(articles)
+    database.close_db()
+
+    stop = threading.Event()
+    counts = [0] * READERS
+    writes = [0]
+
+    def reader(idx):
+        i = idx
+        while not stop.is_set():
+            # 요청 1건 = 기자 조회 + 날짜 조회
+            database.get_articles_by_reporter(reporters[i % len(reporters)])
+            if not per_request:
+                database.close_db()
+            database.get_articles_by_date(dates[i % len(dates)])
+            database.close_db()  # 요청 종료 (teardown)
+            counts[idx] += 1
+            i += READERS
+
+    def writer():
+        n = 0
+        while not stop.is_set():
+            batch = [dict(a, nsid=f'bench-{n}-{j}') for j, a in enumerate(articles[:WRITE_BATCH])]
+            database.insert_articles(batch)
+            writes[0] += 1
+            n += 1
+        database.close_db()
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(READERS)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(DURATION)
+    stop.set()
+    for t in threads:
+        t.join()
+    shutil.rmtree(workdir)
+
+    rps = sum(counts) / DURATION
+    print(f"{label}: 읽기 {rps:.0f}요청/초, 쓰기 {writes[0] / DURATION:.1f}배치/초 ({WRITE_BATCH}건씩)")
+    return rps
+
+
+print("=" * 50)
+print(f"기사 {len(articles)}건, 읽기 스레드 {READERS}개 + 동기화 스레드 1개, {DURATION:.0f}초")
+print("=" * 50)
+base = run('기존', ['PRAGMA journal_mode=DELETE'], per_request=False)
+tuned = run('개선', database.PRAGMAS, per_request=True)
+print("=" * 50)
+print(f"읽기 처리량: {tuned / base:.1f}배")
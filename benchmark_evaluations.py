@@ -0,0 +1,95 @@
+"""
+평가 저장 벤치마크 (오프라인)
+로컬 S3 대역으로 관리자 여러 명이 동시에 평가를 저장하는 상황 재현
+- 이전 방식: evaluations.json 전체를 읽고 update 후 전체 재작성 (동시 저장 시 유실)
+- 분할 저장: 키가 속한 분할 파일만 조건부 업로드 + 충돌 시 재시도
+- 조회: 전체 응답 vs ?since= 변경분 응답 크기
+사용법: python benchmark_evaluations.py [S3 지연(ms), 기본 20] [기존 평가 수, 기본 3000] [동시 저장자 수, 기본 8]
+"""
+import os
+import sys
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'sync_data'))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'evaluation_api'))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'common'))
+
+import evaluation_store
+from local_s3 import LocalS3
+
+BUCKET = 'kpi.sedaily.ai'
+latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+existing_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+writers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+saves_per_writer = 10
+
+
+def evaluation(i):
+    return {'impact_grade': 'ABCD'[i % 4], 'position': '톱', 'coverage_type': '단독', 'article_type': '스트레이트'}
+
+
+def new_s3():
+    s3 = LocalS3([], latency=latency_ms / 1000)
+    legacy = {f'{100000 + i}': evaluation(i) for i in range(existing_count)}
+    s3.put_object(Bucket=BUCKET, Key='evaluations.json', Body=json.dumps(legacy, ensure_ascii=False, indent=2))
+    return s3, legacy
+
+
+def legacy_save(s3, data):
+    """이전 Lambda POST와 같은 처리"""
+    existing = json.loads(s3.get_object(Bucket=BUCKET, Key='evaluations.json')['Body'].read().decode('utf-8'))
+    existing.update(data)
+    body = json.dumps(existing, ensure_ascii=False, indent=2)
+    s3.put_object(Bucket=BUCKET, Key='evaluations.json', Body=body)
+    return len(body.encode('utf-8'))
+
+
+def store_save(s3, data):
+    evaluation_store.save(s3, BUCKET, data)
+    return sum(len(s3.objects[(BUCKET, evaluation_store.shard_key(evaluation_store.shard_of(k)))]['Body']) for k in data)
+
+
+def response_size(data):
+    return len(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+
+def run(label, save, load):
+    s3, legacy = new_s3()
+    # 저장자마다 서로 다른 기사 평가 (새 기사 + 기존 평가 수정)
+    jobs = [[{f'{900000 + w * 1000 + n}': evaluation(n)} if n % 2 else {f'{100000 + w * 50 + n}': evaluation(n + 1)}
+             for n in range(saves_per_writer)] for w in range(writers)]
+    expected = dict(legacy)
+    for job in jobs:
+        for data in job:
+            expected.update(data)
+
+    written = []
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        for sizes in executor.map(lambda job: [save(s3, data) for data in job], jobs):
+            written.extend(sizes)
+    elapsed = time.time() - start
+
+    result = load(s3)
+    lost = sum(1 for k, v in expected.items() if result.get(k) != v)
+    print(f"{label:<12} 저장 {len(written)}건 {elapsed:.2f}초 | 저장 1건당 업로드 {sum(written) / len(written) / 1024:.1f}KB | 유실 {lost}건")
+    return s3, lost
+
+
+print("=" * 70)
+print(f"S3 지연: {latency_ms}ms / 기존 평가: {existing_count}건 / 동시 저장자: {writers}명 x {saves_per_writer}건")
+print("=" * 70)
+run('이전 방식', legacy_save,
+    lambda s3: json.loads(s3.get_object(Bucket=BUCKET, Key='evaluations.json')['Body'].read().decode('utf-8')))
+s3, lost = run('분할 저장', store_save, lambda s3: evaluation_store.load_all(s3, BUCKET))
+
+# 페이지 로드: 처음 전체 조회 → 다른 관리자가 5건 저장 → 변경분 조회
+first = evaluation_store.load_changes(s3, BUCKET)
+evaluation_store.save(s3, BUCKET, {f'{800000 + n}': evaluation(n) for n in range(5)})
+delta = evaluation_store.load_changes(s3, BUCKET, since=first['version'])
+print(f"조회 응답: 전체 {response_size(first) / 1024:.1f}KB ({len(first['items'])}건) → "
+      f"since 변경분 {response_size(delta) / 1024:.2f}KB ({len(delta['items'])}건)")
+sys.exit(1 if lost or len(delta['items']) != 5 else 0)
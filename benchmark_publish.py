@@ -0,0 +1,60 @@
+"""
+게시 파일 형식 벤치마크
+temp_data.json(indent=2) 기준으로 형식별 크기/파싱 시간 비교
+- indent=2 (기존) / 공백 없는 JSON / 열 단위 표(publish_format)
+- 각각 원본 크기, gzip 크기, brotli 크기(설치된 경우)
+"""
+import os
+import sys
+import json
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda', 'sync_data'))
+from publish_format import encode_articles, decode_articles, dumps, gzip_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+with open('temp_data.json', 'r', encoding='utf-8') as f:
+    data = json.load(f)
+
+# 기자별 파일과 같은 방식: 기사 목록만 열 단위 표로 (reporter_name은 name으로 복원)
+columnar = {**data, 'reporters': [
+    {**r, 'articles': encode_articles(r['articles'], omit=('reporter_name',))} for r in data['reporters']
+]}
+
+
+def decode_all(d):
+    return [decode_articles(r['articles'], {'reporter_name': r['name']}) for r in d['reporters']]
+
+
+# 무손실 확인
+assert decode_all(json.loads(dumps(columnar))) == [r['articles'] for r in data['reporters']], '열 단위 표 복원 불일치'
+
+formats = {
+    'indent=2': json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'),
+    '공백 없음': dumps(data),
+    '열 단위 표': dumps(columnar),
+}
+
+
+def parse_time(body, decode, repeat=10):
+    start = time.time()
+    for _ in range(repeat):
+        decode(json.loads(body))
+    return (time.time() - start) / repeat * 1000
+
+
+print("=" * 64)
+print(f"기자 {len(data['reporters'])}명, 기사 {sum(len(r['articles']) for r in data['reporters'])}건")
+print("=" * 64)
+print(f"{'형식':<10} {'원본':>10} {'gzip':>10} {'brotli':>10} {'파싱':>10}")
+for name, body in formats.items():
+    if name == '열 단위 표':
+        ms = parse_time(body, decode_all)
+    else:
+        ms = parse_time(body, lambda d: d)
+    br = f"{len(brotli.compress(body, quality=11)) / 1024:.0f}KB" if brotli else '-'
+    print(f"{name:<10} {len(body) / 1024:>8.0f}KB {len(gzip_bytes(body)) / 1024:>8.0f}KB {br:>10} {ms:>8.1f}ms")
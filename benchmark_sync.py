@@ -0,0 +1,43 @@
+"""
+동기화 Lambda 벤치마크 (오프라인)
+로컬 S3 대역(XML/, November_xml/)으로 순차 처리 vs 동시 처리 비교
+사용법: python benchmark_sync.py [S3 지연(ms), 기본 50] [workers, 기본 8]
+"""
+import os
+import sys
+import time
+import json
+import gzip
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'sync_data'))
+
+import lambda_function
+from local_s3 import LocalS3, LocalCloudFront
+
+latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+xml_dirs = [os.path.join(ROOT, 'November_xml'), os.path.join(ROOT, 'XML')]
+
+print("=" * 50)
+print(f"S3 지연: {latency_ms}ms / workers: {workers}")
+print("=" * 50)
+
+results = {}
+for label, n in [('순차 (workers=1)', 1), (f'동시 (workers={workers})', workers)]:
+    lambda_function.s3 = LocalS3(xml_dirs, latency=latency_ms / 1000)
+    lambda_function.cloudfront = LocalCloudFront()
+    start = time.time()
+    response = lambda_function.lambda_handler({'mode': 'full', 'workers': n}, None)
+    elapsed = time.time() - start
+    body = json.loads(response['body'])
+    data = json.loads(gzip.decompress(lambda_function.s3.objects[(lambda_function.WEB_BUCKET, 'data.json')]['Body']))
+    data.pop('last_sync')
+    results[label] = (elapsed, data)
+    print(f"{label}: {elapsed:.2f}초 ({body['total_articles']}건, 기자 {body['total_reporters']}명)")
+
+(seq_time, seq_data), (par_time, par_data) = results.values()
+print("=" * 50)
+print(f"속도 향상: {seq_time / par_time:.1f}배")
+print(f"결과 일치: {'✅' if seq_data == par_data else '❌'}")
+print("=" * 50)
@@ -1,12 +1,41 @@
-import pandas as pd
-import json
+"""
+S-CORE 사용자 계정 엑셀 → dashboard/users/ 디렉터리 + users_private/users/credentials/ (비밀번호)
+- pandas 없이 xlsx(zip) 안의 XML을 직접 읽음 (zipfile + ElementTree iterparse, 행을 하나씩)
+- 역할 판별: 직급/직책에 관리자 키워드가 있으면 manager (정규식 한 번 컴파일 + 직책별 캐시)
+- 사번 중복: 처음 행만 사용하고 나머지 행은 경고 (--strict 면 파일을 만들지 않고 중단)
+- users/by-id/<사번>.json, 비밀번호 파일은 행을 읽는 대로 씀
+  부서 파일/index.json 은 마지막에 (형식은 lambda/users_api/user_directory.py 와 같음)
+- 올리는 곳: 출력 폴더의 users/ → 웹 버킷 users/, 비밀번호 폴더의 users/ → 비공개 버킷 users/
+  (비밀번호가 공개되므로 users.json 은 더 이상 만들지 않음)
+사용법: python create_users.py [엑셀 경로] [--strict] [--out 출력 폴더, 기본 dashboard] [--private-out 비밀번호 폴더, 기본 users_private]
+"""
+import os
+import re
+import sys
+import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 
-df = pd.read_excel('기자 지면 기여도 평가 관리 시스템(S-CORE) 사용자 계정 관련.xlsx')
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'users_api'))
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'common'))
+from user_directory import (
+    PREFIX, user_key, department_key, credential_key, INDEX_KEY, public_fields, private_fields, index_entry
+)
+from s3_json import dumps
 
-users = []
+DEFAULT_XLSX = '기자 지면 기여도 평가 관리 시스템(S-CORE) 사용자 계정 관련.xlsx'
 
-# admin 계정 추가
-users.append({
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+CELL_REF_RE = re.compile(r'([A-Z]+)')
+
+# 역할 판별: 직급/직책에 포함되면 manager, 아니면 reporter
+MANAGER_KEYWORDS = ['부장', '국장', '실장', '팀장', '랩장', '본부장']
+MANAGER_RE = re.compile('|'.join(map(re.escape, MANAGER_KEYWORDS)))
+
+ADMIN_USER = {
     'id': 'admin',
     'password': '1234',
     'name': '관리자',
@@ -14,39 +43,212 @@ users.append({
     'role': 'admin',
     'position': '관리자',
     'email': 'admin@sedaily.com'
-})
-
-for _, row in df.iterrows():
-    dept = str(row['부서']).strip()
-    emp_id = str(row['사번']).strip()
-    name = str(row['이름']).strip()
-    position = str(row['직급/직책']).strip() if pd.notna(row['직급/직책']) else ''
-    email = str(row['이메일(@sedaily.com)']).strip() if pd.notna(row['이메일(@sedaily.com)']) else ''
-    
-    # 역할 판별: 부장/국장/실장/팀장 포함시 manager, 아니면 reporter
-    if any(x in position for x in ['부장', '국장', '실장', '팀장', '랩장', '본부장']):
-        role = 'manager'
-    else:
-        role = 'reporter'
-    
-    users.append({
+}
+
+
+@lru_cache(maxsize=None)
+def classify_role(position):
+    """직급/직책 → 역할 (같은 직책이 반복되므로 캐시)"""
+    return 'manager' if MANAGER_RE.search(position) else 'reporter'
+
+
+def _column_index(ref):
+    """'B12' → 1"""
+    index = 0
+    for ch in CELL_REF_RE.match(ref).group(1):
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+
+def _first_sheet_path(zf):
+    """첫 번째 시트의 zip 안 경로 (pandas read_excel 기본값과 같은 시트)"""
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rel_id = workbook.find(f'{NS}sheets/{NS}sheet').get(f'{REL_NS}id')
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    target = next(r.get('Target') for r in rels if r.get('Id') == rel_id)
+    return target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+
+def _shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == f'{NS}si':
+                # 서식 있는 텍스트는 <r><t> 여러 개 (윗주 <rPh>는 제외)
+                parts = el.findall(f'{NS}t') or el.findall(f'{NS}r/{NS}t')
+                strings.append(''.join(t.text or '' for t in parts))
+                el.clear()
+    return strings
+
+
+def _cell_value(cell, shared):
+    kind = cell.get('t')
+    if kind == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{NS}t'))
+    v = cell.find(f'{NS}v')
+    if v is None or v.text is None:
+        return None
+    if kind == 's':
+        return shared[int(v.text)]
+    if kind == 'str':
+        return v.text
+    if kind == 'e':
+        return None
+    if kind == 'b':
+        return v.text == '1'
+    number = float(v.text)
+    return int(number) if number.is_integer() else number
+
+
+def iter_xlsx_rows(path):
+    """첫 번째 시트의 행을 하나씩 (값 목록, 빈 칸은 None)"""
+    with zipfile.ZipFile(path) as zf:
+        shared = _shared_strings(zf)
+        with zf.open(_first_sheet_path(zf)) as f:
+            for _, el in ET.iterparse(f):
+                if el.tag != f'{NS}row':
+                    continue
+                values = []
+                for position, cell in enumerate(el.findall(f'{NS}c')):
+                    ref = cell.get('r')
+                    index = _column_index(ref) if ref else position
+                    values.extend([None] * (index + 1 - len(values)))
+                    values[index] = _cell_value(cell, shared)
+                el.clear()
+                yield values
+
+
+def iter_records(path):
+    """첫 행을 머리글로 하는 {머리글: 값} (빈 행은 건너뜀), (엑셀 행 번호, 레코드)"""
+    rows = iter_xlsx_rows(path)
+    header = [str(h).strip() if h is not None else '' for h in next(rows, [])]
+    for row_number, values in enumerate(rows, start=2):
+        if all(v is None or v == '' for v in values):
+            continue
+        yield row_number, dict(zip(header, values + [None] * (len(header) - len(values))))
+
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def user_from_record(record):
+    emp_id = _text(record.get('사번'))
+    position = _text(record.get('직급/직책'))
+    return {
         'id': emp_id,  # 사번을 ID로
         'password': '1234',
-        'name': name,
-        'department': dept,
-        'role': role,
+        'name': _text(record.get('이름')),
+        'department': _text(record.get('부서')),
+        'role': classify_role(position),
         'position': position,
-        'email': f'{email}@sedaily.com',
+        'email': f"{_text(record.get('이메일(@sedaily.com)'))}@sedaily.com",
         'emp_id': emp_id
-    })
-
-print(f'총 {len(users)}명 사용자')
-print(f'admin: 1명')
-manager_count = len([u for u in users if u['role'] == 'manager'])
-reporter_count = len([u for u in users if u['role'] == 'reporter'])
-print(f'manager: {manager_count}명')
-print(f'reporter: {reporter_count}명')
-
-with open('dashboard/users.json', 'w', encoding='utf-8') as f:
-    json.dump(users, f, ensure_ascii=False, indent=2)
-print('dashboard/users.json 생성 완료')
+    }
+
+
+class UsersWriter:
+    """users/ 디렉터리(웹 버킷용) + 비밀번호 파일(비공개 버킷용)을 사용자 하나씩 씀 (임시 경로에 쓰고 commit 시 교체)"""
+
+    def __init__(self, out_dir, private_dir):
+        self.dir_paths = [os.path.join(root, PREFIX.rstrip('/')) for root in (out_dir, private_dir)]
+        for path in self.dir_paths:
+            shutil.rmtree(path + '.tmp', ignore_errors=True)
+        self.count = 0
+        self.departments = {}
+        self.index = []
+
+    def _write_dir_file(self, key, obj, private=False):
+        path = os.path.join(self.dir_paths[private] + '.tmp', key[len(PREFIX):])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(dumps(obj))
+
+    def add(self, user):
+        self.count += 1
+        self._write_dir_file(user_key(user['id']), public_fields(user))
+        self._write_dir_file(credential_key(user['id']), private_fields(user), private=True)
+        self.departments.setdefault(user['department'], {})[user['id']] = public_fields(user)
+        self.index.append(index_entry(user))
+
+    def commit(self):
+        for department, members in self.departments.items():
+            self._write_dir_file(department_key(department), {'department': department, 'users': members})
+        self._write_dir_file(INDEX_KEY, {'users': self.index})
+        for path in self.dir_paths:
+            shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(path + '.tmp', exist_ok=True)
+            os.replace(path + '.tmp', path)
+
+    def discard(self):
+        for path in self.dir_paths:
+            shutil.rmtree(path + '.tmp', ignore_errors=True)
+
+
+def import_users(xlsx_path, out_dir='dashboard', strict=False, private_dir='users_private'):
+    """엑셀 → users/ 디렉터리 + 비밀번호 파일
+
+    Returns:
+        {'users': 사용자 수, 'roles': {역할: 수}, 'duplicates': [(사번, 중복 행, 사용한 행)], 'skipped': [빈 사번/이름 행]}
+    """
+    writer = UsersWriter(out_dir, private_dir)
+    roles = {'admin': 1}
+    seen = {ADMIN_USER['id']: 0}  # 사번 → 처음 나온 행 (admin 계정은 엑셀 밖)
+    duplicates = []
+    skipped = []
+    try:
+        writer.add(ADMIN_USER)
+        for row_number, record in iter_records(xlsx_path):
+            user = user_from_record(record)
+            if not user['id'] or not user['name']:
+                skipped.append(row_number)
+                continue
+            if user['id'] in seen:
+                duplicates.append((user['id'], row_number, seen[user['id']]))
+                continue
+            seen[user['id']] = row_number
+            writer.add(user)
+            roles[user['role']] = roles.get(user['role'], 0) + 1
+    except BaseException:
+        writer.discard()
+        raise
+    if strict and (duplicates or skipped):
+        writer.discard()
+    else:
+        writer.commit()
+    return {'users': writer.count, 'roles': roles, 'duplicates': duplicates, 'skipped': skipped}
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    strict = '--strict' in args
+    out_dir = 'dashboard'
+    private_dir = 'users_private'
+    if '--out' in args:
+        out_dir = args[args.index('--out') + 1]
+        del args[args.index('--out'):args.index('--out') + 2]
+    if '--private-out' in args:
+        private_dir = args[args.index('--private-out') + 1]
+        del args[args.index('--private-out'):args.index('--private-out') + 2]
+    paths = [a for a in args if not a.startswith('--')]
+    xlsx_path = paths[0] if paths else DEFAULT_XLSX
+
+    result = import_users(xlsx_path, out_dir, strict, private_dir)
+    for emp_id, row_number, first_row in result['duplicates']:
+        print(f'⚠️ 사번 중복 {emp_id}: {row_number}행 (처음 나온 {first_row}행 사용)')
+    for row_number in result['skipped']:
+        print(f'⚠️ 사번/이름 없음: {row_number}행 건너뜀')
+    if strict and (result['duplicates'] or result['skipped']):
+        print('--strict: 파일을 만들지 않음')
+        sys.exit(1)
+
+    print(f"총 {result['users']}명 사용자")
+    for role in ('admin', 'manager', 'reporter'):
+        print(f"{role}: {result['roles'].get(role, 0)}명")
+    print(f'{out_dir}/{PREFIX} (웹 버킷), {private_dir}/{PREFIX} (비공개 버킷) 생성 완료')
@@ -0,0 +1,199 @@
+// 기사 데이터 로더
+// - index.json: 요약/기자별 카운터/기간/일별 기사수 (기사 목록 없음)
+// - reporters/<기자명>.json: 기자 한 명의 기사 목록
+// - months/YYYY-MM.json: 해당 월 전체 기사
+// 분할 파일의 기사 목록은 열 단위 표 (lambda/sync_data/publish_format.py 참고)
+// 분할 파일이 아직 없으면(이전 배포) data.json 하나로 대체
+
+// 캐시 우회 JSON 조회 (실패 시 reject)
+function kpiFetchJson(path) {
+    return fetch(path + '?t=' + Date.now()).then(res => {
+        if (!res.ok) throw new Error(path + ' ' + res.status);
+        return res.json();
+    });
+}
+
+const KpiData = (() => {
+    const URL_PREFIX = 'https://www.sedaily.com/NewsView/';
+    let legacyPromise = null;
+
+    // 열 단위 표 → 기사 객체 배열 (이미 배열이면 그대로)
+    function decodeArticles(table, defaults) {
+        if (Array.isArray(table)) return table;
+        const articles = Array.from({ length: table.n }, () => Object.assign({}, defaults));
+        Object.entries(table.cols).forEach(([field, col]) => {
+            if (Array.isArray(col)) {
+                col.forEach((v, i) => { articles[i][field] = v; });
+            } else {
+                col.i.forEach((code, i) => { articles[i][field] = col.d[code]; });
+            }
+        });
+        articles.forEach(a => {
+            if ('is_auto_top' in a) a.is_auto_top = !!a.is_auto_top;
+            if (a.url === null) a.url = URL_PREFIX + a.nsid;
+        });
+        return articles;
+    }
+
+    function legacy() {
+        if (!legacyPromise) legacyPromise = kpiFetchJson('data.json');
+        return legacyPromise;
+    }
+
+    function indexFromLegacy(data) {
+        const nsids = new Set();
+        const daily = {};
+        const months = new Set();
+        data.reporters.forEach(r => r.articles.forEach(a => {
+            if (a.nsid) nsids.add(a.nsid);
+            const ident = a.nsid || a.url;
+            if (a.pub_date && ident) (daily[a.pub_date] = daily[a.pub_date] || new Set()).add(ident);
+            if (a.pub_date) months.add(a.pub_date.slice(0, 7));
+        }));
+        const dailyCounts = {};
+        Object.keys(daily).forEach(d => { dailyCounts[d] = daily[d].size; });
+        return {
+            last_sync: data.last_sync,
+            period_start: data.period_start,
+            period_end: data.period_end,
+            total_articles: data.total_articles,
+            total_reporters: data.total_reporters,
+            unique_articles: nsids.size,
+            daily_counts: dailyCounts,
+            months: [...months].sort(),
+            reporters: data.reporters.map(({ articles, ...counters }) => counters)
+        };
+    }
+
+    return {
+        // 요약 + 기자별 카운터
+        index() {
+            return kpiFetchJson('index.json').catch(() => legacy().then(indexFromLegacy));
+        },
+        // 기자 한 명 (없으면 null)
+        reporter(name) {
+            return kpiFetchJson('reporters/' + encodeURIComponent(name) + '.json')
+                .then(r => Object.assign(r, { articles: decodeArticles(r.articles, { reporter_name: r.name }) }))
+                .catch(() => legacy().then(data => data.reporters.find(r => r.name === name) || null));
+        },
+        // 여러 달의 기사 목록 (months: ['2026-01', ...])
+        articlesInMonths(months) {
+            return Promise.all(months.map(m => kpiFetchJson('months/' + m + '.json').then(d => decodeArticles(d.articles))))
+                .then(lists => lists.flat())
+                .catch(() => legacy().then(data => data.reporters
+                    .flatMap(r => r.articles)
+                    .filter(a => a.pub_date && months.includes(a.pub_date.slice(0, 7)))));
+        }
+    };
+})();
+
+// 평가 데이터 로더 (평가 API ?since= 변경분 조회)
+// - localStorage kpi_evaluations: {키: 평가} (조회 범위와 관계없이 하나로 합침)
+// - localStorage kpi_eval_version: {조회 범위: 버전 커서} (범위마다 따로, 다른 범위 커서로 조회하면 빠지는 평가가 생김)
+// 처음에는 since= 로 전체를 받고, 이후에는 바뀐 평가만 받아서 합침
+const KpiEvaluations = (() => {
+    const STORAGE_KEY = 'kpi_evaluations';
+    const VERSION_KEY = 'kpi_eval_version';
+    const pending = {};
+
+    function read(key) {
+        try { return JSON.parse(localStorage.getItem(key)); } catch (e) { return null; }
+    }
+
+    function write(key, value) {
+        try {
+            localStorage.setItem(key, JSON.stringify(value));
+            return true;
+        } catch (e) { return false; /* 용량 초과 등: 커서를 저장하지 않고 다음에 전체 조회 */ }
+    }
+
+    return {
+        // 평가 {키: 평가} (서버 실패 시 저장된 평가)
+        // scope: {} 전체 / { reporter: '기자명' } 기자 기사 + 직위 / { nsids: [...] } 해당 기사
+        load(apiUrl, scope = {}) {
+            const params = new URLSearchParams();
+            if (scope.reporter) params.set('reporter', scope.reporter);
+            if (scope.nsids) params.set('nsids', scope.nsids.join(','));
+            const scopeKey = params.toString() || 'all';
+            if (pending[scopeKey]) return pending[scopeKey];
+
+            const cached = read(STORAGE_KEY);
+            const versions = (cached && read(VERSION_KEY)) || {};
+            params.set('since', versions[scopeKey] || '');
+            params.set('t', Date.now());
+            pending[scopeKey] = fetch(apiUrl + '?' + params)
+                .then(res => {
+                    if (!res.ok) throw new Error('evaluations ' + res.status);
+                    return res.json();
+                })
+                .then(delta => {
+                    // 전체 범위의 전체 응답이면 교체, 나머지는 합침
+                    const base = delta.full && scopeKey === 'all' ? {} : (read(STORAGE_KEY) || {});
+                    const evaluations = Object.assign(base, delta.items);
+                    if (write(STORAGE_KEY, evaluations)) {
+                        write(VERSION_KEY, Object.assign(read(VERSION_KEY) || {}, { [scopeKey]: delta.version }));
+                    }
+                    return evaluations;
+                })
+                .catch(() => read(STORAGE_KEY) || {});
+            return pending[scopeKey];
+        }
+    };
+})();
+
+// 사용자 디렉터리 로더 (users Lambda가 게시, lambda/users_api/user_directory.py 참고)
+// - users/by-id/<id>.json: 사용자 한 명 (비밀번호 제외)
+// - users/index.json: [{id, name, department}] (부서 목록, 기자 이름 → 부서, 목록 순서 = 화면 순서)
+// - users/departments/<부서>.json: 부서 사용자 (비밀번호 제외)
+// 비밀번호는 공개 파일에 없음 → 로그인 확인은 users Lambda (첫 호출 때 이전 users.json을 디렉터리로 옮김)
+const KpiUsers = (() => {
+    let indexPromise = null;
+
+    // [{id, name, department}]
+    function index() {
+        if (!indexPromise) indexPromise = kpiFetchJson('users/index.json').then(data => data.users);
+        return indexPromise;
+    }
+
+    function inDepartment(department) {
+        return kpiFetchJson('users/departments/' + encodeURIComponent(department) + '.json')
+            .then(data => data.users);
+    }
+
+    return {
+        // 로그인 확인 → 사용자 (비밀번호 제외, 틀리면 null)
+        login(apiUrl, id, password) {
+            return fetch(apiUrl, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ login: { id, password } })
+            }).then(res => res.json()).then(result => result.success ? result.user : null);
+        },
+        // 부서 목록 ('전체' 제외, 이름순)
+        departments() {
+            return index().then(idx => [...new Set(idx.map(u => u.department))]
+                .filter(d => d && d !== '전체').sort());
+        },
+        // 기자 이름 → 부서 (department를 주면 해당 부서 사용자만, 같은 이름이면 먼저 나온 사용자)
+        departmentByName(department) {
+            const source = department
+                ? inDepartment(department).then(users => Object.values(users))
+                : index();
+            return source.then(users => {
+                const result = {};
+                users.forEach(u => { if (!(u.name in result)) result[u.name] = u.department; });
+                return result;
+            });
+        },
+        // 전체 사용자 (비밀번호 제외, index.json 순서)
+        all() {
+            return index().then(idx => {
+                const departments = [...new Set(idx.map(u => u.department))];
+                return Promise.all(departments.map(inDepartment)).then(lists => {
+                    const members = Object.assign({}, ...lists);
+                    return idx.filter(u => u.id in members).map(u => members[u.id]);
+                });
+            });
+        }
+    };
+})();
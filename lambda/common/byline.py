@@ -0,0 +1,66 @@
+"""
+바이라인(기자명) 파싱 엔진 (공용)
+- 정규식은 모듈 로드 시 한 번만 컴파일
+- 지역명은 frozenset으로 조회
+- 같은 바이라인이 수천 번 반복되므로 author 문자열 단위로 LRU 캐시
+
+'김태호 기자(email)'                      → ['김태호']
+'라스베이거스=김태호·송종호 특파원'         → ['김태호', '송종호']
+'변수연 기자,워싱턴=이태규 특파원'          → ['변수연', '이태규']
+"""
+import re
+from functools import lru_cache
+
+# 괄호 안 내용: (글·사진), (사진), (영상), (email) 등
+PAREN_RE = re.compile(r'\([^)]*\)')
+# 지역=이름 형식의 '지역=' 부분 (라스베이거스=김태호 → 김태호)
+LOCATION_PREFIX_RE = re.compile(r'[가-힣a-zA-Z0-9]+\s*=\s*')
+EMAIL_RE = re.compile(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+')
+TITLE_RE = re.compile(r'\s*(기자|특파원|선임기자|수석기자|차장|부장|국장|위원|대기자|논설위원|객원기자|통신원)\s*')
+# 구분자: ·, ',', /, 와, 및
+SEPARATOR_RE = re.compile(r'[·,/]|\s+와\s+|\s+및\s+')
+NAME_RE = re.compile(r'[가-힣]{2,4}')
+
+# 이름 자리에 단독으로 오면 제외하는 지역명
+LOCATION_NAMES = frozenset([
+    '베이징', '뉴욕', '워싱턴', '도쿄', '상하이', '라스베이거스', '홍콩', '런던', '파리',
+    '서울', '부산', '대구', '광주', '대전', '인천', '세종'
+])
+# 이름 앞부분으로 잘려 나와도 제외하는 해외 지역명
+FOREIGN_LOCATION_NAMES = frozenset([
+    '베이징', '뉴욕', '워싱턴', '도쿄', '상하이', '라스베이거스', '홍콩', '런던', '파리'
+])
+
+
+@lru_cache(maxsize=8192)
+def parse_byline(author_str):
+    """바이라인 → 기자명 튜플 (캐시용, 불변)"""
+    if not author_str:
+        return ('',)
+    author_str = PAREN_RE.sub('', author_str)
+    author_str = LOCATION_PREFIX_RE.sub('', author_str)
+    author_str = EMAIL_RE.sub('', author_str)
+    author_str = TITLE_RE.sub(' ', author_str)
+
+    result = []
+    for name in SEPARATOR_RE.split(author_str):
+        name = name.strip()
+        if name in LOCATION_NAMES:
+            continue
+        # 한글 이름 2~4자 (이름 뒤에 다른 문자가 붙은 경우 앞부분만)
+        match = NAME_RE.match(name)
+        if not match:
+            continue
+        if match.end() == len(name) or match.group() not in FOREIGN_LOCATION_NAMES:
+            result.append(match.group())
+    return tuple(result) if result else ('',)
+
+
+def extract_reporters(author_str):
+    """공동 기자 분리 → 기자명 리스트 (없으면 [''])"""
+    return list(parse_byline(author_str))
+
+
+def extract_reporter_name(author_str):
+    """대표 기자명 (첫 번째 기자)"""
+    return parse_byline(author_str)[0]
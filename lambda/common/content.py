@@ -0,0 +1,49 @@
+"""
+기사 본문 정리 + 글자수 계산 (공용)
+기존: html.unescape → 태그 제거 re.sub → 공백 정리 re.sub → replace(' ', '') → len
+      (본문 전체 복사본이 여러 번 생김)
+여기서는 split() 한 번으로 공백 정리와 글자수(공백 제외)를 같이 구하고,
+글자수만 필요한 경우(count_chars)에는 정리된 문자열 자체를 만들지 않음
+"""
+import html
+import re
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _nonspace_len(text):
+    """공백(유니코드 공백 포함) 제외 글자수"""
+    return sum(map(len, text.split()))
+
+
+def normalize_content(content_str):
+    """HTML 태그 제거하고 공백 정리한 본문 + 글자수(공백 제외)
+
+    Returns:
+        (clean_text, char_count)
+    """
+    if not content_str:
+        return '', 0
+    text = html.unescape(content_str)
+    if '<' in text:
+        text = TAG_RE.sub('', text)
+    words = text.split()
+    return ' '.join(words), sum(map(len, words))
+
+
+def count_chars(content_str):
+    """글자수만 계산 (normalize_content의 char_count와 동일, 정리된 본문은 만들지 않음)"""
+    if not content_str:
+        return 0
+    text = html.unescape(content_str)
+    count = _nonspace_len(text)
+    if '<' in text:
+        # 태그 안 글자는 빼기 (태그 제거 후 세는 것과 같음)
+        for match in TAG_RE.finditer(text):
+            count -= _nonspace_len(match.group())
+    return count
+
+
+def clean_content(content_str):
+    """HTML 태그 제거하고 순수 텍스트만"""
+    return normalize_content(content_str)[0]
@@ -0,0 +1,76 @@
+"""
+CloudFront 무효화 모아 보내기 (공용)
+- mark(): 바뀐 S3 키를 기록만 함 (저장할 때마다 create_invalidation을 부르지 않음)
+- flush(): 모인 경로를 무효화 요청 1건으로 (작업 묶음이 끝날 때 한 번)
+  폴더 안 파일(reporters/, months/ 등)은 폴더 와일드카드 하나로, 경로가 많으면 '/*'
+- Cache-Control에 no-cache/no-store가 있는 파일은 기록하지 않음
+  (배포의 캐시 정책 CachingOptimized는 MinTTL 1초 → 이런 파일은 CloudFront에 1초 넘게 남지 않으므로 무효화 불필요)
+- 무효화 실패 시 경로를 남겨 두고 다음 flush에서 다시 보냄
+"""
+import uuid
+from datetime import datetime, timezone, timedelta
+
+KST = timezone(timedelta(hours=9))
+# 와일드카드 경로는 동시에 15개까지 진행 가능 → 넘으면 전체('/*') 한 건으로
+MAX_PATHS = 15
+NO_CACHE_DIRECTIVES = ('no-cache', 'no-store')
+
+
+def is_uncached(cache_control):
+    """CloudFront가 (MinTTL 이상) 캐시하지 않는 헤더인지"""
+    value = (cache_control or '').lower()
+    return any(d in value for d in NO_CACHE_DIRECTIVES)
+
+
+def invalidation_paths(keys):
+    """S3 키 → CloudFront 무효화 경로 (폴더 안 파일은 폴더 단위 와일드카드)"""
+    paths = set()
+    for key in keys:
+        folder, _, _ = key.rpartition('/')
+        paths.add(f'/{folder}/*' if folder else f'/{key}')
+    paths = sorted(paths)
+    return ['/*'] if len(paths) > MAX_PATHS else paths
+
+
+class InvalidationBatch:
+    """무효화할 키를 모았다가 한 번에 요청"""
+
+    def __init__(self, cloudfront, distribution_id, prefix='kpi'):
+        self.cloudfront = cloudfront
+        self.distribution_id = distribution_id
+        self.prefix = prefix
+        self.keys = set()
+
+    def mark(self, key, cache_control=None):
+        """바뀐 키 기록 (캐시되지 않는 파일이면 건너뜀)
+
+        Returns:
+            기록했으면 True
+        """
+        if is_uncached(cache_control):
+            return False
+        self.keys.add(key.lstrip('/'))
+        return True
+
+    def flush(self):
+        """모인 키를 무효화 요청 1건으로 보내기
+
+        Returns:
+            무효화한 경로 목록 (보낼 것이 없거나 실패하면 [])
+        """
+        if not self.keys:
+            return []
+        paths = invalidation_paths(self.keys)
+        try:
+            self.cloudfront.create_invalidation(
+                DistributionId=self.distribution_id,
+                InvalidationBatch={
+                    'Paths': {'Quantity': len(paths), 'Items': paths},
+                    'CallerReference': f'{self.prefix}-{datetime.now(KST).strftime("%Y%m%d%H%M%S")}-{uuid.uuid4().hex[:8]}'
+                }
+            )
+        except Exception as e:
+            print(f'CloudFront invalidation failed: {e}')
+            return []
+        self.keys.clear()
+        return paths
@@ -0,0 +1,31 @@
+"""
+신문 발행일(입력일자) 계산 (공용)
+새 형식(<article>) XML은 pubDate(입력 시각)만 있으므로 발행일 규칙을 적용
+- 오전 5시 이후 기사는 다음날 신문
+- 일요일은 신문 없음 → 월요일로 이동
+동기화 Lambda(data.json)와 xml_parser(SQLite)가 같은 날짜에 기사를 두도록 같은 함수 사용
+"""
+from datetime import datetime, timedelta
+
+
+def paper_date_from_pubdate(pub_date_str, date):
+    """새 형식 pubDate → 입력일자(신문 발행일 'YYYY-MM-DD'), pub_time
+
+    Args:
+        pub_date_str: 'YYYY-MM-DD HH:MM:SS' (시각이 없거나 형식이 다르면 XML 파일 날짜 사용)
+        date: XML 파일 날짜 'YYYYMMDD'
+    """
+    file_date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
+    if not pub_date_str or ' ' not in pub_date_str:
+        return file_date, ''
+    pub_time = pub_date_str.split(' ')[1]
+    try:
+        dt = datetime.strptime(pub_date_str, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return file_date, pub_time
+    # 오전 5시 이전이면 당일 신문, 오전 5시 이후면 다음날 신문
+    paper_date = dt if dt.hour < 5 else dt + timedelta(days=1)
+    # 일요일(6)이면 월요일로 이동
+    if paper_date.weekday() == 6:  # Sunday
+        paper_date = paper_date + timedelta(days=1)
+    return paper_date.strftime('%Y-%m-%d'), pub_time
@@ -0,0 +1,68 @@
+"""
+S3 JSON 객체 조건부 읽기-수정-쓰기 (공용)
+- 읽을 때 ETag를 받아 두고 IfMatch=ETag로 업로드 (새 객체는 IfNoneMatch='*')
+- 그 사이 다른 요청이 먼저 고쳤으면(412/409) 다시 읽어서 수정 후 재시도
+  → 동시에 저장해도 서로의 변경을 덮어쓰지 않음
+"""
+import json
+import time
+import random
+
+MAX_RETRIES = 8
+# 충돌 재시도 대기 (초, 지수 증가 + 무작위)
+RETRY_BASE_DELAY = 0.05
+
+CONFLICT_CODES = frozenset(['PreconditionFailed', 'ConditionalRequestConflict', '412', '409'])
+
+
+class ConflictError(Exception):
+    """재시도를 다 써도 조건부 업로드가 계속 충돌"""
+
+
+def _error_code(e):
+    return getattr(e, 'response', {}).get('Error', {}).get('Code')
+
+
+def read_json(s3, bucket, key):
+    """(내용, ETag), 없으면 (None, None)"""
+    try:
+        response = s3.get_object(Bucket=bucket, Key=key)
+    except s3.exceptions.NoSuchKey:
+        return None, None
+    return json.loads(response['Body'].read().decode('utf-8')), response['ETag']
+
+
+def dumps(obj):
+    """공백 없는 JSON (UTF-8 bytes)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def update_json(s3, bucket, key, update, **put_args):
+    """key의 JSON을 update(현재 내용 또는 None) 결과로 교체 (조건부 업로드 + 충돌 시 재시도)
+
+    update는 충돌이 나면 다시 불리므로 현재 내용만 보고 새 내용을 만들어야 함
+
+    Returns:
+        충돌로 다시 시도한 횟수
+    """
+    for attempt in range(MAX_RETRIES):
+        current, etag = read_json(s3, bucket, key)
+        condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+        try:
+            s3.put_object(
+                Bucket=bucket,
+                Key=key,
+                Body=dumps(update(current)),
+                ContentType='application/json; charset=utf-8',
+                **condition,
+                **put_args
+            )
+            return attempt
+        except s3.exceptions.NoSuchKey:
+            # 읽은 뒤 객체가 지워진 경우 (IfMatch) → 다시 읽어서 재시도
+            pass
+        except Exception as e:
+            if _error_code(e) not in CONFLICT_CODES:
+                raise
+        time.sleep(RETRY_BASE_DELAY * (2 ** attempt) * random.random())
+    raise ConflictError(f'{key}: 동시 저장 충돌 {MAX_RETRIES}회')
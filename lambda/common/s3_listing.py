@@ -0,0 +1,84 @@
+"""
+S3 daily-xml 목록 조회 (공용)
+- list_objects_v2 페이지네이션 (1,000건 초과 목록도 누락 없이)
+- 날짜 범위: 공통 접두어(daily-xml/2026, daily-xml/202601) + StartAfter로 필요한 구간만 조회
+- 결과는 (date, key, etag, size) 를 하나씩 돌려주는 이터레이터
+"""
+import re
+from collections import namedtuple
+from datetime import date as date_cls
+
+XmlObject = namedtuple('XmlObject', ['date', 'key', 'etag', 'size'])
+
+DATE_KEY_RE = re.compile(r'(\d{8})\.xml$')
+
+
+def shard_prefix(prefix, start_date=None, end_date=None):
+    """시작/종료일의 공통 앞자리로 조회 접두어 좁히기
+    ('daily-xml/', '20260105', '20260120') → 'daily-xml/202601'
+    """
+    if not start_date or not end_date:
+        return prefix
+    common = 0
+    while common < 8 and start_date[common] == end_date[common]:
+        common += 1
+    return prefix + start_date[:common]
+
+
+def iter_xml_objects(s3, bucket, prefix='daily-xml/', start_date=None, end_date=None, page_size=1000):
+    """daily-xml 객체를 키 순서(=날짜 순서)로 하나씩 반환
+
+    Args:
+        start_date, end_date: 'YYYYMMDD' (포함 범위, 생략 가능)
+    """
+    params = {
+        'Bucket': bucket,
+        'Prefix': shard_prefix(prefix, start_date, end_date),
+        'MaxKeys': page_size
+    }
+    if start_date:
+        # 'daily-xml/20260105' 다음 키부터 → daily-xml/20260105.xml 포함
+        params['StartAfter'] = prefix + start_date
+
+    while True:
+        response = s3.list_objects_v2(**params)
+        for obj in response.get('Contents', []):
+            match = DATE_KEY_RE.search(obj['Key'])
+            if not match:
+                continue
+            date_str = match.group(1)
+            if start_date and date_str < start_date:
+                continue
+            if end_date and date_str > end_date:
+                # 키가 날짜순이므로 이후 페이지는 볼 필요 없음
+                return
+            yield XmlObject(date_str, obj['Key'], obj.get('ETag', '').strip('"'), obj.get('Size', 0))
+
+        if not response.get('IsTruncated'):
+            return
+        params['ContinuationToken'] = response['NextContinuationToken']
+        params.pop('StartAfter', None)
+
+
+def iter_month_prefixes(today=None, max_months=24):
+    """이번 달부터 과거로 'YYYYMM' 접두어"""
+    today = today or date_cls.today()
+    year, month = today.year, today.month
+    for _ in range(max_months):
+        yield f'{year}{month:02d}'
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+
+
+def latest_xml_objects(s3, bucket, count, prefix='daily-xml/', today=None, max_months=24):
+    """최근 count개 날짜의 XML 객체 (최신순)
+    전체 목록 대신 월 단위 접두어(daily-xml/202601)를 최신 달부터 조회
+    """
+    result = []
+    for month in iter_month_prefixes(today, max_months):
+        objects = list(iter_xml_objects(s3, bucket, prefix=prefix + month))
+        result.extend(reversed(objects))
+        if len(result) >= count:
+            break
+    return result[:count]
@@ -0,0 +1,116 @@
+"""
+XML 스트리밍 파서 (공용)
+iterparse로 기사 요소를 하나씩 읽고, 처리한 요소는 바로 트리에서 제거해
+파일 크기와 무관하게 메모리 사용량을 일정하게 유지
+
+두 가지 형식을 한 번에 처리:
+- 기존 형식: <items><item type="text"> ... <paper><editingInfo><paperNumber>
+- 새 형식:   <articles><article> ... <pageNumber>
+"""
+import io
+import re
+import xml.etree.ElementTree as ET
+
+RECORD_TAGS = ('item', 'article')
+# 앞 공백 뒤 '<'로 시작하면 경로가 아니라 XML 문자열
+XML_TEXT_RE = re.compile(r'\s*<')
+
+
+def _page_number(value):
+    return int(value) if value and value.isdigit() else 0
+
+
+def _item_record(item):
+    """<item type="text"> → 기사 레코드 (text 타입 아니면 None)"""
+    if item.get('type') != 'text':
+        return None
+
+    paper_number = 0
+    paper_position = ''
+    paper_paragraph = ''
+    publish_date = ''
+    paper = item.find('paper')
+    if paper is not None:
+        editing = paper.find('editingInfo')
+        if editing is not None:
+            paper_number = _page_number(editing.findtext('paperNumber', '0'))
+            paper_position = editing.findtext('position', '') or ''
+            paper_paragraph = editing.findtext('paragraph', '') or ''
+        publish_info = paper.find('publishInfo')
+        if publish_info is not None:
+            publish_date = publish_info.findtext('date', '') or ''
+
+    url_elem = item.find('url')
+    category_elem = item.find('category')
+
+    return {
+        'format': 'item',
+        'nsid': item.findtext('nsid', ''),
+        'title': item.findtext('title', ''),
+        'author': item.findtext('author', ''),
+        'content': item.findtext('content', ''),
+        'url': url_elem.get('href', '') if url_elem is not None else '',
+        'date': item.findtext('date', ''),
+        'time': item.findtext('time', ''),
+        'pub_datetime': '',
+        'publish_date': publish_date,
+        'paper_number': paper_number,
+        'paper_position': paper_position,
+        'paper_paragraph': paper_paragraph,
+        'category': category_elem.get('name', '') if category_elem is not None else ''
+    }
+
+
+def _article_record(article):
+    """<article> → 기사 레코드"""
+    link = article.findtext('link', '')
+    pub_datetime = article.findtext('pubDate', '')
+    date, _, time = pub_datetime.partition(' ')
+
+    return {
+        'format': 'article',
+        'nsid': link.split('/')[-1] if link else '',
+        'title': article.findtext('title', ''),
+        'author': article.findtext('writer', ''),
+        'content': article.findtext('content', ''),
+        'url': link,
+        'date': date if time else '',
+        'time': time,
+        'pub_datetime': pub_datetime,
+        'publish_date': '',
+        'paper_number': _page_number(article.findtext('pageNumber', '0')),
+        'paper_position': '',
+        'paper_paragraph': '',
+        'category': ''
+    }
+
+
+def iter_records(source):
+    """XML에서 기사 레코드를 문서 순서대로 하나씩 반환
+
+    Args:
+        source: 파일 경로 또는 바이너리 파일 객체(S3 StreamingBody 포함, 읽는 만큼만 메모리에)
+                bytes / XML 문자열은 고정 데이터(테스트·점검 스크립트)용 (전체가 메모리에 있음)
+    """
+    if isinstance(source, str) and XML_TEXT_RE.match(source):
+        source = io.BytesIO(source.encode('utf-8'))
+    elif isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    parents = []
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag not in RECORD_TAGS:
+            continue
+
+        record = _item_record(elem) if elem.tag == 'item' else _article_record(elem)
+        if record is not None:
+            yield record
+
+        # 처리 끝난 요소는 부모에서 떼어내 트리가 커지지 않게
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
@@ -0,0 +1,136 @@
+"""
+평가 저장소 (S3, 키 해시로 분할)
+- evaluations/shard-XX.json 에 {키: 평가} 저장 (키 = nsid 또는 position_<기자명>)
+- 저장은 해당 키가 속한 분할 파일만 읽고 고쳐 씀 (전체 파일 재작성 없음)
+- 조건부 업로드(IfMatch=읽을 때 ETag, 새 파일은 IfNoneMatch='*')로 동시 저장 충돌 감지
+  → 충돌(412/409)이면 다시 읽어서 병합 후 재시도 (다른 사람이 저장한 키는 유지)
+- 이전 evaluations.json 은 읽기 전용: 분할 파일을 처음 만들 때 해당 분할 몫을 옮겨 담음
+  (분할 파일이 아직 없는 몫만 조회 시 evaluations.json 에서 읽음)
+- 변경분 조회: 분할 파일마다 저장할 때마다 1씩 오르는 version, 키마다 마지막으로 바뀐 version 기록
+  버전 커서 = 분할별 version을 '.'으로 이은 문자열 → 커서 이후 바뀐 키만 반환
+  범위 조회(keys)에서 읽지 않은 분할은 -1 (나중에 범위가 넓어져 처음 읽을 때 전체를 돌려줌)
+  (분할 파일은 조건부 업로드로 한 번에 하나씩만 바뀌므로 분할 안에서 version이 빠지거나 겹치지 않음)
+
+분할 파일 형식: {"version": n, "items": {키: 평가}, "versions": {키: 바뀐 version}}
+
+SHARD_COUNT는 저장된 데이터가 있으면 바꾸지 말 것 (키 → 분할 파일 위치가 달라짐)
+"""
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from s3_json import ConflictError, read_json, update_json
+
+SHARD_PREFIX = 'evaluations/shard-'
+SHARD_COUNT = 16
+LEGACY_KEY = 'evaluations.json'
+# 커서에서 아직 읽지 않은 분할 (version 0인 이전 evaluations.json 몫까지 전부 반환)
+UNREAD_VERSION = -1
+
+
+def shard_of(key):
+    """키 → 분할 번호 (프로세스와 무관하게 고정)"""
+    return zlib.crc32(key.encode('utf-8')) % SHARD_COUNT
+
+
+def shard_key(shard):
+    return f'{SHARD_PREFIX}{shard:02d}.json'
+
+
+def _legacy_part(legacy, shard):
+    """이전 evaluations.json 중 해당 분할 몫 (version 0)"""
+    items = {k: v for k, v in (legacy or {}).items() if shard_of(k) == shard}
+    return {'version': 0, 'items': items, 'versions': {}}
+
+
+def _normalize_shard(data):
+    if data is not None and 'items' not in data:
+        # version 기록 전 형식 ({키: 평가})
+        data = {'version': 0, 'items': data, 'versions': {}}
+    return data
+
+
+def _read_shard(s3, bucket, shard):
+    """분할 내용, 없으면 None"""
+    return _normalize_shard(read_json(s3, bucket, shard_key(shard))[0])
+
+
+def _update_shard(s3, bucket, shard, updates):
+    """분할 파일 하나에 updates 병합 (조건부 업로드 + 충돌 시 재시도)
+
+    Returns:
+        충돌로 다시 시도한 횟수
+    """
+    def merge(current):
+        current = _normalize_shard(current)
+        if current is None:
+            current = _legacy_part(read_json(s3, bucket, LEGACY_KEY)[0], shard)
+        current['version'] += 1
+        current['items'].update(updates)
+        current['versions'].update(dict.fromkeys(updates, current['version']))
+        return current
+
+    return update_json(s3, bucket, shard_key(shard), merge,
+                       CacheControl='no-cache, no-store, must-revalidate')
+
+
+def save(s3, bucket, data):
+    """{키: 평가} 저장 (키 단위로 덮어씀, 이전 evaluations.json의 update와 같은 규칙)
+
+    Returns:
+        {'saved': 저장한 키 수, 'shards': 고친 분할 파일 수, 'retries': 충돌 재시도 수}
+    """
+    by_shard = {}
+    for k, v in data.items():
+        by_shard.setdefault(shard_of(k), {})[k] = v
+    retries = sum(_update_shard(s3, bucket, shard, updates) for shard, updates in sorted(by_shard.items()))
+    return {'saved': len(data), 'shards': len(by_shard), 'retries': retries}
+
+
+def parse_version(cursor):
+    """버전 커서 → 분할별 version 목록 (없거나 형식이 다르면 None = 전체)"""
+    parts = (cursor or '').split('.')
+    if len(parts) != SHARD_COUNT or not all(p.isdigit() or p == str(UNREAD_VERSION) for p in parts):
+        return None
+    return [int(p) for p in parts]
+
+
+def load_changes(s3, bucket, since=None, keys=None, workers=8):
+    """커서 이후 바뀐 평가 (keys를 주면 해당 키만)
+
+    Args:
+        since: 이전 응답의 version (없으면 전체)
+        keys: 조회할 키 목록 (nsid, position_<기자명>), 없으면 전체 키
+
+    Returns:
+        {'version': 새 커서, 'full': since 없이 전체를 돌려줬는지, 'items': {키: 평가}}
+    """
+    base = parse_version(since)
+    keys = set(keys) if keys is not None else None
+    if keys is None:
+        shards = list(range(SHARD_COUNT))
+    else:
+        shards = sorted({shard_of(k) for k in keys})
+    # 읽지 않는 분할은 이전 커서 값 그대로 (since 없으면 UNREAD_VERSION)
+    versions = list(base) if base else [UNREAD_VERSION] * SHARD_COUNT
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loaded = dict(zip(shards, executor.map(lambda s: _read_shard(s3, bucket, s), shards)))
+    if any(data is None for data in loaded.values()):
+        # 아직 분할 파일이 없는 몫은 이전 evaluations.json 에서
+        legacy, _ = read_json(s3, bucket, LEGACY_KEY)
+        loaded = {s: data if data is not None else _legacy_part(legacy, s) for s, data in loaded.items()}
+
+    items = {}
+    for shard, data in loaded.items():
+        # 커서가 분할 version보다 크면(분할 파일이 새로 만들어진 경우 등) 전체
+        after = base[shard] if base and base[shard] <= data['version'] else UNREAD_VERSION
+        for k, v in data['items'].items():
+            if (keys is None or k in keys) and data['versions'].get(k, 0) > after:
+                items[k] = v
+        versions[shard] = data['version']
+    return {'version': '.'.join(map(str, versions)), 'full': base is None, 'items': items}
+
+
+def load_all(s3, bucket):
+    """전체 평가 {키: 평가}"""
+    return load_changes(s3, bucket)['items']
@@ -1,18 +1,43 @@
 """
 Lambda: 평가 데이터 저장/불러오기 API
-- GET: S3에서 evaluations.json 불러오기
-- POST: S3에 evaluations.json 저장
+- GET: S3 평가 분할 파일(evaluations/shard-XX.json) 전체 불러오기 ({키: 평가})
+- GET ?since=<version>: 해당 버전 이후 바뀐 평가만 → {"version", "full", "items"}
+  (since 없이 ?since= 로 부르면 전체 + 현재 version, 다음 조회부터 그 version 사용)
+- GET ?reporter=<기자명> / ?nsids=a,b,c: 해당 기자 기사(+직위) / 해당 기사 평가만 (since와 함께 사용 가능)
+- POST: 보낸 키가 속한 분할 파일만 조건부 업로드로 저장 (evaluation_store.py 참고)
 """
 import boto3
+import os
+import sys
+import gzip
 import json
-from datetime import datetime, timezone, timedelta
+
+# 공용 모듈 (배포 zip에는 lambda/common/*.py 를 함께 포함)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+import evaluation_store
 
 s3 = boto3.client('s3')
-cloudfront = boto3.client('cloudfront')
 BUCKET = 'kpi.sedaily.ai'
-KEY = 'evaluations.json'
-CLOUDFRONT_DIST_ID = 'E1DJQD9MHS4VRO'
-KST = timezone(timedelta(hours=9))
+# 동기화 Lambda가 게시하는 기자별 기사 파일 (reporter 조회 범위)
+REPORTER_PREFIX = 'reporters/'
+
+
+def reporter_keys(name):
+    """기자 한 명의 평가 키: 게시된 reporters/<기자명>.json 의 nsid + position_<기자명>"""
+    keys = {'position_' + name}
+    try:
+        response = s3.get_object(Bucket=BUCKET, Key=f'{REPORTER_PREFIX}{name}.json')
+    except s3.exceptions.NoSuchKey:
+        return keys
+    body = response['Body'].read()
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    articles = json.loads(body.decode('utf-8'))['articles']
+    # 열 단위 표(publish_format.py)면 nsid 열, 이전 형식이면 기사 목록
+    nsids = articles['cols']['nsid'] if isinstance(articles, dict) else [a.get('nsid') for a in articles]
+    keys.update(n for n in nsids if n)
+    return keys
+
 
 def lambda_handler(event, context):
     method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
@@ -29,19 +54,22 @@ def lambda_handler(event, context):
     # GET: 평가 데이터 불러오기
     if method == 'GET':
         try:
-            response = s3.get_object(Bucket=BUCKET, Key=KEY)
-            data = json.loads(response['Body'].read().decode('utf-8'))
+            params = event.get('queryStringParameters') or {}
+            if 'since' in params or 'reporter' in params or 'nsids' in params:
+                keys = None
+                if params.get('reporter'):
+                    keys = reporter_keys(params['reporter'])
+                if params.get('nsids'):
+                    nsids = {n for n in params['nsids'].split(',') if n}
+                    keys = nsids if keys is None else keys & nsids
+                data = evaluation_store.load_changes(s3, BUCKET, since=params.get('since'), keys=keys)
+            else:
+                data = evaluation_store.load_all(s3, BUCKET)
             return {
                 'statusCode': 200,
                 'headers': headers,
                 'body': json.dumps(data, ensure_ascii=False)
             }
-        except s3.exceptions.NoSuchKey:
-            return {
-                'statusCode': 200,
-                'headers': headers,
-                'body': json.dumps({}, ensure_ascii=False)
-            }
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -58,41 +86,19 @@ def lambda_handler(event, context):
             else:
                 data = body
             
-            # 기존 데이터 불러오기
-            try:
-                response = s3.get_object(Bucket=BUCKET, Key=KEY)
-                existing = json.loads(response['Body'].read().decode('utf-8'))
-            except:
-                existing = {}
-            
-            # 새 데이터 병합
-            existing.update(data)
-            
-            # S3에 저장
-            s3.put_object(
-                Bucket=BUCKET,
-                Key=KEY,
-                Body=json.dumps(existing, ensure_ascii=False, indent=2),
-                ContentType='application/json; charset=utf-8',
-                CacheControl='no-cache, no-store, must-revalidate'
-            )
-            
-            # CloudFront 캐시 무효화
-            try:
-                cloudfront.create_invalidation(
-                    DistributionId=CLOUDFRONT_DIST_ID,
-                    InvalidationBatch={
-                        'Paths': {'Quantity': 1, 'Items': ['/evaluations.json']},
-                        'CallerReference': f'eval-{datetime.now(KST).strftime("%Y%m%d%H%M%S")}'
-                    }
-                )
-            except:
-                pass
+            # 보낸 키가 속한 분할 파일만 병합 저장 (동시 저장 충돌 시 재시도)
+            result = evaluation_store.save(s3, BUCKET, data)
             
             return {
                 'statusCode': 200,
                 'headers': headers,
-                'body': json.dumps({'success': True, 'saved': len(data)}, ensure_ascii=False)
+                'body': json.dumps({'success': True, **result}, ensure_ascii=False)
+            }
+        except evaluation_store.ConflictError as e:
+            return {
+                'statusCode': 409,
+                'headers': headers,
+                'body': json.dumps({'error': str(e)}, ensure_ascii=False)
             }
         except Exception as e:
             return {
@@ -1,15 +1,29 @@
 """
 Lambda: S3 XML에서 data.json 생성 및 업로드
-API Gateway로 호출하면 최신 XML 가져와서 data.json 갱신
+API Gateway로 호출하면 최신 XML 가져와서 index.json + 기자별/월별 분할 파일(+ data.json) 갱신
+- 기본(incremental): 변경된 XML만 파싱, 나머지는 parsed-daily/ 캐시 사용
+- ?mode=full: 전체 XML 재파싱
+- ?start=YYYYMMDD&end=YYYYMMDD: 해당 구간 XML만 다시 파싱 (나머지 날짜는 캐시, 게시 파일은 항상 전체 기간)
 """
 import boto3
-import re
+import os
+import sys
 import json
 import html
-import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
+# 공용 모듈 (배포 zip에는 lambda/common/*.py 를 함께 포함)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from s3_listing import iter_xml_objects
+from xml_stream import iter_records
+from byline import extract_reporters
+from content import count_chars
+from paper_date import paper_date_from_pubdate
+from invalidation import InvalidationBatch
+from publish_format import ARTICLE_FIELDS, COLUMN_FIELDS, encode_articles, dumps, gzip_bytes, content_hash
+
 s3 = boto3.client('s3')
 cloudfront = boto3.client('cloudfront')
 XML_BUCKET = 'sedaily-news-xml-storage'
@@ -17,288 +31,414 @@ WEB_BUCKET = 'kpi.sedaily.ai'
 CLOUDFRONT_DIST_ID = 'E1DJQD9MHS4VRO'
 KST = timezone(timedelta(hours=9))
 
-def clean_content(content_str):
-    if not content_str:
-        return ''
-    text = html.unescape(content_str)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+# 날짜별 파싱 캐시 (extract_reporters/count_chars 적용 완료된 기사 목록)
+CACHE_BUCKET = XML_BUCKET
+CACHE_PREFIX = 'parsed-daily/'
+# 캐시 기사 형식 버전 (2: 기사 1건 = 1개, 공동 기자는 reporters 목록)
+CACHE_VERSION = 2
 
-def extract_reporters(author_str):
-    if not author_str:
-        return ['']
-    # 괄호 안 내용 제거 (글·사진), (사진), (영상) 등
-    author_str = re.sub(r'\([^)]*\)', '', author_str)
-    # 지역=이름 형식 처리 (라스베이거스=김태호, 베이징=송종호 → 김태호, 송종호)
-    # 지역명 제거하고 이름만 남김
-    author_str = re.sub(r'[가-힣a-zA-Z0-9]+\s*=\s*', '', author_str)
-    # 이메일 제거
-    author_str = re.sub(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+', '', author_str)
-    # 직함 제거
-    author_str = re.sub(r'\s*(기자|특파원|선임기자|수석기자|차장|부장|국장|위원|대기자|논설위원|객원기자|통신원)\s*', ' ', author_str)
-    # 구분자로 분리 (·, ,, /, ·, 와, 및)
-    names = re.split(r'[·,/·]|\s+와\s+|\s+및\s+', author_str)
-    result = []
-    for name in names:
-        name = name.strip()
-        # 한글 이름 2~4자 추출 (지역명 등 제외)
-        # 지역명 패턴 제외: 베이징, 뉴욕, 워싱턴, 도쿄, 상하이, 라스베이거스 등
-        if name in ['베이징', '뉴욕', '워싱턴', '도쿄', '상하이', '라스베이거스', '홍콩', '런던', '파리', '서울', '부산', '대구', '광주', '대전', '인천', '세종']:
-            continue
-        match = re.match(r'^([가-힣]{2,4})$', name)
-        if match:
-            result.append(match.group(1))
-        else:
-            # 이름 뒤에 다른 문자가 붙은 경우 (예: 김태호 기자)
-            match = re.match(r'^([가-힣]{2,4})', name)
-            if match and match.group(1) not in ['베이징', '뉴욕', '워싱턴', '도쿄', '상하이', '라스베이거스', '홍콩', '런던', '파리']:
-                result.append(match.group(1))
-    return result if result else ['']
+# XML 다운로드/파싱 동시 처리 수 (환경변수 또는 {"workers": N}으로 조정)
+SYNC_MAX_WORKERS = int(os.environ.get('SYNC_MAX_WORKERS', '8'))
+
+# 게시 파일: index.json(요약) + reporters/<기자명>.json(기자별)
+# + months/YYYY-MM.json(월별 전체 기사, 선택) + data.json(기존 전체 파일, 이전 기간 동안 유지)
+PUBLISH_MONTH_SHARDS = os.environ.get('PUBLISH_MONTH_SHARDS', '1') == '1'
+PUBLISH_LEGACY_DATA = os.environ.get('PUBLISH_LEGACY_DATA', '1') == '1'
+# 게시할 때 목록에 없으면 지우는 분할 파일 폴더
+SHARD_PREFIXES = ('reporters/', 'months/')
+# 게시 파일 캐시 헤더 (no-cache → CloudFront 무효화 불필요, invalidation.py 참고)
+PUBLISH_CACHE_CONTROL = 'no-cache, no-store, must-revalidate'
 
 def get_all_xml_files():
-    """daily-xml 폴더의 모든 XML 파일 목록 가져오기 (지면 정보 포함된 XML만)"""
-    xml_files = []
+    """daily-xml 폴더의 XML 파일 목록 가져오기 (지면 정보 포함된 XML만, 페이지네이션)"""
+    # daily-xml 폴더의 XML (25년~26년), 키 순서 = 날짜순
+    return [
+        {'date': obj.date, 'key': obj.key, 'etag': obj.etag}
+        for obj in iter_xml_objects(s3, XML_BUCKET, 'daily-xml/')
+    ]
+
+def article_id(url, title, pub_date):
+    """기사 고유 ID: URL의 NewsView/XXXXX, URL 없으면 입력일자+제목
+    (같은 기사가 제목만 다르게 수정된 경우도 URL로 묶임)
+    """
+    if '/NewsView/' in url:
+        return url.split('/NewsView/')[-1].split('?')[0]
+    return f'{pub_date}|{title}'
+
+def parse_xml_articles(source, date):
+    """XML 한 파일 스트리밍 파싱 → 지면기사 목록 (기사당 1개, 기자명은 reporters 목록)
+    source: S3 Body 스트림, bytes 등 (xml_stream.iter_records 참고)
+    """
+    articles = []
     
-    # daily-xml 폴더의 모든 XML (25년~26년)
-    response = s3.list_objects_v2(Bucket=XML_BUCKET, Prefix='daily-xml/')
-    for obj in response.get('Contents', []):
-        key = obj['Key']
-        # 20260119.xml 형식
-        match = re.search(r'(\d{8})\.xml', key)
-        if match:
-            date_str = match.group(1)
-            xml_files.append({'date': date_str, 'key': key})
+    for record in iter_records(source):
+        paper_num = record['paper_number']
+        if paper_num < 1:
+            continue
+        
+        title = record['title'].strip()
+        title = html.unescape(title).replace('&quot;', '"')
+        
+        author = record['author']
+        # 본문은 저장하지 않으므로 글자수만 계산
+        char_count = count_chars(record['content'])
+        
+        if record['format'] == 'item':
+            # 기존 형식: <item type="text"> ... <paper><editingInfo><paperNumber>
+            paper_position = record['paper_position']
+            paper_paragraph = record['paper_paragraph']
+            # 위치: position 또는 paragraph에 TOP 포함시 "톱"
+            is_auto_top = ('TOP' in paper_position.upper() or 'TOP' in paper_paragraph.upper())
+            
+            # 입력일자: publishInfo/date (신문 발행일) 사용
+            pub_date_raw = record['publish_date']
+            if pub_date_raw and len(pub_date_raw) == 8:
+                input_date = f'{pub_date_raw[:4]}-{pub_date_raw[4:6]}-{pub_date_raw[6:8]}'
+            else:
+                # publishInfo/date 없으면 XML 파일명 날짜 사용
+                input_date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
+            pub_time = record['time']
+        else:
+            # 새 형식: <article> ... <pageNumber>, pubDate 기준으로 신문 발행일 계산
+            paper_position = ''
+            paper_paragraph = ''
+            # 톱 여부 (1면이면 톱으로 간주)
+            is_auto_top = (paper_num == 1)
+            input_date, pub_time = paper_date_from_pubdate(record['pub_datetime'], date)
+        
+        position = '톱' if is_auto_top else ''
+        
+        reporters = list(dict.fromkeys(name for name in extract_reporters(author) if name))
+        if not reporters:
+            continue
+        articles.append({
+            'id': article_id(record['url'], title, input_date),
+            'nsid': record['nsid'],
+            'title': title,
+            'author': author,
+            'reporters': reporters,
+            'pub_date': input_date,  # 입력일자 기준
+            'pub_time': pub_time,
+            'char_count': char_count,
+            'url': record['url'],
+            'paper_number': paper_num,
+            'paper_position': paper_position,
+            'paper_paragraph': paper_paragraph,
+            'position': position,
+            'is_auto_top': is_auto_top,
+            'category': record['category']
+        })
     
-    # 날짜순 정렬
-    xml_files.sort(key=lambda x: x['date'])
-    return xml_files
+    return articles
 
-def lambda_handler(event, context):
-    # 모든 XML 파일 목록 가져오기 (25년~26년)
-    xml_files = get_all_xml_files()
+def load_cached_day(xml_info):
+    """날짜별 파싱 캐시 조회 (원본 XML의 ETag가 같을 때만 사용)"""
+    try:
+        r = s3.get_object(Bucket=CACHE_BUCKET, Key=f"{CACHE_PREFIX}{xml_info['date']}.json")
+        cached = json.loads(r['Body'].read().decode('utf-8'))
+    except Exception:
+        return None
+    if cached.get('etag') != xml_info['etag'] or cached.get('version') != CACHE_VERSION:
+        return None
+    return cached.get('articles', [])
+
+def save_cached_day(xml_info, articles):
+    """날짜별 파싱 결과 저장 (source ETag 기록)"""
+    s3.put_object(
+        Bucket=CACHE_BUCKET,
+        Key=f"{CACHE_PREFIX}{xml_info['date']}.json",
+        Body=json.dumps({
+            'version': CACHE_VERSION,
+            'date': xml_info['date'],
+            'source_key': xml_info['key'],
+            'etag': xml_info['etag'],
+            'articles': articles
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+        ContentType='application/json; charset=utf-8'
+    )
+
+def load_day_articles(xml_info, incremental=True):
+    """하루치 기사 목록: 캐시 hit이면 캐시, 아니면 XML 다운로드 후 파싱
     
-    if not xml_files:
-        return {'statusCode': 404, 'body': json.dumps({'error': 'No XML files found'})}
+    Returns:
+        (articles, parsed) - parsed는 실제로 XML을 파싱했는지 여부
+    """
+    if incremental:
+        cached = load_cached_day(xml_info)
+        if cached is not None:
+            return cached, False
+    
+    r = s3.get_object(Bucket=XML_BUCKET, Key=xml_info['key'])
+    articles = parse_xml_articles(r['Body'], xml_info['date'])
+    
+    try:
+        save_cached_day(xml_info, articles)
+    except Exception as e:
+        print(f"Cache save failed {xml_info['date']}: {e}")
+    return articles, True
+
+def load_all_days(xml_files, incremental=True, max_workers=SYNC_MAX_WORKERS, refresh_dates=()):
+    """날짜별 다운로드+파싱을 스레드 풀로 동시에 처리
     
-    print(f"총 {len(xml_files)}개 XML 파일 처리 시작")
+    refresh_dates에 있는 날짜는 캐시와 무관하게 다시 파싱한다 (?start/end 구간).
+    결과는 완료 순서와 무관하게 xml_files 순서(날짜순)로 합쳐지고,
+    한 파일의 오류는 해당 날짜만 건너뛴다.
+    중복 제거는 여기서 한 번: 같은 기사 ID는 처음 나온 것만 저장소에 두고,
+    기자는 저장소 키 목록만 가진다 (공동 기사도 저장소에는 1건).
+    나중 사본(수정 기사)에 공동 기자가 추가되면 그 사본을 '기사 ID#n' 키로 따로 두고
+    추가된 기자만 그 사본을 가리킨다 (기자마다 자기 이름이 있는 첫 사본, 기존 data.json과 같은 기준)
     
-    reporter_articles = defaultdict(list)
+    Returns:
+        (store, reporter_ids, parsed_count)
+        - store: {저장소 키: 기사} (날짜순, 키는 기사 ID 또는 기사 ID#n)
+        - reporter_ids: {기자명: [저장소 키, ...]}
+    """
+    store = {}
+    credited = {}  # 기사 ID → 이미 기사가 연결된 기자명
+    reporter_ids = defaultdict(list)
+    parsed_count = 0
     
-    for xml_info in xml_files:
-        date = xml_info['date']
-        key = xml_info['key']
-        try:
-            r = s3.get_object(Bucket=XML_BUCKET, Key=key)
-            content = r['Body'].read().decode('utf-8')
-            root = ET.fromstring(content)
-            
-            # 기존 형식: <item type="text"> ... <paper><editingInfo><paperNumber>
-            for item in root.findall('.//item'):
-                if item.get('type') != 'text':
-                    continue
-                
-                paper = item.find('paper')
-                if paper is None:
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [
+            pool.submit(load_day_articles, xml_info, incremental and xml_info['date'] not in refresh_dates)
+            for xml_info in xml_files
+        ]
+        for xml_info, future in zip(xml_files, futures):
+            try:
+                articles, parsed = future.result()
+            except Exception as e:
+                print(f"Error processing {xml_info['date']}: {e}")
+                continue
+            if parsed:
+                parsed_count += 1
+            for article in articles:
+                names = credited.setdefault(article['id'], set())
+                added = [name for name in article['reporters'] if name not in names]
+                if not added:
                     continue
-                editing = paper.find('editingInfo')
-                if editing is None:
-                    continue
-                
-                pn = editing.findtext('paperNumber', '0')
-                paper_num = int(pn) if pn.isdigit() else 0
-                
-                if paper_num < 1:
-                    continue
-                
-                title = item.findtext('title', '').strip()
-                title = html.unescape(title).replace('&quot;', '"')
-                
-                author = item.findtext('author', '')
-                content_text = clean_content(item.findtext('content', ''))
-                char_count = len(content_text.replace(' ', ''))
-                
-                url_elem = item.find('url')
-                url = url_elem.get('href', '') if url_elem is not None else ''
-                
-                paper_position = editing.findtext('position', '') or ''
-                paper_paragraph = editing.findtext('paragraph', '') or ''
-                
-                category_elem = item.find('category')
-                category = category_elem.get('name', '') if category_elem is not None else ''
-                
-                # 위치: position 또는 paragraph에 TOP 포함시 "톱"
-                is_auto_top = ('TOP' in paper_position.upper() or 'TOP' in paper_paragraph.upper())
-                position = '톱' if is_auto_top else ''
-                
-                reporters = extract_reporters(author)
-                
-                # 입력일자: publishInfo/date (신문 발행일) 사용
-                publish_info = paper.find('publishInfo')
-                pub_date_raw = publish_info.findtext('date', '') if publish_info is not None else ''
-                if pub_date_raw and len(pub_date_raw) == 8:
-                    input_date = f'{pub_date_raw[:4]}-{pub_date_raw[4:6]}-{pub_date_raw[6:8]}'
-                else:
-                    # publishInfo/date 없으면 XML 파일명 날짜 사용
-                    input_date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
-                
-                for reporter_name in reporters:
-                    if not reporter_name:
-                        continue
-                    article = {
-                        'nsid': item.findtext('nsid', ''),
-                        'title': title,
-                        'author': author,
-                        'reporter_name': reporter_name,
-                        'pub_date': input_date,  # 입력일자 기준으로 변경
-                        'pub_time': item.findtext('time', ''),
-                        'char_count': char_count,
-                        'url': url,
-                        'paper_number': paper_num,
-                        'paper_position': paper_position,
-                        'paper_paragraph': paper_paragraph,
-                        'position': position,
-                        'is_auto_top': is_auto_top,
-                        'category': category
-                    }
-                    reporter_articles[reporter_name].append(article)
-            
-            # 새 형식: <article> ... <pageNumber>
-            # pubDate를 기준으로 신문 발행일 계산 (일요일은 신문 없음)
-            for article_elem in root.findall('.//article'):
-                pn = article_elem.findtext('pageNumber', '0')
-                paper_num = int(pn) if pn and pn.isdigit() else 0
-                
-                if paper_num < 1:
-                    continue
-                
-                title = article_elem.findtext('title', '').strip()
-                title = html.unescape(title).replace('&quot;', '"')
-                
-                author = article_elem.findtext('writer', '')
-                content_text = clean_content(article_elem.findtext('content', ''))
-                char_count = len(content_text.replace(' ', ''))
-                
-                url = article_elem.findtext('link', '')
-                
-                # 입력일자: pubDate에서 신문 발행일 계산
-                # 규칙: 오전 7시 ~ 다음날 오전 5시 → 다음날 신문
-                # 단, 일요일은 신문 없음 → 월요일로 이동
-                pub_date_str = article_elem.findtext('pubDate', '')
-                pub_time = ''
-                if pub_date_str and ' ' in pub_date_str:
-                    pub_time = pub_date_str.split(' ')[1]
-                    try:
-                        dt = datetime.strptime(pub_date_str, '%Y-%m-%d %H:%M:%S')
-                        # 오전 5시 이전이면 당일 신문, 오전 5시 이후면 다음날 신문
-                        if dt.hour < 5:
-                            paper_date = dt
-                        else:
-                            paper_date = dt + timedelta(days=1)
-                        
-                        # 일요일(6)이면 월요일로 이동
-                        if paper_date.weekday() == 6:  # Sunday
-                            paper_date = paper_date + timedelta(days=1)
-                        
-                        input_date = paper_date.strftime('%Y-%m-%d')
-                    except:
-                        input_date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
-                else:
-                    input_date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
-                
-                # 톱 여부 (1면이면 톱으로 간주)
-                is_auto_top = (paper_num == 1)
-                position = '톱' if is_auto_top else ''
-                
-                reporters = extract_reporters(author)
-                
-                for reporter_name in reporters:
-                    if not reporter_name:
-                        continue
-                    article = {
-                        'nsid': article_elem.findtext('link', '').split('/')[-1] if article_elem.findtext('link', '') else '',
-                        'title': title,
-                        'author': author,
-                        'reporter_name': reporter_name,
-                        'pub_date': input_date,  # 입력일자 기준으로 변경
-                        'pub_time': pub_time,
-                        'char_count': char_count,
-                        'url': url,
-                        'paper_number': paper_num,
-                        'paper_position': '',
-                        'paper_paragraph': '',
-                        'position': position,
-                        'is_auto_top': is_auto_top,
-                        'category': ''
-                    }
-                    reporter_articles[reporter_name].append(article)
-        except Exception as e:
-            print(f'Error processing {date}: {e}')
+                key = article['id']
+                if key in store:
+                    # 수정 기사에 공동 기자 추가: 추가된 기자만 이 사본으로
+                    key = f"{article['id']}#{len(names)}"
+                    article = {**article, 'reporters': added}
+                store[key] = article
+                names.update(added)
+                for name in added:
+                    reporter_ids[name].append(key)
     
-    # 기자별 정리 (중복 제거)
+    return store, reporter_ids, parsed_count
+
+def reporter_shard_key(name):
+    return f'reporters/{name}.json'
+
+def reporter_article(article, name):
+    """저장소 기사 → 기자 한 명 기준 기사 (기존 data.json 형식, reporter_name 포함)"""
+    return {f: name if f == 'reporter_name' else article[f] for f in ARTICLE_FIELDS}
+
+def build_artifacts(data, store):
+    """기자별 요약(기사 ID 목록) + 기사 저장소 → 게시할 파일들 {S3 key: JSON 객체}
+    
+    - index.json: 요약 + 기자별 카운터 + 기간 + 일별 기사수 (기사 목록 없음)
+    - reporters/<기자명>.json: 기자 한 명의 기사 목록 (기존 data.json의 reporters 항목, 기사는 열 단위 표)
+    - months/YYYY-MM.json: 해당 월 고유 기사 (공동 기사도 1건, 기자명은 reporters 목록, 열 단위 표)
+      공동 기자가 추가된 수정 기사는 추가된 기자 몫으로 한 번 더 (reporters = 추가된 기자)
+    - data.json: 기존 형식 (기자마다 기사 사본, PUBLISH_LEGACY_DATA일 때만)
+    """
+    artifacts = {}
+    legacy_reporters = []
+    nsids = set()
+    daily_articles = defaultdict(set)
+    month_articles = defaultdict(list)
+    
+    for r in data['reporters']:
+        articles = [reporter_article(store[i], r['name']) for i in r['article_ids']]
+        reporter = {
+            'name': r['name'],
+            'articles': articles,
+            'total_chars': r['total_chars'],
+            'article_count': r['article_count'],
+            'avg_chars': r['avg_chars']
+        }
+        # reporter_name은 파일의 name으로 복원
+        artifacts[reporter_shard_key(r['name'])] = {
+            **reporter, 'articles': encode_articles(articles, omit=('reporter_name',))
+        }
+        if PUBLISH_LEGACY_DATA:
+            legacy_reporters.append(reporter)
+    
+    for a in store.values():
+        if a['nsid']:
+            nsids.add(a['nsid'])
+        # 일별 고유 기사수 (nsid, 없으면 url 기준)
+        ident = a['nsid'] or a['url']
+        if a['pub_date'] and ident:
+            daily_articles[a['pub_date']].add(ident)
+        if a['pub_date']:
+            month_articles[a['pub_date'][:7]].append({f: a[f] for f in COLUMN_FIELDS if f in a})
+    
+    artifacts['index.json'] = {
+        'last_sync': data['last_sync'],
+        'period_start': data['period_start'],
+        'period_end': data['period_end'],
+        'total_articles': data['total_articles'],
+        'total_reporters': data['total_reporters'],
+        'unique_articles': len(nsids),
+        'daily_counts': {d: len(ids) for d, ids in sorted(daily_articles.items())},
+        'months': sorted(month_articles),
+        'reporters': [{
+            'name': r['name'],
+            'article_count': r['article_count'],
+            'total_chars': r['total_chars'],
+            'avg_chars': r['avg_chars']
+        } for r in data['reporters']]
+    }
+    
+    if PUBLISH_MONTH_SHARDS:
+        for month, articles in month_articles.items():
+            artifacts[f'months/{month}.json'] = {'month': month, 'articles': encode_articles(articles)}
+    
+    if PUBLISH_LEGACY_DATA:
+        artifacts['data.json'] = {**data, 'reporters': legacy_reporters}
+    
+    return artifacts
+
+def build_data(xml_files, store, reporter_ids):
+    """load_all_days 결과 → 기자별 요약 (build_artifacts 입력, 기사는 저장소 키 목록)"""
+    # 기자별 정리 (중복 제거는 load_all_days에서 완료, 기자는 기사 ID 목록만)
     dates = [f['date'] for f in xml_files]
     reporters_data = []
-    for name, articles in reporter_articles.items():
-        # 중복 제거: URL 기준 (같은 기사가 제목만 다르게 수정된 경우 대응)
-        seen = set()
-        unique_articles = []
-        for a in articles:
-            # URL에서 기사 ID 추출 (NewsView/XXXXX 형식)
-            url = a.get('url', '')
-            if '/NewsView/' in url:
-                key = url.split('/NewsView/')[-1].split('?')[0]
-            else:
-                key = (a['title'], a['pub_date'])  # URL 없으면 제목+날짜
-            
-            if key not in seen:
-                seen.add(key)
-                unique_articles.append(a)
-        
-        total_chars = sum(a['char_count'] for a in unique_articles)
+    for name, ids in reporter_ids.items():
+        total_chars = sum(store[i]['char_count'] for i in ids)
         reporters_data.append({
             'name': name,
-            'articles': unique_articles,
+            'article_ids': ids,
             'total_chars': total_chars,
-            'article_count': len(unique_articles),
-            'avg_chars': total_chars // len(unique_articles) if unique_articles else 0
+            'article_count': len(ids),
+            'avg_chars': total_chars // len(ids) if ids else 0
         })
     
-    # 기사수 기준 내림차순 정렬 (중복 제거 후)
+    # 기사수 기준 내림차순 정렬
     reporters_data.sort(key=lambda x: x['article_count'], reverse=True)
     
     data = {
         'last_sync': datetime.now(KST).strftime('%Y-%m-%d %H:%M'),
         'period_start': f'{dates[0][:4]}-{dates[0][4:6]}-{dates[0][6:8]}',
         'period_end': f'{dates[-1][:4]}-{dates[-1][4:6]}-{dates[-1][6:8]}',
-        'total_articles': sum(len(r['articles']) for r in reporters_data),
+        'total_articles': sum(r['article_count'] for r in reporters_data),
         'total_reporters': len(reporters_data),
         'reporters': reporters_data
     }
+    return data
+
+def published_hash(key):
+    """이미 게시된 파일의 내용 해시 (없으면 None)"""
+    try:
+        head = s3.head_object(Bucket=WEB_BUCKET, Key=key)
+        return head.get('Metadata', {}).get('content-hash')
+    except Exception:
+        return None
+
+def put_json(key, obj):
+    """웹 버킷에 JSON 업로드 (공백 없는 JSON + gzip 미리 압축, 캐시 방지 헤더 추가)
+    
+    내용 해시가 게시된 파일과 같으면 업로드 생략
     
-    # S3에 업로드 (캐시 방지 헤더 추가)
+    Returns:
+        업로드했으면 True
+    """
+    digest = content_hash(obj)
+    if published_hash(key) == digest:
+        return False
     s3.put_object(
         Bucket=WEB_BUCKET,
-        Key='data.json',
-        Body=json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'),
+        Key=key,
+        Body=gzip_bytes(dumps(obj)),
         ContentType='application/json; charset=utf-8',
-        CacheControl='no-cache, no-store, must-revalidate'
+        ContentEncoding='gzip',
+        CacheControl=PUBLISH_CACHE_CONTROL,
+        Metadata={'content-hash': digest}
     )
+    return True
+
+def publish_artifacts(artifacts):
+    """게시 파일 병렬 업로드 → 실제로 업로드한 파일 키 목록"""
+    with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as pool:
+        uploaded = list(pool.map(lambda item: put_json(*item), artifacts.items()))
+    return [key for key, done in zip(artifacts, uploaded) if done]
+
+def prune_stale_shards(artifacts):
+    """이번 게시 파일에 없는 기자별/월별 분할 파일 삭제 (기자명이 바뀌거나 빠진 경우)
     
-    # CloudFront 캐시 무효화
-    try:
-        cloudfront.create_invalidation(
-            DistributionId=CLOUDFRONT_DIST_ID,
-            InvalidationBatch={
-                'Paths': {
-                    'Quantity': 1,
-                    'Items': ['/data.json']
-                },
-                'CallerReference': f'sync-{datetime.now(KST).strftime("%Y%m%d%H%M%S")}'
-            }
-        )
-        print('CloudFront cache invalidated')
-    except Exception as e:
-        print(f'CloudFront invalidation failed: {e}')
+    Returns:
+        삭제한 키 목록
+    """
+    stale = []
+    for prefix in SHARD_PREFIXES:
+        for page in s3.get_paginator('list_objects_v2').paginate(Bucket=WEB_BUCKET, Prefix=prefix):
+            stale.extend(obj['Key'] for obj in page.get('Contents', []) if obj['Key'] not in artifacts)
+    with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as pool:
+        list(pool.map(lambda key: s3.delete_object(Bucket=WEB_BUCKET, Key=key), stale))
+    return stale
+
+def get_sync_mode(event):
+    """동기화 모드: incremental(기본) / full (?mode=full 또는 {"mode": "full"})"""
+    event = event or {}
+    params = event.get('queryStringParameters') or {}
+    mode = params.get('mode') or event.get('mode') or 'incremental'
+    return 'full' if mode == 'full' else 'incremental'
+
+def get_sync_range(event):
+    """다시 파싱할 구간: ?start=YYYYMMDD&end=YYYYMMDD (생략 시 없음)"""
+    event = event or {}
+    params = event.get('queryStringParameters') or {}
+    return (params.get('start') or event.get('start'), params.get('end') or event.get('end'))
+
+def lambda_handler(event, context):
+    # XML 파일 목록 가져오기 (25년~26년 전체)
+    # 게시 파일(index.json 등)은 항상 전체 기간으로 만듦 → start/end는 다시 파싱할 날짜만 정함
+    xml_files = get_all_xml_files()
+    
+    if not xml_files:
+        return {'statusCode': 404, 'body': json.dumps({'error': 'No XML files found'})}
+    
+    start_date, end_date = get_sync_range(event)
+    refresh_dates = set()
+    if start_date or end_date:
+        refresh_dates = {
+            f['date'] for f in xml_files
+            if (not start_date or f['date'] >= start_date) and (not end_date or f['date'] <= end_date)
+        }
+        if not refresh_dates:
+            return {'statusCode': 404, 'body': json.dumps({'error': f'No XML files found in {start_date}~{end_date}'})}
+    
+    mode = get_sync_mode(event)
+    workers = int((event or {}).get('workers') or SYNC_MAX_WORKERS)
+    print(f"총 {len(xml_files)}개 XML 파일 처리 시작 (mode={mode}, workers={workers}, 다시 파싱 구간 {len(refresh_dates)}일)")
+    
+    store, reporter_ids, parsed_count = load_all_days(
+        xml_files, incremental=(mode == 'incremental'), max_workers=workers, refresh_dates=refresh_dates
+    )
+    
+    print(f"XML 파싱 {parsed_count}건, 캐시 사용 {len(xml_files) - parsed_count}건")
+    
+    print(f"고유 기사 {len(set(a['id'] for a in store.values()))}건 (공동 기자 추가 사본 포함 {len(store)}건)")
+    
+    data = build_data(xml_files, store, reporter_ids)
+    
+    # S3에 업로드: index.json + 기자별/월별 분할 파일 (+ data.json)
+    # 내용이 바뀐 파일만 업로드 (last_sync만 다르면 생략)
+    artifacts = build_artifacts(data, store)
+    published_keys = publish_artifacts(artifacts)
+    pruned_keys = prune_stale_shards(artifacts)
+    print(f"게시 {len(published_keys)}건, 변경 없음 {len(artifacts) - len(published_keys)}건, 삭제 {len(pruned_keys)}건")
+    
+    # CloudFront 캐시 무효화: 바뀐 파일을 모아 게시가 끝난 뒤 1건으로 (no-cache 파일은 생략)
+    invalidations = InvalidationBatch(cloudfront, CLOUDFRONT_DIST_ID, 'sync')
+    for key in published_keys:
+        invalidations.mark(key, PUBLISH_CACHE_CONTROL)
+    paths = invalidations.flush()
+    if paths:
+        print(f'CloudFront cache invalidated: {paths}')
     
     return {
         'statusCode': 200,
@@ -311,6 +451,14 @@ def lambda_handler(event, context):
             'period_end': data['period_end'],
             'total_articles': data['total_articles'],
             'total_reporters': data['total_reporters'],
-            'last_sync': data['last_sync']
+            'last_sync': data['last_sync'],
+            'mode': mode,
+            'parsed_files': parsed_count,
+            'cached_files': len(xml_files) - parsed_count,
+            'published': bool(published_keys),
+            'published_files': len(published_keys),
+            'unchanged_files': len(artifacts) - len(published_keys),
+            'pruned_files': len(pruned_keys),
+            'invalidated': bool(paths)
         }, ensure_ascii=False)
     }
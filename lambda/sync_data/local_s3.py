@@ -0,0 +1,157 @@
+"""
+로컬 S3 대역 (오프라인 테스트/벤치마크용)
+XML/, November_xml/ 폴더의 daily_YYYYMMDD.xml 을 daily-xml/YYYYMMDD.xml 키로 제공
+- list_objects_v2 / get_paginator / get_object / head_object / put_object / delete_object 지원
+- latency: 요청당 지연(초)으로 S3 왕복 시간을 흉내냄
+- put_object 결과는 메모리에만 저장
+- put_object 조건부 업로드(IfMatch / IfNoneMatch='*') 지원, 실패 시 S3처럼 PreconditionFailed
+"""
+import io
+import os
+import re
+import time
+import hashlib
+import threading
+from datetime import datetime, timezone
+
+
+class NoSuchKey(Exception):
+    pass
+
+
+class ClientError(Exception):
+    """botocore ClientError와 같은 모양 (e.response['Error']['Code'])"""
+
+    def __init__(self, code, message=''):
+        super().__init__(f'{code}: {message}')
+        self.response = {'Error': {'Code': code, 'Message': message}}
+
+
+class _Exceptions:
+    NoSuchKey = NoSuchKey
+    ClientError = ClientError
+
+
+class _Paginator:
+    def __init__(self, client):
+        self.client = client
+
+    def paginate(self, **kwargs):
+        token = None
+        while True:
+            params = dict(kwargs)
+            params.pop('PaginationConfig', None)
+            if token:
+                params['ContinuationToken'] = token
+            page = self.client.list_objects_v2(**params)
+            yield page
+            if not page.get('IsTruncated'):
+                break
+            token = page['NextContinuationToken']
+
+
+class LocalS3:
+    exceptions = _Exceptions
+
+    def __init__(self, xml_dirs, bucket='sedaily-news-xml-storage', prefix='daily-xml/', latency=0.0):
+        self.latency = latency
+        self.objects = {}
+        self._lock = threading.Lock()
+        for xml_dir in xml_dirs:
+            for name in sorted(os.listdir(xml_dir)):
+                match = re.search(r'(\d{8})\.xml$', name)
+                if not match:
+                    continue
+                path = os.path.join(xml_dir, name)
+                with open(path, 'rb') as f:
+                    body = f.read()
+                mtime = datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+                self._store(bucket, f'{prefix}{match.group(1)}.xml', body, {}, mtime)
+
+    def _store(self, bucket, key, body, metadata, last_modified=None, **extra):
+        self.objects[(bucket, key)] = {
+            'Body': body,
+            'ETag': '"%s"' % hashlib.md5(body).hexdigest(),
+            'LastModified': last_modified or datetime.now(timezone.utc),
+            'Metadata': metadata,
+            **extra
+        }
+        return self.objects[(bucket, key)]
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def list_objects_v2(self, Bucket, Prefix='', StartAfter='', ContinuationToken=None, MaxKeys=1000):
+        self._wait()
+        # ContinuationToken = 직전 페이지의 마지막 키 (S3처럼 있으면 StartAfter 무시)
+        after = ContinuationToken or StartAfter
+        keys = sorted(k for (b, k) in self.objects if b == Bucket and k.startswith(Prefix) and k > after)
+        page = keys[:MaxKeys]
+        response = {
+            'Contents': [{
+                'Key': k,
+                'ETag': self.objects[(Bucket, k)]['ETag'],
+                'Size': len(self.objects[(Bucket, k)]['Body']),
+                'LastModified': self.objects[(Bucket, k)]['LastModified']
+            } for k in page],
+            'KeyCount': len(page),
+            'IsTruncated': len(keys) > MaxKeys
+        }
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = page[-1]
+        return response
+
+    def get_paginator(self, operation_name):
+        return _Paginator(self)
+
+    def head_object(self, Bucket, Key):
+        self._wait()
+        obj = self.objects.get((Bucket, Key))
+        if obj is None:
+            raise NoSuchKey(Key)
+        return {k: v for k, v in obj.items() if k != 'Body'} | {'ContentLength': len(obj['Body'])}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self._wait()
+        obj = self.objects.get((Bucket, Key))
+        if obj is None:
+            raise NoSuchKey(Key)
+        return {k: v for k, v in obj.items() if k != 'Body'} | {
+            'Body': io.BytesIO(obj['Body']),
+            'ContentLength': len(obj['Body'])
+        }
+
+    def put_object(self, Bucket, Key, Body, Metadata=None, IfMatch=None, IfNoneMatch=None, **kwargs):
+        self._wait()
+        if isinstance(Body, str):
+            Body = Body.encode('utf-8')
+        # 조건 확인과 저장을 한 번에 (S3의 조건부 쓰기처럼)
+        with self._lock:
+            current = self.objects.get((Bucket, Key))
+            if IfNoneMatch == '*' and current is not None:
+                raise ClientError('PreconditionFailed', Key)
+            if IfMatch is not None:
+                if current is None:
+                    raise NoSuchKey(Key)
+                if current['ETag'] != IfMatch:
+                    raise ClientError('PreconditionFailed', Key)
+            obj = self._store(Bucket, Key, Body, Metadata or {}, **kwargs)
+        return {'ETag': obj['ETag']}
+
+    def delete_object(self, Bucket, Key):
+        self._wait()
+        with self._lock:
+            self.objects.pop((Bucket, Key), None)
+        return {}
+
+
+class LocalCloudFront:
+    """create_invalidation 호출만 기록"""
+
+    def __init__(self):
+        self.invalidations = []
+
+    def create_invalidation(self, DistributionId, InvalidationBatch):
+        self.invalidations.append(InvalidationBatch)
+        return {'Invalidation': {'Status': 'InProgress'}}
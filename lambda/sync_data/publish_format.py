@@ -0,0 +1,98 @@
+"""
+게시 파일 압축 형식
+- 공백 없는 JSON (indent 없음)
+- 기사 목록은 열(column) 단위 표로 저장: 키 이름이 기사마다 반복되지 않음
+- 반복 값이 많은 열(기자명, 바이라인, 날짜, 지면 위치 등)은 사전 인코딩
+  {"d": [고유값...], "i": [기사별 인덱스...]}
+- url이 'https://www.sedaily.com/NewsView/<nsid>' 이면 null로 저장 (nsid로 복원)
+- 업로드는 gzip으로 미리 압축 (Content-Encoding: gzip)
+- 내용 해시(last_sync 제외)를 객체 메타데이터에 저장, 같으면 업로드 생략
+
+디코더: dashboard/data-loader.js 의 decodeArticles (decode_articles와 동일한 규칙)
+"""
+import gzip
+import hashlib
+import json
+
+FORMAT = 'columnar-1'
+URL_PREFIX = 'https://www.sedaily.com/NewsView/'
+
+# 열 순서 (data.json 기사 필드와 같은 순서)
+ARTICLE_FIELDS = [
+    'nsid', 'title', 'author', 'reporter_name', 'pub_date', 'pub_time', 'char_count', 'url',
+    'paper_number', 'paper_position', 'paper_paragraph', 'position', 'is_auto_top', 'category'
+]
+# 월별 파일: reporter_name 대신 공동 기자 목록(reporters)
+COLUMN_FIELDS = ARTICLE_FIELDS + ['reporters']
+DICT_FIELDS = frozenset([
+    'author', 'reporter_name', 'reporters', 'pub_date', 'url',
+    'paper_position', 'paper_paragraph', 'position', 'category'
+])
+
+
+def _dict_encode(values):
+    index = {}
+    distinct = []
+    codes = []
+    for v in values:
+        key = tuple(v) if isinstance(v, list) else v
+        if key not in index:
+            index[key] = len(distinct)
+            distinct.append(v)
+        codes.append(index[key])
+    return {'d': distinct, 'i': codes}
+
+
+def encode_articles(articles, omit=()):
+    """기사 dict 목록 → 열 단위 표
+
+    Args:
+        omit: 저장하지 않을 필드 (예: 기자별 파일의 reporter_name - 파일의 name으로 복원)
+    """
+    columns = {}
+    for field in COLUMN_FIELDS:
+        if field in omit or (articles and field not in articles[0]):
+            continue
+        if field == 'url':
+            values = [None if a['url'] == URL_PREFIX + a['nsid'] else a['url'] for a in articles]
+        elif field == 'is_auto_top':
+            values = [1 if a['is_auto_top'] else 0 for a in articles]
+        else:
+            values = [a[field] for a in articles]
+        columns[field] = _dict_encode(values) if field in DICT_FIELDS else values
+    return {'_format': FORMAT, 'n': len(articles), 'cols': columns}
+
+
+def decode_articles(table, defaults=None):
+    """열 단위 표 → 기사 dict 목록 (encode_articles의 역변환)"""
+    if isinstance(table, list):
+        return table
+    articles = [dict(defaults or {}) for _ in range(table['n'])]
+    for field, column in table['cols'].items():
+        values = [column['d'][i] for i in column['i']] if isinstance(column, dict) else column
+        for article, value in zip(articles, values):
+            article[field] = value
+    for article in articles:
+        if 'is_auto_top' in article:
+            article['is_auto_top'] = bool(article['is_auto_top'])
+        if article.get('url', '') is None:
+            article['url'] = URL_PREFIX + article['nsid']
+    # 필드 순서 원래대로
+    return [{f: a[f] for f in COLUMN_FIELDS if f in a} for a in articles]
+
+
+def dumps(obj):
+    """공백 없는 JSON (UTF-8 bytes)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def gzip_bytes(body):
+    # mtime=0: 내용이 같으면 압축 결과도 같게
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def content_hash(obj):
+    """게시 내용 해시 (last_sync 제외 - 동기화 시각만 바뀐 경우는 같은 내용)"""
+    if isinstance(obj, dict) and 'last_sync' in obj:
+        obj = {k: v for k, v in obj.items() if k != 'last_sync'}
+    return hashlib.sha256(dumps(obj)).hexdigest()
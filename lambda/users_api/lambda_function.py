@@ -1,71 +1,105 @@
+import os
+import sys
 import json
 import boto3
 from datetime import datetime
 
+# 공용 모듈 (배포 zip에는 lambda/common/*.py 를 함께 포함)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+import user_directory
+from s3_json import ConflictError
+
 s3 = boto3.client('s3')
-cloudfront = boto3.client('cloudfront')
 
 WEB_BUCKET = 'kpi.sedaily.ai'
-DISTRIBUTION_ID = 'E1DJQD9MHS4VRO'
+# 비밀번호 파일 (공개되지 않는 버킷, 동기화 Lambda의 parsed-daily 캐시와 같은 버킷)
+PRIVATE_BUCKET = 'sedaily-news-xml-storage'
+
+# 디렉터리 확인은 컨테이너당 한 번 (요청마다 S3를 조회하지 않음)
+_directory_checked = False
 
 def lambda_handler(event, context):
-    """사용자 데이터 저장/조회 API"""
-    
+    """사용자 디렉터리 저장/조회 API (user_directory.py 참고)
+
+    - GET: 전체 사용자 (비밀번호 제외), ?department=부서 → 해당 부서만
+    - POST {"login": {"id": ..., "password": ...}}: 로그인 확인 → 사용자(비밀번호 제외), 틀리면 401
+    - POST {"ops": [...]}: 사용자 단위 추가/수정/삭제
+    - POST {"users": [...]}: 전체 교체
+    """
+    global _directory_checked
+
     method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
-    
+
     try:
+        # 디렉터리가 아직 없으면 이전 users.json으로 한 번 게시
+        if not _directory_checked:
+            user_directory.ensure_directory(s3, WEB_BUCKET, PRIVATE_BUCKET)
+            _directory_checked = True
+
         if method == 'GET':
-            # users.json 조회
-            response = s3.get_object(Bucket=WEB_BUCKET, Key='users.json')
-            users = json.loads(response['Body'].read().decode('utf-8'))
+            params = event.get('queryStringParameters') or {}
+            users = user_directory.list_users(s3, WEB_BUCKET, params.get('department'))
             return {
                 'statusCode': 200,
                 'body': json.dumps({'success': True, 'users': users}, ensure_ascii=False)
             }
-        
+
         elif method == 'POST':
-            # users.json 저장
             body = json.loads(event.get('body', '{}'))
+            login = body.get('login')
+            ops = body.get('ops')
             users = body.get('users', [])
-            
-            if not users:
+
+            if login:
+                user = user_directory.check_login(s3, WEB_BUCKET, PRIVATE_BUCKET,
+                                                  str(login.get('id', '')), login.get('password', ''))
+                if user is None:
+                    return {
+                        'statusCode': 401,
+                        'body': json.dumps({'success': False, 'error': '아이디 또는 비밀번호가 올바르지 않습니다'}, ensure_ascii=False)
+                    }
                 return {
-                    'statusCode': 400,
-                    'body': json.dumps({'success': False, 'error': 'users 데이터가 없습니다'})
+                    'statusCode': 200,
+                    'body': json.dumps({'success': True, 'user': user}, ensure_ascii=False)
                 }
-            
-            # S3에 저장
-            s3.put_object(
-                Bucket=WEB_BUCKET,
-                Key='users.json',
-                Body=json.dumps(users, ensure_ascii=False, indent=2),
-                ContentType='application/json; charset=utf-8'
-            )
-            
-            # CloudFront 캐시 무효화
-            cloudfront.create_invalidation(
-                DistributionId=DISTRIBUTION_ID,
-                InvalidationBatch={
-                    'Paths': {'Quantity': 1, 'Items': ['/users.json']},
-                    'CallerReference': f'users-{datetime.now().strftime("%Y%m%d%H%M%S")}'
+            elif ops:
+                result = user_directory.apply_ops(s3, WEB_BUCKET, PRIVATE_BUCKET, ops)
+                message = f"{result['applied']}건 사용자 변경 저장 완료"
+            elif users:
+                result = user_directory.publish_all(s3, WEB_BUCKET, PRIVATE_BUCKET, users)
+                message = f"{result['published']}명 사용자 데이터 저장 완료"
+            else:
+                return {
+                    'statusCode': 400,
+                    'body': json.dumps({'success': False, 'error': 'ops 또는 users 데이터가 없습니다'}, ensure_ascii=False)
                 }
-            )
-            
+
             return {
                 'statusCode': 200,
                 'body': json.dumps({
                     'success': True,
-                    'message': f'{len(users)}명 사용자 데이터 저장 완료',
+                    'message': message,
+                    **result,
                     'saved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 }, ensure_ascii=False)
             }
-        
+
         else:
             return {
                 'statusCode': 405,
                 'body': json.dumps({'success': False, 'error': 'Method not allowed'})
             }
-    
+
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'success': False, 'error': str(e)}, ensure_ascii=False)
+        }
+    except ConflictError as e:
+        return {
+            'statusCode': 409,
+            'body': json.dumps({'success': False, 'error': str(e)}, ensure_ascii=False)
+        }
     except Exception as e:
         return {
             'statusCode': 500,
@@ -0,0 +1,252 @@
+"""
+사용자 디렉터리 (웹 버킷에 게시, users.json 대체)
+- users/by-id/<id>.json: 사용자 한 명 (비밀번호 제외)
+- users/departments/<부서>.json: {"department": 부서, "users": {id: 사용자(비밀번호 제외)}}
+- users/index.json: {"users": [{"id", "name", "department"}, ...]} (부서 목록, 기자 이름 → 부서, 목록 순서 = 화면 순서)
+- 비밀번호는 비공개 버킷 users/credentials/<id>.json 에만 저장, 로그인 확인은 Lambda에서 (check_login)
+- 수정은 사용자 단위 작업(ops): 해당 사용자 파일 + 관련 부서 파일 + (추가/삭제/이름·부서 변경 시) index.json 만 고쳐 씀
+  여러 사람이 같이 고치는 부서 파일/index.json은 조건부 업로드 (s3_json.update_json)
+- 전체 교체({"users": [...]})나 디렉터리가 아직 없을 때(이전 users.json)는 한 번에 게시
+  (이전 users.json은 비밀번호가 공개되므로 옮긴 뒤 삭제, 더 이상 만들지 않음)
+
+작업(ops) 형식:
+    {"op": "add", "user": {...}}                  새 사용자 (id 필수)
+    {"op": "update", "id": "...", "fields": {...}} 일부 필드 수정 (id는 못 바꿈)
+    {"op": "remove", "id": "..."}                  삭제
+"""
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+
+from s3_json import read_json, update_json, dumps
+
+PREFIX = 'users/'
+USER_PREFIX = PREFIX + 'by-id/'
+DEPARTMENT_PREFIX = PREFIX + 'departments/'
+INDEX_KEY = PREFIX + 'index.json'
+# 비공개 버킷 (웹 버킷 아님)
+CREDENTIAL_PREFIX = PREFIX + 'credentials/'
+LEGACY_KEY = 'users.json'
+# no-cache → 저장 시 CloudFront 무효화 불필요 (invalidation.py 참고)
+CACHE_CONTROL = 'no-cache, no-store, must-revalidate'
+PRIVATE_FIELDS = frozenset(['password'])
+MAX_WORKERS = 16
+
+
+def user_key(user_id):
+    return f'{USER_PREFIX}{user_id}.json'
+
+
+def department_key(department):
+    return f'{DEPARTMENT_PREFIX}{department}.json'
+
+
+def credential_key(user_id):
+    return f'{CREDENTIAL_PREFIX}{user_id}.json'
+
+
+def public_fields(user):
+    """웹 버킷에 싣는 필드 (비밀번호 제외)"""
+    return {k: v for k, v in user.items() if k not in PRIVATE_FIELDS}
+
+
+def private_fields(user):
+    """비공개 버킷에 싣는 필드 (비밀번호, 없으면 빈 dict)"""
+    return {k: v for k, v in user.items() if k in PRIVATE_FIELDS}
+
+
+def index_entry(user):
+    return {'id': user['id'], 'name': user.get('name', ''), 'department': user.get('department', '')}
+
+
+def _put(s3, bucket, key, obj):
+    s3.put_object(Bucket=bucket, Key=key, Body=dumps(obj),
+                  ContentType='application/json; charset=utf-8', CacheControl=CACHE_CONTROL)
+
+
+def _list_keys(s3, bucket, prefix):
+    keys = []
+    for page in s3.get_paginator('list_objects_v2').paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend(obj['Key'] for obj in page.get('Contents', []))
+    return keys
+
+
+def _put_credential(s3, private_bucket, user_id, credential):
+    s3.put_object(Bucket=private_bucket, Key=credential_key(user_id), Body=dumps(credential),
+                  ContentType='application/json; charset=utf-8')
+
+
+def publish_all(s3, bucket, private_bucket, users):
+    """사용자 목록 전체로 디렉터리 다시 게시 (목록에 없는 사용자/부서/비밀번호 파일은 삭제)
+
+    같은 id가 여러 번 나오면 처음 것만 게시 (이전 로그인 화면의 users.find와 같은 규칙)
+    비밀번호가 없는 사용자는 기존 비밀번호 파일 유지
+
+    Returns:
+        {'published': 게시한 사용자 수, 'duplicates': 건너뛴 중복 id}
+    """
+    unique = {}
+    duplicates = []
+    for u in users:
+        user_id = str(u['id'])
+        if user_id in unique:
+            duplicates.append(user_id)
+        else:
+            unique[user_id] = {**u, 'id': user_id}
+    users = list(unique.values())
+    departments = {}
+    for u in users:
+        departments.setdefault(u.get('department', ''), {})[u['id']] = public_fields(u)
+    files = {user_key(u['id']): public_fields(u) for u in users}
+    files.update({department_key(d): {'department': d, 'users': members} for d, members in departments.items()})
+    stale = [k for prefix in (USER_PREFIX, DEPARTMENT_PREFIX) for k in _list_keys(s3, bucket, prefix) if k not in files]
+    credentials = {u['id']: private_fields(u) for u in users if private_fields(u)}
+    stale_credentials = [k for k in _list_keys(s3, private_bucket, CREDENTIAL_PREFIX)
+                         if k[len(CREDENTIAL_PREFIX):-len('.json')] not in unique]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        list(pool.map(lambda item: _put_credential(s3, private_bucket, *item), credentials.items()))
+        list(pool.map(lambda item: _put(s3, bucket, *item), files.items()))
+        list(pool.map(lambda key: s3.delete_object(Bucket=bucket, Key=key), stale))
+        list(pool.map(lambda key: s3.delete_object(Bucket=private_bucket, Key=key), stale_credentials))
+    # index.json은 마지막에 (로그인 화면은 index.json이 있으면 디렉터리가 있는 것으로 봄)
+    _put(s3, bucket, INDEX_KEY, {'users': [index_entry(u) for u in users]})
+    return {'published': len(users), 'duplicates': duplicates}
+
+
+def ensure_directory(s3, bucket, private_bucket):
+    """디렉터리가 없으면 이전 users.json으로 게시 후 users.json 삭제 (비밀번호는 비공개 버킷으로)
+
+    Returns:
+        이번에 게시했으면 True
+    """
+    if read_json(s3, bucket, INDEX_KEY)[0] is not None:
+        return False
+    legacy, _ = read_json(s3, bucket, LEGACY_KEY)
+    publish_all(s3, bucket, private_bucket, legacy or [])
+    s3.delete_object(Bucket=bucket, Key=LEGACY_KEY)
+    return True
+
+
+def get_user(s3, bucket, user_id):
+    return read_json(s3, bucket, user_key(user_id))[0]
+
+
+def check_login(s3, bucket, private_bucket, user_id, password):
+    """아이디/비밀번호 확인 → 사용자(비밀번호 제외), 틀리면 None"""
+    credential = read_json(s3, private_bucket, credential_key(user_id))[0]
+    if credential is None or not hmac.compare_digest(str(credential.get('password', '')), str(password)):
+        return None
+    return get_user(s3, bucket, user_id)
+
+
+def list_users(s3, bucket, department=None):
+    """사용자 목록 (비밀번호 제외, index.json 순서)"""
+    index = (read_json(s3, bucket, INDEX_KEY)[0] or {}).get('users', [])
+    departments = [department] if department is not None else list(dict.fromkeys(u['department'] for u in index))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        shards = pool.map(lambda d: read_json(s3, bucket, department_key(d))[0] or {}, departments)
+        members = {}
+        for shard in shards:
+            members.update(shard.get('users', {}))
+    return [members[u['id']] for u in index if u['id'] in members]
+
+
+def _apply_user_op(s3, bucket, private_bucket, op):
+    """작업 하나를 사용자 파일(+비밀번호 파일)에 반영 → (id, 이전 사용자 또는 None, 새 사용자 또는 None)"""
+    kind = op.get('op')
+    user_id = str(op.get('id') or (op.get('user') or {}).get('id') or '')
+    if not user_id:
+        raise ValueError(f'id가 없습니다: {op}')
+    if kind not in ('add', 'update', 'remove'):
+        raise ValueError(f'알 수 없는 작업: {kind}')
+
+    if kind == 'remove':
+        current = get_user(s3, bucket, user_id)
+        if current is None:
+            raise ValueError(f'없는 사용자: {user_id}')
+        s3.delete_object(Bucket=bucket, Key=user_key(user_id))
+        s3.delete_object(Bucket=private_bucket, Key=credential_key(user_id))
+        return user_id, current, None
+
+    result = {}
+
+    def change(current):
+        if kind == 'add' and current is not None:
+            raise ValueError(f'이미 있는 사용자: {user_id}')
+        if kind == 'update' and current is None:
+            raise ValueError(f'없는 사용자: {user_id}')
+        if kind == 'add':
+            new = {**op['user'], 'id': user_id}
+        else:
+            new = {**current, **(op.get('fields') or {}), 'id': user_id}
+        result.update(old=current, new=public_fields(new), credential=private_fields(new))
+        return result['new']
+
+    update_json(s3, bucket, user_key(user_id), change, CacheControl=CACHE_CONTROL)
+    if result['credential']:
+        _put_credential(s3, private_bucket, user_id, result['credential'])
+    return user_id, result['old'], result['new']
+
+
+def _publish_changes(s3, bucket, changes):
+    """사용자 파일 변경 {id: (이전, 새)} → 부서 파일/index.json 반영
+
+    Returns:
+        (고친 부서 목록, index.json을 고쳤는지)
+    """
+    touched = {}
+    for user_id, (old, new) in changes.items():
+        for user in (old, new):
+            if user is not None:
+                touched.setdefault(user.get('department', ''), set()).add(user_id)
+
+    def department_update(department, user_ids):
+        def merge(current):
+            current = current or {'department': department, 'users': {}}
+            for user_id in user_ids:
+                new = changes[user_id][1]
+                if new is not None and new.get('department', '') == department:
+                    current['users'][user_id] = public_fields(new)
+                else:
+                    current['users'].pop(user_id, None)
+            return current
+        return merge
+
+    for department, user_ids in touched.items():
+        update_json(s3, bucket, department_key(department), department_update(department, user_ids),
+                    CacheControl=CACHE_CONTROL)
+
+    index_changes = {
+        user_id: new for user_id, (old, new) in changes.items()
+        if old is None or new is None or index_entry(old) != index_entry(new)
+    }
+    if index_changes:
+        def merge_index(current):
+            # 순서 유지 (새 사용자는 끝에)
+            entries = {u['id']: u for u in (current or {}).get('users', [])}
+            for user_id, new in index_changes.items():
+                if new is None:
+                    entries.pop(user_id, None)
+                else:
+                    entries[user_id] = index_entry(new)
+            return {'users': list(entries.values())}
+        update_json(s3, bucket, INDEX_KEY, merge_index, CacheControl=CACHE_CONTROL)
+
+    return sorted(touched), bool(index_changes)
+
+
+def apply_ops(s3, bucket, private_bucket, ops):
+    """사용자 단위 작업 반영 (중간 작업이 실패해도 앞에서 반영된 사용자는 부서 파일/index.json에 반영 후 오류)
+
+    Returns:
+        {'applied': 작업 수, 'departments': 고친 부서 파일, 'index_updated': index.json을 고쳤는지}
+    """
+    changes = {}
+    try:
+        for op in ops:
+            user_id, old, new = _apply_user_op(s3, bucket, private_bucket, op)
+            # 같은 사용자를 여러 번 고치면 처음 상태 → 마지막 상태
+            changes[user_id] = (changes[user_id][0] if user_id in changes else old, new)
+    finally:
+        departments, index_updated = _publish_changes(s3, bucket, changes)
+    return {'applied': len(ops), 'departments': departments, 'index_updated': index_updated}
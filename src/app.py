@@ -7,7 +7,8 @@ import xml.etree.ElementTree as ET
 import os
 import json
 from datetime import datetime
-from statistics import mean, stdev
+
+from scoring import ScoringEngine
 
 app = Flask(__name__, static_folder='../dashboard')
 CORS(app)
@@ -15,6 +16,8 @@ CORS(app)
 # 데이터 저장소 (실제로는 DB 사용)
 articles_db = []
 evaluations_db = {}
+# 기사별 점수/기자별 합계 (로드 시 계산, 평가 저장 시 증분 갱신)
+scoring = ScoringEngine()
 
 def parse_xml_file(file_path):
     """XML 파일 파싱"""
@@ -37,37 +40,6 @@ def parse_xml_file(file_path):
     return articles
 
 
-def calculate_quant_score(article):
-    """정량 점수 계산"""
-    score = 0
-    # 글자수 기준
-    if article['char_count'] >= 2000:
-        score += 10
-    elif article['char_count'] >= 1000:
-        score += 7
-    elif article['char_count'] >= 500:
-        score += 5
-    else:
-        score += 3
-    
-    # 면 정보 기준
-    page = str(article['page_number'])
-    if page == '1':
-        score += 20
-    elif page in ['2', '3', '경제', '증권']:
-        score += 10
-    else:
-        score += 5
-    return score
-
-def convert_to_relative(scores, target_mean=85, target_std=7.5):
-    """상대평가 변환"""
-    if len(scores) < 2:
-        return scores
-    m = mean(scores)
-    s = stdev(scores) if stdev(scores) > 0 else 1
-    return [round(target_mean + ((score - m) / s) * target_std, 2) for score in scores]
-
 # 시작 시 XML 로드
 def load_sample_data():
     global articles_db
@@ -75,6 +47,7 @@ def load_sample_data():
     if os.path.exists(xml_path):
         articles_db = parse_xml_file(xml_path)
         print(f"Loaded {len(articles_db)} articles from XML")
+    scoring.load(articles_db, evaluations_db)
 
 load_sample_data()
 
@@ -104,7 +77,7 @@ def get_articles():
         eval_data = evaluations_db.get(article['id'], {})
         result.append({
             **article,
-            'quant_score': calculate_quant_score(article),
+            'quant_score': scoring.quant_score(article['id']),
             'placement': eval_data.get('placement', ''),
             'planning': eval_data.get('planning', ''),
             'info_report': eval_data.get('info_report', 0),
@@ -122,70 +95,24 @@ def evaluate_article(article_id):
         'info_report': data.get('info_report', 0),
         'evaluated_at': datetime.now().isoformat()
     }
+    scoring.apply_evaluation(article_id, evaluations_db[article_id])
     return jsonify({'success': True, 'message': '평가가 저장되었습니다.'})
 
 @app.route('/api/reporters', methods=['GET'])
 def get_reporter_stats():
-    """기자별 통계"""
-    stats = {}
-    for article in articles_db:
-        writer = article['writer']
-        if writer not in stats:
-            stats[writer] = {
-                'name': writer,
-                'article_count': 0,
-                'total_chars': 0,
-                'front_page': 0,
-                'quant_score': 0,
-                'qual_score': 0
-            }
-        stats[writer]['article_count'] += 1
-        stats[writer]['total_chars'] += article['char_count']
-        if str(article['page_number']) == '1':
-            stats[writer]['front_page'] += 1
-        stats[writer]['quant_score'] += calculate_quant_score(article)
-        
-        # 정성 점수
-        eval_data = evaluations_db.get(article['id'], {})
-        if eval_data.get('placement') in ['단독', '톱']:
-            stats[writer]['qual_score'] += 15
-        elif eval_data.get('placement'):
-            stats[writer]['qual_score'] += 5
-        if eval_data.get('planning'):
-            stats[writer]['qual_score'] += 5
-        stats[writer]['qual_score'] += eval_data.get('info_report', 0)
-    
-    # 리스트로 변환 및 정렬
-    result = list(stats.values())
-    for r in result:
-        r['total_score'] = r['quant_score'] + r['qual_score']
-    result.sort(key=lambda x: x['total_score'], reverse=True)
-    
-    # 상대평가 점수 추가
-    if len(result) >= 2:
-        total_scores = [r['total_score'] for r in result]
-        relative_scores = convert_to_relative(total_scores)
-        for i, r in enumerate(result):
-            r['relative_score'] = relative_scores[i]
-            r['rank'] = i + 1
-    else:
-        for i, r in enumerate(result):
-            r['relative_score'] = r['total_score']
-            r['rank'] = i + 1
-    
-    return jsonify(result)
+    """기자별 통계 (미리 계산된 기자별 합계로 순위/상대평가, 기사 수와 무관)"""
+    return jsonify(scoring.ranking())
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """요약 통계"""
     total_articles = len(articles_db)
-    writers = set(a['writer'] for a in articles_db)
-    total_chars = sum(a['char_count'] for a in articles_db)
+    total_chars = scoring.total_chars
     evaluated = len(evaluations_db)
     
     return jsonify({
         'total_articles': total_articles,
-        'total_reporters': len(writers),
+        'total_reporters': len(scoring.reporters),
         'avg_chars': total_chars // total_articles if total_articles > 0 else 0,
         'evaluated_count': evaluated
     })
@@ -2,16 +2,22 @@
 기자 성과 측정 시스템 - Flask API 서버 v2
 실제 S3 XML 연동 + SQLite DB
 """
-from flask import Flask, jsonify, request, send_from_directory, render_template_string
+from flask import Flask, Response, jsonify, request, send_from_directory, render_template_string, stream_with_context
 from flask_cors import CORS
 from datetime import datetime, timedelta
+import base64
+import json
 import os
 
 from database import (
     init_db, get_articles_by_date, get_articles_by_reporter,
-    get_reporter_stats, save_evaluation, get_all_reporters, get_connection
+    get_reporter_stats, save_evaluation, save_evaluations, get_all_reporters, get_db, close_db,
+    refresh_article_daily_stats, article_list_query, iter_article_list, bump_generation,
+    REPORTER_MATCH_MODES
 )
-from xml_parser import sync_date, sync_recent_days, list_available_dates
+from xml_parser import list_available_dates
+from sync_jobs import submit_sync, get_job, list_jobs
+from response_cache import cached_response
 
 app = Flask(__name__, static_folder='../dashboard')
 CORS(app)
@@ -19,6 +25,9 @@ CORS(app)
 # 시작 시 DB 초기화
 init_db()
 
+# 요청마다 스레드 DB 연결을 한 번만 열고, 요청 종료 시 닫기
+app.teardown_appcontext(close_db)
+
 # ===== 정적 파일 서빙 =====
 @app.route('/')
 def index():
@@ -32,17 +41,34 @@ def serve_static(filename):
 
 @app.route('/api/sync', methods=['POST'])
 def sync_xml():
-    """S3에서 XML 동기화"""
+    """S3에서 XML 동기화 (백그라운드 작업 등록 → 202, 진행 상황은 GET /api/sync/<job_id>)"""
     data = request.json or {}
     date_str = data.get('date')  # YYYYMMDD
     days = data.get('days', 7)
     
-    if date_str:
-        count = sync_date(date_str)
-        return jsonify({'success': True, 'message': f'{date_str} 동기화 완료: {count}건'})
-    else:
-        count = sync_recent_days(days)
-        return jsonify({'success': True, 'message': f'최근 {days}일 동기화 완료: {count}건'})
+    job, created = submit_sync(date_str, days)
+    target = date_str or f'최근 {days}일'
+    return jsonify({
+        'success': True,
+        'job_id': job['id'],
+        'deduplicated': not created,
+        'status_url': f"/api/sync/{job['id']}",
+        'message': f'{target} 동기화 ' + ('시작' if created else '이미 진행 중'),
+        'job': job
+    }), 202
+
+@app.route('/api/sync', methods=['GET'])
+def sync_jobs():
+    """최근 동기화 작업 목록"""
+    return jsonify(list_jobs())
+
+@app.route('/api/sync/<job_id>', methods=['GET'])
+def sync_status(job_id):
+    """동기화 작업 상태 (날짜별 진행 포함)"""
+    job = get_job(job_id)
+    if not job:
+        return jsonify({'success': False, 'message': '작업 없음'}), 404
+    return jsonify(job)
 
 @app.route('/api/available-dates', methods=['GET'])
 def get_available_dates():
@@ -50,16 +76,84 @@ def get_available_dates():
     dates = list_available_dates(30)
     return jsonify(dates)
 
+# 기사 목록 페이지 크기 (limit 기본값/최대값)
+ARTICLE_PAGE_SIZE = 100
+ARTICLE_PAGE_MAX = 1000
+
+def encode_cursor(key):
+    """정렬 키 (pub_date, pub_time, id) → 커서 문자열"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """커서 문자열 → 정렬 키 (잘못된 값이면 ValueError)"""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except Exception:
+        raise ValueError('잘못된 cursor')
+    if not (isinstance(key, list) and len(key) == 3 and isinstance(key[2], int)):
+        raise ValueError('잘못된 cursor')
+    return tuple(key)
+
 @app.route('/api/articles', methods=['GET'])
 def get_articles():
-    """기사 목록 조회"""
+    """기사 목록 조회
+    reporter는 기자명 일치, 검색은 match=prefix(앞부분) 또는 match=contains(일부 포함)
+    
+    목록 옵션 (하나라도 쓰면 입력일시 역순 정렬, 키셋 페이지로 응답):
+    - limit=N / cursor=...: 페이지 크기(기본 ARTICLE_PAGE_SIZE) / 다음 페이지
+      → {"articles": [...], "next_cursor": "..." 또는 null}
+    - fields=title,pub_date,...: 응답 컬럼 선택
+    - stream=1: 페이지 대신 JSON 배열을 나눠서 전송 (limit 없으면 전체)
+    """
     date_str = request.args.get('date')  # YYYY-MM-DD
     reporter = request.args.get('reporter')
+    match = request.args.get('match', 'exact')
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
+    fields = request.args.get('fields')
+    cursor = request.args.get('cursor')
+    limit = request.args.get('limit')
+    stream = request.args.get('stream') in ('1', 'true')
+    
+    if match not in REPORTER_MATCH_MODES:
+        return jsonify({'success': False, 'message': f'match는 {", ".join(REPORTER_MATCH_MODES)} 중 하나'}), 400
+    
+    if fields or cursor or limit or stream:
+        try:
+            query_args = {
+                'reporter_name': reporter,
+                'date_str': date_str or datetime.now().strftime('%Y-%m-%d'),
+                'start_date': start_date,
+                'end_date': end_date,
+                'match': match,
+                'fields': [f.strip() for f in fields.split(',') if f.strip()] if fields else None,
+                'after': decode_cursor(cursor) if cursor else None,
+            }
+            if limit:
+                limit = int(limit)
+                if limit < 1:
+                    raise ValueError('limit은 1 이상')
+            # 스트리밍이 아니면 전체 목록을 한 번에 만들지 않도록 항상 페이지 단위
+            limit = min(limit, ARTICLE_PAGE_MAX) if limit else (None if stream else ARTICLE_PAGE_SIZE)
+            article_list_query(**query_args)  # 필드 이름 확인
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        
+        if stream:
+            def generate():
+                yield '['
+                for i, (row, _) in enumerate(iter_article_list(limit=limit, **query_args)):
+                    yield (',' if i else '') + json.dumps(row, ensure_ascii=False)
+                yield ']'
+            return Response(stream_with_context(generate()), mimetype='application/json')
+        
+        # 한 건 더 읽어서 다음 페이지 여부 확인
+        rows = list(iter_article_list(limit=limit + 1, **query_args))
+        next_cursor = encode_cursor(rows[limit - 1][1]) if len(rows) > limit else None
+        return jsonify({'articles': [row for row, _ in rows[:limit]], 'next_cursor': next_cursor})
     
     if reporter:
-        articles = get_articles_by_reporter(reporter, start_date, end_date)
+        articles = get_articles_by_reporter(reporter, start_date, end_date, match)
     elif date_str:
         articles = get_articles_by_date(date_str)
     else:
@@ -69,28 +163,57 @@ def get_articles():
     
     return jsonify(articles)
 
-@app.route('/api/articles/<int:article_id>/evaluate', methods=['POST'])
-def evaluate_article(article_id):
-    """기사 평가 저장"""
-    data = request.json
-    success = save_evaluation(article_id, {
+def evaluation_fields(data):
+    """요청 JSON → 평가 항목"""
+    return {
         'position': data.get('position'),
         'coverage_type': data.get('coverage_type'),
         'article_nature': data.get('article_nature'),
         'impact_grade': data.get('impact_grade'),
         'memo': data.get('memo')
-    })
+    }
+
+@app.route('/api/articles/<int:article_id>/evaluate', methods=['POST'])
+def evaluate_article(article_id):
+    """기사 평가 저장"""
+    data = request.json
+    success = save_evaluation(article_id, evaluation_fields(data))
     
     if success:
         return jsonify({'success': True, 'message': '저장되었습니다'})
     else:
         return jsonify({'success': False, 'message': '저장 실패'}), 500
 
+@app.route('/api/evaluations/batch', methods=['POST'])
+def evaluate_articles_batch():
+    """여러 기사 평가 한 번에 저장 (하루치 지면 일괄 평가)
+    
+    요청: {"evaluations": [{"article_id": 1, "position": "톱", "impact_grade": "A", ...}, ...]}
+    """
+    items = (request.json or {}).get('evaluations')
+    if not isinstance(items, list) or not items:
+        return jsonify({'success': False, 'message': 'evaluations 목록이 필요합니다'}), 400
+    
+    evaluations = []
+    for item in items:
+        article_id = item.get('article_id') if isinstance(item, dict) else None
+        if not isinstance(article_id, int) or isinstance(article_id, bool):
+            return jsonify({'success': False, 'message': f'잘못된 article_id: {article_id!r}'}), 400
+        evaluations.append((article_id, evaluation_fields(item)))
+    
+    result = save_evaluations(evaluations)
+    return jsonify({
+        'success': True,
+        'message': f"{result['saved']}건 저장되었습니다",
+        'saved': result['saved'],
+        'missing': result['missing']
+    })
+
 @app.route('/api/articles/<int:article_id>/update', methods=['POST'])
 def update_article(article_id):
     """기사 정보 수정 (면, 글자수 등)"""
     data = request.json
-    conn = get_connection()
+    conn = get_db()
     cursor = conn.cursor()
     
     updates = []
@@ -107,18 +230,22 @@ def update_article(article_id):
     if updates:
         params.append(article_id)
         cursor.execute(f'UPDATE articles SET {", ".join(updates)} WHERE id = ?', params)
+        # 면/글자수가 바뀌면 기자별 일간 집계도 갱신
+        refresh_article_daily_stats(conn, article_id)
+        bump_generation(conn)
         conn.commit()
     
-    conn.close()
     return jsonify({'success': True, 'message': '수정되었습니다'})
 
 @app.route('/api/reporters', methods=['GET'])
+@cached_response
 def get_reporters():
     """기자 목록"""
     reporters = get_all_reporters()
     return jsonify(reporters)
 
 @app.route('/api/reporter/<name>/stats', methods=['GET'])
+@cached_response
 def get_reporter_statistics(name):
     """기자별 통계"""
     start_date = request.args.get('start_date')
@@ -142,6 +269,7 @@ def get_reporter_statistics(name):
         elif period == 'halfyear':
             start_date = (today - timedelta(days=180)).strftime('%Y-%m-%d')
     
+    # 통계는 기자별 일간 집계 합계, 기사 목록 조회는 한 번만
     stats = get_reporter_stats(name, start_date, end_date)
     articles = get_articles_by_reporter(name, start_date, end_date)
     
@@ -155,9 +283,10 @@ def get_reporter_statistics(name):
     })
 
 @app.route('/api/stats/summary', methods=['GET'])
+@cached_response
 def get_summary_stats():
     """전체 요약 통계"""
-    conn = get_connection()
+    conn = get_db()
     cursor = conn.cursor()
     
     # 전체 기사 수
@@ -176,7 +305,6 @@ def get_summary_stats():
     cursor.execute('SELECT MIN(pub_date), MAX(pub_date) FROM articles')
     date_range = cursor.fetchone()
     
-    conn.close()
     
     return jsonify({
         'total_articles': total_articles,
@@ -224,20 +352,28 @@ def admin_page():
         </div>
     </div>
     <script>
-    async function syncRecent() {
-        document.getElementById('syncResult').innerHTML = '동기화 중...';
-        const res = await fetch('/api/sync', {method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify({days:7})});
-        const data = await res.json();
-        document.getElementById('syncResult').innerHTML = '<div class="alert alert-success">'+data.message+'</div>';
+    // 작업 등록 후 완료될 때까지 상태 조회
+    async function runSync(body) {
+        const area = document.getElementById('syncResult');
+        area.innerHTML = '동기화 중...';
+        const res = await fetch('/api/sync', {method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify(body)});
+        let job = (await res.json()).job;
+        while (job.status === 'queued' || job.status === 'running') {
+            area.innerHTML = `동기화 중... (${job.done_dates}/${job.total_dates ?? '-'}일, 저장 ${job.inserted}건)`;
+            await new Promise(r => setTimeout(r, 1000));
+            job = await (await fetch('/api/sync/' + job.id)).json();
+        }
+        const cls = job.status === 'done' ? 'alert-success' : 'alert-danger';
+        const msg = `${job.done_dates}일 동기화 완료: ${job.parsed}건 파싱, ${job.inserted}건 저장` + (job.error ? ` (${job.error})` : '');
+        area.innerHTML = `<div class="alert ${cls}">${msg}</div>`;
         loadStats();
     }
-    async function syncToday() {
+    function syncRecent() {
+        return runSync({days:7});
+    }
+    function syncToday() {
         const today = new Date().toISOString().slice(0,10).replace(/-/g,'');
-        document.getElementById('syncResult').innerHTML = '동기화 중...';
-        const res = await fetch('/api/sync', {method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify({date:today})});
-        const data = await res.json();
-        document.getElementById('syncResult').innerHTML = '<div class="alert alert-success">'+data.message+'</div>';
-        loadStats();
+        return runSync({date:today});
     }
     async function loadStats() {
         const res = await fetch('/api/stats/summary');
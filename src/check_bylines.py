@@ -0,0 +1,80 @@
+"""바이라인 엔진 골든 테스트
+sample_data/byline_golden.json: 샘플 XML의 실제 바이라인 495건
+- expected: 기존(afa1876) 동기화 Lambda extract_reporters 결과 (data.json 기준 규칙)
+- previous: 기존 xml_parser / generate_data 추출 결과가 expected와 달랐던 바이라인 (통합으로 바뀐 부분)
+골든 바이라인을 XML로 만들어 각 진입점(Lambda parse_xml_articles, xml_parser.parse_xml_content)에 넣고
+기자명 비교 + 캐시 효과 측정 (generate_data.py는 Lambda 파이프라인을 그대로 사용)
+"""
+import os
+import sys
+import json
+import time
+from collections import defaultdict
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, '..', 'lambda', 'sync_data'))
+import xml_parser
+import lambda_function
+from byline import extract_reporters, extract_reporter_name, parse_byline
+
+golden_path = os.path.join(ROOT, 'sample_data', 'byline_golden.json')
+golden = json.load(open(golden_path, 'r', encoding='utf-8'))
+expected = golden['expected']
+authors = list(expected)
+
+# 바이라인 1개 = 1면 기사 1건 (nsid = 순번)
+items = ''.join(f'''
+<item type="text"><nsid>{i}</nsid><title>기사 {i}</title><author>{escape(author)}</author>
+<content>본문</content><url href="https://www.sedaily.com/NewsView/{i}"/><date>20260109</date><time>09:00:00</time>
+<paper><editingInfo><paperNumber>1</paperNumber></editingInfo><publishInfo><date>20260109</date></publishInfo></paper></item>'''
+    for i, author in enumerate(authors))
+xml = f'<?xml version="1.0" encoding="UTF-8"?><items>{items}</items>'.encode('utf-8')
+
+
+def names_by_nsid(articles, field='reporter_name'):
+    result = defaultdict(list)
+    for a in articles:
+        result[a['nsid']].append(a[field])
+    return result
+
+
+lambda_names = {a['nsid']: a['reporters'] for a in lambda_function.parse_xml_articles(xml, '20260109')}
+parser_names = names_by_nsid(xml_parser.parse_xml_content(xml))
+
+failed = 0
+for i, author in enumerate(authors):
+    want = expected[author]
+    # 빈 이름('')은 Lambda에서 건너뜀, 같은 이름은 한 번만
+    named = [n for n in want if n]
+    results = {
+        'byline.extract_reporters': (extract_reporters(author), want),
+        'byline.extract_reporter_name': (extract_reporter_name(author), want[0]),
+        'xml_parser.extract_reporter_name': (xml_parser.extract_reporter_name(author), want[0]),
+        'lambda_function.parse_xml_articles': (lambda_names.get(str(i), []), list(dict.fromkeys(named))),
+        'xml_parser.parse_xml_content': (parser_names.get(str(i), []), want),
+    }
+    for entry, (got, want_entry) in results.items():
+        if got != want_entry:
+            failed += 1
+            print(f'❌ {entry}({author!r}) = {got}, 기대값 {want_entry}')
+
+print(f'골든 바이라인 {len(authors)}건, 진입점 {len(results)}개, 실패 {failed}건')
+for entry, changed in golden['previous'].items():
+    print(f'  기존 {entry}와 달라진 바이라인 {len(changed)}건 (Lambda 규칙으로 통합)')
+
+# 실제 데이터처럼 같은 바이라인이 반복되는 경우 (바이라인당 20회)
+repeated = authors * 20
+parse_byline.cache_clear()
+start = time.time()
+for a in repeated:
+    parse_byline.__wrapped__(a)
+uncached = time.time() - start
+start = time.time()
+for a in repeated:
+    extract_reporters(a)
+cached = time.time() - start
+print(f'{len(repeated)}회 파싱: 캐시 없음 {uncached * 1000:.1f}ms / 캐시 {cached * 1000:.1f}ms')
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,55 @@
+"""새 형식(<article>) 입력일자 점검
+xml_parser(SQLite 저장)와 동기화 Lambda(data.json)가 같은 신문 발행일 규칙을 쓰는지 확인
+- 고정 사례: 저녁 기사(다음날 신문), 토요일 저녁 기사(일요일 → 월요일), 새벽 기사(당일), 시각 없는 pubDate(파일 날짜)
+- 샘플 XML 전체: 두 진입점의 기사별 입력일자 비교
+"""
+import os
+import sys
+import glob
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, '..', 'lambda', 'sync_data'))
+import xml_parser
+import lambda_function
+
+# (nsid, pubDate, 기대 입력일자, 기대 pub_time) - XML 파일 날짜는 20260108 (목)
+CASES = [
+    ('EVENING', '2026-01-08 21:30:00', '2026-01-09', '21:30:00'),   # 오전 5시 이후 → 다음날 신문
+    ('SUNDAY', '2026-01-10 19:00:00', '2026-01-12', '19:00:00'),    # 토요일 저녁 → 일요일 → 월요일
+    ('DAWN', '2026-01-08 04:30:00', '2026-01-08', '04:30:00'),      # 오전 5시 이전 → 당일 신문
+    ('NOTIME', '2026-01-08', '2026-01-08', ''),                     # 시각 없음 → 파일 날짜
+]
+articles = ''.join(f'''
+<article><title>기사 {nsid}</title><link>https://www.sedaily.com/NewsView/{nsid}</link>
+<pubDate>{pub}</pubDate><writer>홍길동 기자</writer><content>본문</content><pageNumber>1</pageNumber></article>'''
+    for nsid, pub, _, _ in CASES)
+xml = f'<?xml version="1.0" encoding="UTF-8"?><articles>{articles}</articles>'.encode('utf-8')
+
+failed = 0
+parser_dates = {a['nsid']: (a['pub_date'], a['pub_time']) for a in xml_parser.parse_xml_content(xml, date='20260108')}
+lambda_dates = {a['nsid']: (a['pub_date'], a['pub_time']) for a in lambda_function.parse_xml_articles(xml, '20260108')}
+for nsid, pub, want_date, want_time in CASES:
+    for entry, got in (('xml_parser', parser_dates.get(nsid)), ('lambda', lambda_dates.get(nsid))):
+        if got != (want_date, want_time):
+            failed += 1
+            print(f'❌ {entry} {nsid} pubDate={pub!r} → {got}, 기대값 {(want_date, want_time)}')
+print(f'고정 사례 {len(CASES)}건, 실패 {failed}건')
+
+# 샘플 XML 전체 (파일명의 날짜를 XML 날짜로)
+compared = 0
+for path in sorted(glob.glob(os.path.join(ROOT, '..', 'XML', '*.xml')) + glob.glob(os.path.join(ROOT, '..', 'November_xml', '*.xml'))):
+    date = os.path.basename(path)[-12:-4]
+    # 같은 nsid가 수정본으로 여러 번 나오므로 (nsid, 입력 시각) 단위로 비교
+    expected = {(a['nsid'], a['pub_time']): a['pub_date'] for a in lambda_function.parse_xml_articles(path, date)}
+    for a in xml_parser.parse_local_xml(path):
+        key = (a['nsid'], a['pub_time'])
+        if key not in expected:
+            continue
+        compared += 1
+        if a['pub_date'] != expected[key]:
+            failed += 1
+            print(f"❌ {os.path.basename(path)} {a['nsid']} {a['pub_time']}: xml_parser {a['pub_date']} / lambda {expected[key]}")
+print(f'샘플 XML 기사 {compared}건 비교, 전체 실패 {failed}건')
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,80 @@
+"""기자별 조회/통계/목록 페이지/일간 집계 실행 계획 확인 (EXPLAIN QUERY PLAN)
+exact/prefix는 (reporter_name, pub_date, pub_time) 복합 인덱스를 써야 하고,
+contains(LIKE '%이름%')만 전체 검색 + 기자명 일치 결과 확인
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+import database
+
+database.DB_PATH = os.path.join(tempfile.mkdtemp(), 'plan.db')
+database.init_db()
+conn = database.get_db()
+
+# 실제와 비슷한 분포: 기자 200명 x 60일
+# + 2글자 이름이 3글자 이름 안에 들어가는 경우 (LIKE '%이름%'이면 섞임)
+database.insert_articles(
+    {'nsid': f'r{r}-{d}', 'title': f'기사{r}-{d}', 'reporter_name': f'기자{r:03d}',
+     'pub_date': f'2026-{1 + d // 30:02d}-{1 + d % 30:02d}'}
+    for r in range(200) for d in range(60)
+)
+database.insert_articles([
+    {'nsid': 'n1', 'title': '기사1', 'reporter_name': '김민', 'pub_date': '2026-01-05'},
+    {'nsid': 'n2', 'title': '기사2', 'reporter_name': '김민수', 'pub_date': '2026-01-06'},
+    {'nsid': 'n3', 'title': '기사3', 'reporter_name': '이김민', 'pub_date': '2026-01-07'},
+])
+conn.execute('ANALYZE')
+
+INDEX = 'idx_articles_reporter_date_time'
+cases = [
+    ('exact', None, None, True),
+    ('exact', '2026-01-01', '2026-01-31', True),
+    ('prefix', None, None, True),
+    ('prefix', '2026-01-01', None, True),
+    ('contains', None, None, False),
+]
+
+failed = 0
+for build in (database.reporter_articles_query, database.reporter_stats_query):
+    for match, start, end, expect_index in cases:
+        query, params = build('김민', start, end, match)
+        plan = [row['detail'] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+        uses_index = any(INDEX in d for d in plan if d.startswith(('SEARCH a ', 'SEARCH articles ')))
+        ok = uses_index == expect_index
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} {build.__name__} {match:<8} {start or '-'}~{end or '-'}: {' / '.join(plan)}")
+
+# 목록 키셋 페이지: 인덱스 순서 그대로 읽어서 정렬용 임시 B-TREE가 없어야 함
+for kwargs in (
+    {'reporter_name': '기자007', 'after': ('2026-01-20', '', 100), 'limit': 20},
+    {'date_str': '2026-01-05', 'after': ('2026-01-05', '', 100), 'limit': 20, 'fields': ['title']},
+):
+    query, params, _ = database.article_list_query(**kwargs)
+    plan = [row['detail'] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+    ok = any('idx_articles_' in d and d.startswith('SEARCH a ') for d in plan) and not any('TEMP B-TREE' in d for d in plan)
+    failed += not ok
+    print(f"{'✅' if ok else '❌'} article_list_query {kwargs.get('reporter_name') or kwargs.get('date_str')}: {' / '.join(plan)}")
+
+# 일간 집계: (reporter_name, pub_date) 기본키 범위 검색 + 원본 기사 집계와 같은 값
+query, params = database.reporter_rollup_query('김민', '2026-01-01', '2026-01-31')
+plan = [row['detail'] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+ok = any('sqlite_autoindex_reporter_daily_stats' in d for d in plan)
+failed += not ok
+print(f"{'✅' if ok else '❌'} reporter_rollup_query: {' / '.join(plan)}")
+for name in ('김민', '기자007'):
+    raw = dict(conn.execute(*database.reporter_stats_query(name, '2026-01-03', '2026-02-10')).fetchone())
+    ok = raw == database.get_reporter_stats(name, '2026-01-03', '2026-02-10')
+    failed += not ok
+    print(f"{'✅' if ok else '❌'} {name} 일간 집계 = 원본 집계 {raw}")
+
+expected = {'exact': ['김민'], 'prefix': ['김민', '김민수'], 'contains': ['김민', '김민수', '이김민']}
+for match, names in expected.items():
+    got = sorted(a['reporter_name'] for a in database.get_articles_by_reporter('김민', match=match))
+    ok = got == names
+    failed += not ok
+    print(f"{'✅' if ok else '❌'} {match} '김민' → {got}")
+
+database.close_db()
+sys.exit(1 if failed else 0)
@@ -3,16 +3,75 @@
 """
 import sqlite3
 import os
+import threading
 from datetime import datetime
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'kpi_system.db')
 
+# 연결 시 한 번 적용하는 성능 설정
+# - WAL: 동기화(쓰기) 중에도 읽기가 막히지 않음
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync 하지 않아도 안전
+# - cache_size 음수는 KB 단위 (약 20MB), mmap 256MB
+PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA busy_timeout=5000',
+]
+
+_local = threading.local()
+
+# 기자 통계 항목 (원본 기사 기준 조건부 합계, articles a + evaluations e)
+STAT_COLUMNS = [
+    ('article_count', 'COUNT(*)'),
+    ('total_chars', 'COALESCE(SUM(a.char_count), 0)'),
+    ('front_page', 'COALESCE(SUM(a.paper_number = 1), 0)'),
+    ('page_2_3', 'COALESCE(SUM(a.paper_number IN (2, 3)), 0)'),
+    ('scoop_count', 'COALESCE(SUM(COALESCE(e.is_scoop, 0) != 0), 0)'),
+    ('exclusive_count', 'COALESCE(SUM(COALESCE(e.is_exclusive, 0) != 0), 0)'),
+    ('s_grade', "COALESCE(SUM(e.impact_grade = 'S'), 0)"),
+    ('a_grade', "COALESCE(SUM(e.impact_grade = 'A'), 0)"),
+]
+STAT_FIELDS = [name for name, _ in STAT_COLUMNS]
+
 def get_connection():
-    """DB 연결"""
+    """새 DB 연결 (성능 설정 적용, 사용 후 직접 close)"""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def get_db():
+    """현재 스레드(요청)의 DB 연결 - 처음 한 번만 열고 재사용, close_db()로 닫기
+    
+    Flask에서는 요청 종료 시(teardown) close_db() 호출
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = get_connection()
     return conn
 
+def close_db(exc=None):
+    """현재 스레드의 DB 연결 닫기 (Flask teardown_appcontext에 등록)"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        _local.conn = None
+        conn.close()
+
+# 데이터 세대 번호 (data_generation 테이블 1행)
+# 기사 저장/평가 저장/기사 수정 트랜잭션 안에서 1 증가 → 응답 캐시는 세대가 바뀌면 무효
+# DB에 있으므로 다른 프로세스(sync_data.py, xml_parser CLI)의 저장도 반영됨
+def current_generation():
+    """현재 데이터 세대 번호"""
+    return get_db().execute('SELECT generation FROM data_generation WHERE id = 1').fetchone()[0]
+
+def bump_generation(conn):
+    """데이터 변경 알림 (쓰기 트랜잭션 안에서 호출 - 데이터와 세대가 같이 커밋됨)"""
+    conn.execute('UPDATE data_generation SET generation = generation + 1 WHERE id = 1')
+
 def init_db():
     """테이블 생성"""
     conn = get_connection()
@@ -68,47 +127,150 @@ def init_db():
         )
     ''')
     
+    # 기자별 일간 집계 (기사 저장/평가 저장 시 같은 트랜잭션에서 갱신)
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS reporter_daily_stats (
+            reporter_name TEXT NOT NULL,
+            pub_date DATE,
+            {', '.join(f'{name} INTEGER DEFAULT 0' for name in STAT_FIELDS)},
+            PRIMARY KEY (reporter_name, pub_date)
+        )
+    ''')
+    
+    # 데이터 세대 (응답 캐시 무효화용, 1행)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS data_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO data_generation (id, generation) VALUES (1, 0)')
+    
     # 인덱스 생성
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(pub_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_reporter ON articles(reporter_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_evaluations_article ON evaluations(article_id)')
+    # 목록은 (pub_date, pub_time, id) 역순 키셋 페이지 → 인덱스도 같은 순서
+    # (SQLite 인덱스는 끝에 id(rowid)가 붙어 있음, 앞부분이 같은 이전 인덱스는 삭제)
+    # 키셋 비교에 NULL이 끼지 않도록 날짜/시각 NULL은 ''로
+    cursor.execute("UPDATE articles SET pub_date = '' WHERE pub_date IS NULL")
+    cursor.execute("UPDATE articles SET pub_time = '' WHERE pub_time IS NULL")
+    cursor.execute('DROP INDEX IF EXISTS idx_articles_date')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_date_time ON articles(pub_date, pub_time)')
+    # 기자별 조회는 기자명 일치 + 기간 → (reporter_name, pub_date, pub_time) 복합 인덱스
+    cursor.execute('DROP INDEX IF EXISTS idx_articles_reporter')
+    cursor.execute('DROP INDEX IF EXISTS idx_articles_reporter_date')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_reporter_date_time ON articles(reporter_name, pub_date, pub_time)')
+    
+    # 평가는 기사당 1건: 유일 인덱스 (이전에 중복 저장된 평가는 최신 것만 남김)
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_evaluations_article_unique'")
+    rebuild_stats = False
+    if not cursor.fetchone():
+        cursor.execute('''
+            DELETE FROM evaluations
+            WHERE id NOT IN (SELECT MAX(id) FROM evaluations GROUP BY article_id)
+        ''')
+        rebuild_stats = cursor.rowcount > 0
+        cursor.execute('DROP INDEX IF EXISTS idx_evaluations_article')
+        cursor.execute('CREATE UNIQUE INDEX idx_evaluations_article_unique ON evaluations(article_id)')
+    
+    # 집계 테이블이 새로 생긴 경우(또는 중복 평가 정리 후) 기존 기사로 다시 채우기
+    cursor.execute('SELECT EXISTS (SELECT 1 FROM reporter_daily_stats)')
+    if rebuild_stats or not cursor.fetchone()[0]:
+        rebuild_reporter_daily_stats(conn)
     
     conn.commit()
     conn.close()
     print("✅ 데이터베이스 초기화 완료")
 
+# 기자별 일간 집계 (reporter_daily_stats)
+# (기자명, 날짜) 단위로 원본 기사에서 다시 계산 - 하루치 기사만 보므로 저장 시마다 해도 가벼움
+_DAILY_STATS_SELECT = f'''
+    SELECT a.reporter_name, a.pub_date, {', '.join(expr for _, expr in STAT_COLUMNS)}
+    FROM articles a
+    LEFT JOIN evaluations e ON a.id = e.article_id
+'''
+
+def refresh_reporter_daily_stats(conn, keys):
+    """(기자명, 날짜) 목록의 집계 다시 계산 (호출하는 쪽 트랜잭션 안에서 실행)"""
+    keys = [k for k in set(keys) if k[0]]
+    conn.executemany('DELETE FROM reporter_daily_stats WHERE reporter_name = ? AND pub_date IS ?', keys)
+    conn.executemany(
+        'INSERT INTO reporter_daily_stats ' + _DAILY_STATS_SELECT +
+        ' WHERE a.reporter_name = ? AND a.pub_date IS ? GROUP BY a.reporter_name, a.pub_date',
+        keys
+    )
+
+def refresh_article_daily_stats(conn, article_id):
+    """기사 한 건이 속한 (기자명, 날짜) 집계 다시 계산 (평가/기사 수정 후)"""
+    row = conn.execute('SELECT reporter_name, pub_date FROM articles WHERE id = ?', (article_id,)).fetchone()
+    if row:
+        refresh_reporter_daily_stats(conn, [(row[0], row[1])])
+
+def refresh_articles_daily_stats(conn, article_ids):
+    """여러 기사가 속한 (기자명, 날짜) 집계 다시 계산 (일괄 평가 후)"""
+    ids = list(article_ids)
+    keys = set()
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        rows = conn.execute(
+            f'SELECT reporter_name, pub_date FROM articles WHERE id IN ({",".join("?" * len(chunk))})', chunk
+        )
+        keys.update((row[0], row[1]) for row in rows)
+    refresh_reporter_daily_stats(conn, keys)
+
+def rebuild_reporter_daily_stats(conn):
+    """집계 테이블 전체 재생성"""
+    conn.execute('DELETE FROM reporter_daily_stats')
+    conn.execute(
+        'INSERT INTO reporter_daily_stats ' + _DAILY_STATS_SELECT +
+        " WHERE a.reporter_name IS NOT NULL AND a.reporter_name != '' GROUP BY a.reporter_name, a.pub_date"
+    )
+
 # 기사 관련 함수
-def insert_article(article_data):
-    """기사 추가 (중복 시 무시)"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute('''
-            INSERT OR IGNORE INTO articles 
-            (nsid, title, author, reporter_name, pub_date, pub_time, content, char_count, url, paper_number, paper_position, category)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            article_data.get('nsid'),
-            article_data.get('title'),
-            article_data.get('author'),
-            article_data.get('reporter_name'),
-            article_data.get('pub_date'),
-            article_data.get('pub_time'),
-            article_data.get('content'),
-            article_data.get('char_count', 0),
-            article_data.get('url'),
-            article_data.get('paper_number', 0),
-            article_data.get('paper_position'),
-            article_data.get('category')
-        ))
-        conn.commit()
-        return cursor.lastrowid
-    finally:
-        conn.close()
+INSERT_ARTICLE_SQL = '''
+    INSERT OR IGNORE INTO articles 
+    (nsid, title, author, reporter_name, pub_date, pub_time, content, char_count, url, paper_number, paper_position, category)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _article_row(article_data):
+    """기사 dict → INSERT 파라미터"""
+    return (
+        article_data.get('nsid'),
+        article_data.get('title'),
+        article_data.get('author'),
+        article_data.get('reporter_name'),
+        article_data.get('pub_date') or '',
+        article_data.get('pub_time') or '',
+        article_data.get('content'),
+        article_data.get('char_count', 0),
+        article_data.get('url'),
+        article_data.get('paper_number', 0),
+        article_data.get('paper_position'),
+        article_data.get('category')
+    )
+
+def insert_articles(articles):
+    """기사 일괄 추가 (연결 1개, 트랜잭션 1개, executemany / 중복 시 무시)
+    
+    Args:
+        articles: 기사 dict의 iterable (리스트, 제너레이터 모두 가능)
+    
+    Returns:
+        {'inserted': 새로 저장된 건수, 'ignored': 중복으로 무시된 건수}
+    """
+    rows = [_article_row(a) for a in articles]
+    conn = get_db()
+    with conn:  # 성공 시 commit 한 번, 오류 시 전체 rollback (집계 갱신 포함)
+        before = conn.total_changes
+        conn.executemany(INSERT_ARTICLE_SQL, rows)
+        inserted = conn.total_changes - before
+        if inserted:
+            refresh_reporter_daily_stats(conn, [(r[3], r[4]) for r in rows])
+            bump_generation(conn)
+    return {'inserted': inserted, 'ignored': len(rows) - inserted}
 
 def get_articles_by_date(date_str):
     """날짜별 기사 조회"""
-    conn = get_connection()
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('''
         SELECT a.*, e.position, e.coverage_type, e.article_nature, e.impact_grade, e.is_exclusive, e.is_scoop
@@ -118,109 +280,227 @@ def get_articles_by_date(date_str):
         ORDER BY a.paper_number ASC, a.pub_time DESC
     ''', (date_str,))
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
-def get_articles_by_reporter(reporter_name, start_date=None, end_date=None):
-    """기자별 기사 조회"""
-    conn = get_connection()
-    cursor = conn.cursor()
+# 기자명 검색 방식
+# - exact: 기자명 일치 (기본, 인덱스 사용)
+# - prefix: 기자명 앞부분 일치 (인덱스 범위 검색)
+# - contains: 기자명 일부 포함 (LIKE '%이름%', 전체 검색 - 명시적으로 요청할 때만)
+REPORTER_MATCH_MODES = ('exact', 'prefix', 'contains')
+
+def _reporter_filter(reporter_name, start_date=None, end_date=None, match='exact'):
+    """기자별 조회 WHERE 절 + 파라미터 (articles 별칭 a)"""
+    if match not in REPORTER_MATCH_MODES:
+        raise ValueError(f'match는 {REPORTER_MATCH_MODES} 중 하나: {match}')
+    if match == 'exact':
+        where = ' WHERE a.reporter_name = ?'
+        params = [reporter_name]
+    elif match == 'prefix':
+        # LIKE 'name%'는 인덱스를 못 쓰므로 문자열 범위로
+        where = ' WHERE a.reporter_name >= ? AND a.reporter_name < ?'
+        params = [reporter_name, reporter_name + '\U0010ffff']
+    else:
+        where = " WHERE a.reporter_name LIKE ? ESCAPE '\\'"
+        escaped = reporter_name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        params = [f'%{escaped}%']
+    
+    # prefix는 기자명 범위 + 기간 범위가 겹쳐서 날짜 인덱스로 빠지는 경우가 있음
+    # → 단항 +로 날짜 조건의 인덱스 사용을 막아 기자명 인덱스로 고정
+    date_col = '+a.pub_date' if match == 'prefix' else 'a.pub_date'
+    if start_date:
+        where += f' AND {date_col} >= ?'
+        params.append(start_date)
+    if end_date:
+        where += f' AND {date_col} <= ?'
+        params.append(end_date)
+    return where, params
+
+def reporter_articles_query(reporter_name, start_date=None, end_date=None, match='exact'):
+    """기자별 기사 조회 SQL + 파라미터 (EXPLAIN QUERY PLAN 확인용으로 분리)"""
+    where, params = _reporter_filter(reporter_name, start_date, end_date, match)
     query = '''
         SELECT a.*, e.position, e.coverage_type, e.article_nature, e.impact_grade, e.is_exclusive, e.is_scoop
         FROM articles a
         LEFT JOIN evaluations e ON a.id = e.article_id
-        WHERE a.reporter_name LIKE ?
-    '''
-    params = [f'%{reporter_name}%']
-    
+    ''' + where + ' ORDER BY a.pub_date DESC, a.pub_time DESC'
+    return query, params
+
+def reporter_stats_query(reporter_name, start_date=None, end_date=None, match='exact'):
+    """원본 기사 기준 기자 통계 SQL + 파라미터 (조건부 합계 한 번, prefix/contains 검색용)"""
+    where, params = _reporter_filter(reporter_name, start_date, end_date, match)
+    query = '''
+        SELECT {}
+        FROM articles a
+        LEFT JOIN evaluations e ON a.id = e.article_id
+    '''.format(', '.join(f'{expr} AS {name}' for name, expr in STAT_COLUMNS)) + where
+    return query, params
+
+def reporter_rollup_query(reporter_name, start_date=None, end_date=None):
+    """일간 집계 기준 기자 통계 SQL + 파라미터 (기간 내 날짜 수만큼만 읽음)"""
+    query = 'SELECT {} FROM reporter_daily_stats WHERE reporter_name = ?'.format(
+        ', '.join(f'COALESCE(SUM({name}), 0) AS {name}' for name in STAT_FIELDS)
+    )
+    params = [reporter_name]
     if start_date:
-        query += ' AND a.pub_date >= ?'
+        query += ' AND pub_date >= ?'
         params.append(start_date)
     if end_date:
-        query += ' AND a.pub_date <= ?'
+        query += ' AND pub_date <= ?'
         params.append(end_date)
+    return query, params
+
+# 기사 목록 (/api/articles): 키셋 페이지 + 필드 선택 + 스트리밍
+# 정렬 키 (pub_date, pub_time, id) 역순, 커서는 마지막 행의 정렬 키
+ARTICLE_LIST_COLUMNS = {
+    'id': 'a.id', 'nsid': 'a.nsid', 'title': 'a.title', 'author': 'a.author',
+    'reporter_name': 'a.reporter_name', 'pub_date': 'a.pub_date', 'pub_time': 'a.pub_time',
+    'content': 'a.content', 'char_count': 'a.char_count', 'url': 'a.url',
+    'paper_number': 'a.paper_number', 'paper_position': 'a.paper_position',
+    'category': 'a.category', 'created_at': 'a.created_at',
+    'position': 'e.position', 'coverage_type': 'e.coverage_type', 'article_nature': 'e.article_nature',
+    'impact_grade': 'e.impact_grade', 'is_exclusive': 'e.is_exclusive', 'is_scoop': 'e.is_scoop',
+}
+ARTICLE_KEY_FIELDS = ('pub_date', 'pub_time', 'id')
+
+def article_list_query(reporter_name=None, date_str=None, start_date=None, end_date=None,
+                       match='exact', fields=None, after=None, limit=None):
+    """기사 목록 SQL + 파라미터 + 선택 컬럼
+    
+    Args:
+        reporter_name / date_str: 기자별(기간 start_date~end_date) 또는 날짜별
+        fields: 응답에 넣을 컬럼 (None이면 전체)
+        after: 커서 (pub_date, pub_time, id) - 이 행 다음부터
+        limit: 최대 행 수
+    """
+    fields = list(fields or ARTICLE_LIST_COLUMNS)
+    unknown = [f for f in fields if f not in ARTICLE_LIST_COLUMNS]
+    if unknown:
+        raise ValueError(f'알 수 없는 필드: {", ".join(unknown)}')
+    columns = fields + [k for k in ARTICLE_KEY_FIELDS if k not in fields]
+    
+    if reporter_name:
+        where, params = _reporter_filter(reporter_name, start_date, end_date, match)
+    else:
+        where, params = ' WHERE a.pub_date = ?', [date_str]
+    if after:
+        where += ' AND (a.pub_date, a.pub_time, a.id) < (?, ?, ?)'
+        params.extend(after)
+    
+    query = 'SELECT {} FROM articles a'.format(', '.join(f'{ARTICLE_LIST_COLUMNS[c]} AS {c}' for c in columns))
+    # 평가 컬럼이 없으면 조인도 생략
+    if any(ARTICLE_LIST_COLUMNS[c].startswith('e.') for c in columns):
+        query += ' LEFT JOIN evaluations e ON a.id = e.article_id'
+    query += where + ' ORDER BY a.pub_date DESC, a.pub_time DESC, a.id DESC'
+    if limit:
+        query += ' LIMIT ?'
+        params.append(limit)
+    return query, params, fields
+
+def iter_article_list(batch_size=500, **kwargs):
+    """기사 목록을 batch_size씩 읽으며 하나씩 내보냄 (전체를 메모리에 올리지 않음)
     
-    query += ' ORDER BY a.pub_date DESC, a.pub_time DESC'
-    cursor.execute(query, params)
+    kwargs는 article_list_query와 같음. 각 항목은 (행 dict, 정렬 키)
+    """
+    query, params, fields = article_list_query(**kwargs)
+    cursor = get_db().execute(query, params)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            yield {f: row[f] for f in fields}, tuple(row[k] for k in ARTICLE_KEY_FIELDS)
+
+def get_articles_by_reporter(reporter_name, start_date=None, end_date=None, match='exact'):
+    """기자별 기사 조회 (match: exact/prefix/contains, REPORTER_MATCH_MODES 참고)"""
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute(*reporter_articles_query(reporter_name, start_date, end_date, match))
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 def get_reporter_stats(reporter_name, start_date=None, end_date=None):
-    """기자 통계"""
-    articles = get_articles_by_reporter(reporter_name, start_date, end_date)
-    
-    stats = {
-        'article_count': len(articles),
-        'total_chars': sum(a.get('char_count', 0) for a in articles),
-        'front_page': sum(1 for a in articles if a.get('paper_number') == 1),
-        'page_2_3': sum(1 for a in articles if a.get('paper_number') in [2, 3]),
-        'scoop_count': sum(1 for a in articles if a.get('is_scoop')),
-        'exclusive_count': sum(1 for a in articles if a.get('is_exclusive')),
-        's_grade': sum(1 for a in articles if a.get('impact_grade') == 'S'),
-        'a_grade': sum(1 for a in articles if a.get('impact_grade') == 'A'),
-    }
-    return stats
+    """기자 통계 (일간 집계 테이블 합계 - 기간이 길어도 날짜 수만큼만 읽음)"""
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute(*reporter_rollup_query(reporter_name, start_date, end_date))
+    return dict(cursor.fetchone())
 
 # 평가 관련 함수
-def save_evaluation(article_id, eval_data):
-    """평가 저장 (기존 있으면 업데이트)"""
-    conn = get_connection()
-    cursor = conn.cursor()
+# 기사당 평가 1건 (article_id 유일), 있으면 업데이트
+UPSERT_EVALUATION_SQL = '''
+    INSERT INTO evaluations (article_id, position, coverage_type, article_nature, impact_grade, is_exclusive, is_scoop, memo)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(article_id) DO UPDATE SET
+        position = excluded.position, coverage_type = excluded.coverage_type,
+        article_nature = excluded.article_nature, impact_grade = excluded.impact_grade,
+        is_exclusive = excluded.is_exclusive, is_scoop = excluded.is_scoop,
+        memo = excluded.memo, evaluated_at = ?
+'''
+
+def _evaluation_row(article_id, eval_data, evaluated_at):
+    """평가 dict → UPSERT 파라미터"""
+    return (
+        article_id,
+        eval_data.get('position'),
+        eval_data.get('coverage_type'),
+        eval_data.get('article_nature'),
+        eval_data.get('impact_grade'),
+        1 if eval_data.get('coverage_type') == '단독' else 0,
+        1 if eval_data.get('coverage_type') == '특종' else 0,
+        eval_data.get('memo'),
+        evaluated_at
+    )
+
+def save_evaluations(evaluations):
+    """평가 일괄 저장 (트랜잭션 1개, 기자별 일간 집계도 같이 갱신)
     
-    # 기존 평가 확인
-    cursor.execute('SELECT id FROM evaluations WHERE article_id = ?', (article_id,))
-    existing = cursor.fetchone()
+    Args:
+        evaluations: (article_id, eval_data) 목록
     
-    if existing:
-        cursor.execute('''
-            UPDATE evaluations SET
-                position = ?, coverage_type = ?, article_nature = ?, impact_grade = ?,
-                is_exclusive = ?, is_scoop = ?, memo = ?, evaluated_at = ?
-            WHERE article_id = ?
-        ''', (
-            eval_data.get('position'),
-            eval_data.get('coverage_type'),
-            eval_data.get('article_nature'),
-            eval_data.get('impact_grade'),
-            1 if eval_data.get('coverage_type') == '단독' else 0,
-            1 if eval_data.get('coverage_type') == '특종' else 0,
-            eval_data.get('memo'),
-            datetime.now().isoformat(),
-            article_id
-        ))
-    else:
-        cursor.execute('''
-            INSERT INTO evaluations (article_id, position, coverage_type, article_nature, impact_grade, is_exclusive, is_scoop, memo)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            article_id,
-            eval_data.get('position'),
-            eval_data.get('coverage_type'),
-            eval_data.get('article_nature'),
-            eval_data.get('impact_grade'),
-            1 if eval_data.get('coverage_type') == '단독' else 0,
-            1 if eval_data.get('coverage_type') == '특종' else 0,
-            eval_data.get('memo')
-        ))
+    Returns:
+        {'saved': 저장 건수, 'missing': 없는 기사 ID 목록 (저장 안 함)}
+    """
+    evaluations = list(evaluations)
+    conn = get_db()
+    ids = sorted({article_id for article_id, _ in evaluations})
+    existing = set()
+    # SQLite 변수 개수 제한 때문에 나눠서 조회
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        rows = conn.execute(
+            f'SELECT id FROM articles WHERE id IN ({",".join("?" * len(chunk))})', chunk
+        )
+        existing.update(row[0] for row in rows)
     
-    conn.commit()
-    conn.close()
+    now = datetime.now().isoformat()
+    rows = [_evaluation_row(article_id, data, now) for article_id, data in evaluations if article_id in existing]
+    with conn:
+        conn.executemany(UPSERT_EVALUATION_SQL, rows)
+        refresh_articles_daily_stats(conn, existing)
+        if rows:
+            bump_generation(conn)
+    return {'saved': len(rows), 'missing': [i for i in ids if i not in existing]}
+
+def save_evaluation(article_id, eval_data):
+    """평가 저장 (기존 있으면 업데이트, 기자별 일간 집계도 같이 갱신)"""
+    conn = get_db()
+    with conn:
+        conn.execute(UPSERT_EVALUATION_SQL, _evaluation_row(article_id, eval_data, datetime.now().isoformat()))
+        refresh_article_daily_stats(conn, article_id)
+        bump_generation(conn)
     return True
 
 def get_all_reporters():
     """모든 기자 목록"""
-    conn = get_connection()
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('''
-        SELECT DISTINCT reporter_name, COUNT(*) as article_count
-        FROM articles
-        WHERE reporter_name IS NOT NULL AND reporter_name != ''
+        SELECT reporter_name, SUM(article_count) as article_count
+        FROM reporter_daily_stats
         GROUP BY reporter_name
         ORDER BY article_count DESC
     ''')
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 if __name__ == '__main__':
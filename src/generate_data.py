@@ -1,145 +1,66 @@
-"""지면기사 data.json 생성"""
+"""지면기사 게시 파일 생성 (수동 배포용)
+동기화 Lambda와 같은 파이프라인(lambda/sync_data/lambda_function.py)으로
+index.json + reporters/<기자명>.json + months/YYYY-MM.json (+ data.json) 생성
+
+사용법: python src/generate_data.py [--full] [--publish]
+- 기본: dashboard/ 에 저장 (로컬 확인용, 압축 없음, 없어진 기자/월 파일은 삭제)
+- --publish: 웹 버킷에 바로 게시 (Lambda와 같은 gzip/내용 해시/없어진 분할 파일 삭제)
+- --full: parsed-daily/ 캐시 없이 전체 XML 다시 파싱
+"""
 import boto3
-import re
-import json
-import html
-import xml.etree.ElementTree as ET
-from collections import defaultdict
-from datetime import datetime
+import os
+import sys
+import shutil
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'lambda', 'sync_data'))
+import lambda_function
+from publish_format import dumps
+
+OUT_DIR = os.path.join(ROOT, 'dashboard')
 
-s3 = boto3.client('s3', region_name='us-east-1')
 
-def clean_content(content_str):
-    if not content_str:
-        return ''
-    text = html.unescape(content_str)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+def write_artifacts(artifacts, out_dir=OUT_DIR):
+    """게시 파일을 로컬 폴더에 저장 (분할 폴더는 새로 만듦 → 없어진 기자/월 파일 정리)"""
+    for prefix in lambda_function.SHARD_PREFIXES:
+        shutil.rmtree(os.path.join(out_dir, prefix), ignore_errors=True)
+    for key, obj in artifacts.items():
+        path = os.path.join(out_dir, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(dumps(obj))
 
-def extract_reporters(author_str):
-    """공동 기자 분리"""
-    if not author_str:
-        return ['']
-    if '=' in author_str:
-        author_str = author_str.split('=')[1]
-    author_str = re.sub(r'\([^)]*@[^)]*\)', '', author_str)
-    author_str = re.sub(r'\s*(기자|특파원|선임기자|차장|부장|국장|위원|대기자|논설위원)\s*', ' ', author_str)
-    names = re.split(r'[·,/]', author_str)
-    result = []
-    for name in names:
-        name = name.strip()
-        match = re.match(r'^([가-힣]{2,4})', name)
-        if match:
-            result.append(match.group(1))
-    return result if result else ['']
 
-# S3에서 2026년 XML 전체
-response = s3.list_objects_v2(Bucket='sedaily-news-xml-storage', Prefix='daily-xml/2026')
-dates = sorted([re.search(r'(\d{8})\.xml', o['Key']).group(1) for o in response.get('Contents', []) if '2026' in o['Key']])
+def main():
+    args = sys.argv[1:]
+    lambda_function.s3 = boto3.client('s3', region_name='us-east-1')
 
-print(f'2026년 XML: {len(dates)}개 ({dates[0]} ~ {dates[-1]})')
+    xml_files = lambda_function.get_all_xml_files()
+    print(f"XML: {len(xml_files)}개 ({xml_files[0]['date']} ~ {xml_files[-1]['date']})")
 
-reporter_articles = defaultdict(list)
+    store, reporter_ids, parsed_count = lambda_function.load_all_days(xml_files, incremental='--full' not in args)
+    print(f"XML 파싱 {parsed_count}건, 캐시 사용 {len(xml_files) - parsed_count}건")
 
-for date in dates:
-    r = s3.get_object(Bucket='sedaily-news-xml-storage', Key=f'daily-xml/{date}.xml')
-    content = r['Body'].read().decode('utf-8')
-    root = ET.fromstring(content)
-    
-    for item in root.findall('.//item'):
-        if item.get('type') != 'text':
-            continue
-        
-        paper = item.find('paper')
-        if paper is None:
-            continue
-        editing = paper.find('editingInfo')
-        if editing is None:
-            continue
-        
-        pn = editing.findtext('paperNumber', '0')
-        paper_num = int(pn) if pn.isdigit() else 0
-        
-        # 지면기사만 (paperNumber >= 1)
-        if paper_num < 1:
-            continue
-        
-        title = item.findtext('title', '').strip()
-        title = html.unescape(title).replace('&quot;', '"')
-        
-        author = item.findtext('author', '')
-        content_text = clean_content(item.findtext('content', ''))
-        char_count = len(content_text.replace(' ', ''))
-        
-        url_elem = item.find('url')
-        url = url_elem.get('href', '') if url_elem is not None else ''
-        
-        paper_position = editing.findtext('position', '') or ''
-        paper_paragraph = editing.findtext('paragraph', '') or ''
-        
-        category_elem = item.find('category')
-        category = category_elem.get('name', '') if category_elem is not None else ''
-        
-        # 위치: position 또는 paragraph에 TOP 포함시 "톱"
-        is_auto_top = ('TOP' in paper_position.upper() or 'TOP' in paper_paragraph.upper())
-        position = '톱' if is_auto_top else ''
-        
-        # 공동 기자 분리
-        reporters = extract_reporters(author)
-        
-        for reporter_name in reporters:
-            if not reporter_name:
-                continue
-            article = {
-                'nsid': item.findtext('nsid', ''),
-                'title': title,
-                'author': author,
-                'reporter_name': reporter_name,
-                'pub_date': item.findtext('date', ''),
-                'pub_time': item.findtext('time', ''),
-                'content': content_text[:500],
-                'char_count': char_count,
-                'url': url,
-                'paper_number': paper_num,
-                'paper_position': paper_position,
-                'paper_paragraph': paper_paragraph,
-                'position': position,
-                'is_auto_top': is_auto_top,  # 자동 분류 여부
-                'category': category
-            }
-            reporter_articles[reporter_name].append(article)
+    data = lambda_function.build_data(xml_files, store, reporter_ids)
+    artifacts = lambda_function.build_artifacts(data, store)
 
-# 기자별 정리
-reporters_data = []
-for name, articles in sorted(reporter_articles.items(), key=lambda x: len(x[1]), reverse=True):
-    total_chars = sum(a['char_count'] for a in articles)
-    reporters_data.append({
-        'name': name,
-        'articles': articles,
-        'total_chars': total_chars,
-        'article_count': len(articles),
-        'avg_chars': total_chars // len(articles) if articles else 0
-    })
+    if '--publish' in args:
+        published = lambda_function.publish_artifacts(artifacts)
+        pruned = lambda_function.prune_stale_shards(artifacts)
+        print(f'게시 {len(published)}건, 변경 없음 {len(artifacts) - len(published)}건, 삭제 {len(pruned)}건')
+    else:
+        write_artifacts(artifacts)
+        print(f'dashboard/ 에 {len(artifacts)}개 파일 저장')
 
-# JSON 저장
-data = {
-    'last_sync': datetime.now().strftime('%Y-%m-%d'),
-    'period_start': f'{dates[0][:4]}-{dates[0][4:6]}-{dates[0][6:8]}',
-    'period_end': f'{dates[-1][:4]}-{dates[-1][4:6]}-{dates[-1][6:8]}',
-    'total_articles': sum(len(r['articles']) for r in reporters_data),
-    'total_reporters': len(reporters_data),
-    'reporters': reporters_data
-}
+    print(f'\n=== 생성 완료 ===')
+    print(f'기간: {data["period_start"]} ~ {data["period_end"]}')
+    print(f'지면기사: {data["total_articles"]}건')
+    print(f'기자: {data["total_reporters"]}명')
+    print(f'\n상위 5명:')
+    for r in data['reporters'][:5]:
+        page1 = len([i for i in r['article_ids'] if store[i]['paper_number'] == 1])
+        print(f"  {r['name']}: {r['article_count']}건 (1면:{page1})")
 
-with open('dashboard/data.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
 
-print(f'\n=== 생성 완료 ===')
-print(f'기간: {data["period_start"]} ~ {data["period_end"]}')
-print(f'지면기사: {data["total_articles"]}건')
-print(f'기자: {data["total_reporters"]}명')
-print(f'\n상위 5명:')
-for r in reporters_data[:5]:
-    page1 = len([a for a in r['articles'] if a['paper_number'] == 1])
-    print(f"  {r['name']}: {r['article_count']}건 (1면:{page1})")
+if __name__ == '__main__':
+    main()
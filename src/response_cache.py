@@ -0,0 +1,92 @@
+"""
+API 응답 캐시 (프로세스 안 TTL + LRU)
+- 키: 경로 + 쿼리 파라미터
+- 데이터 세대(database.current_generation)가 바뀌면 이전 응답은 사용하지 않음
+  (동기화/평가 저장/기사 수정 트랜잭션에서 세대 증가, DB에 있으므로 다른 프로세스의 저장도 반영)
+- ETag 발급, If-None-Match가 같으면 304
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, request
+
+from database import current_generation
+
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 60
+
+
+class ResponseCache:
+    """(키 → 세대, 만료 시각, 본문, ETag) LRU"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, generation):
+        """캐시 응답 (세대가 다르거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2], entry[3]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, generation, body, etag):
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic() + self.ttl, body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+cache = ResponseCache()
+
+
+def _json_response(body, etag):
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # 브라우저는 매번 ETag로 재검증 (바뀌지 않았으면 304)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cached_response(view):
+    """Flask 뷰 응답(JSON, 200일 때만) 캐시 + ETag/304 처리"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        # 뷰 실행 전 세대: 실행 중 데이터가 바뀌면 다음 요청에서 새로 계산
+        generation = current_generation()
+        hit = cache.get(key, generation)
+        if hit:
+            body, etag = hit
+        else:
+            response = view(*args, **kwargs)
+            if isinstance(response, tuple) or response.status_code != 200:
+                return response
+            body = response.get_data()
+            etag = f'{generation}-{hashlib.sha1(body).hexdigest()[:16]}'
+            cache.set(key, generation, body, etag)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return _json_response(body, etag)
+    return wrapper
@@ -0,0 +1,136 @@
+"""
+기자 점수 계산 엔진 (app.py)
+- 기사별 정량 점수는 로드할 때 한 번만 계산
+- 기자별 합계(기사수/글자수/1면/정량/정성)는 미리 만들어 두고,
+  평가가 저장되면 해당 기사의 정성 점수 차이만 기자 합계에 반영
+- 순위/상대평가는 기자 수 기준으로 계산 (평가 변경 전까지 재사용)
+- 상대평가(평균 85, 표준편차 7.5)는 NumPy 벡터 연산
+"""
+import threading
+
+import numpy as np
+
+
+def calculate_quant_score(article):
+    """정량 점수 계산"""
+    score = 0
+    # 글자수 기준
+    if article['char_count'] >= 2000:
+        score += 10
+    elif article['char_count'] >= 1000:
+        score += 7
+    elif article['char_count'] >= 500:
+        score += 5
+    else:
+        score += 3
+    
+    # 면 정보 기준
+    page = str(article['page_number'])
+    if page == '1':
+        score += 20
+    elif page in ['2', '3', '경제', '증권']:
+        score += 10
+    else:
+        score += 5
+    return score
+
+
+def calculate_qual_score(eval_data):
+    """정성 점수 계산 (평가 없으면 0)"""
+    score = 0
+    if eval_data.get('placement') in ['단독', '톱']:
+        score += 15
+    elif eval_data.get('placement'):
+        score += 5
+    if eval_data.get('planning'):
+        score += 5
+    score += eval_data.get('info_report', 0)
+    return score
+
+
+def convert_to_relative(scores, target_mean=85, target_std=7.5):
+    """상대평가 변환 (표본 표준편차, 0이면 1로 나눔)"""
+    if len(scores) < 2:
+        return scores
+    values = np.asarray(scores, dtype=float)
+    s = values.std(ddof=1)
+    if s <= 0:
+        s = 1
+    return np.round(target_mean + (values - values.mean()) / s * target_std, 2).tolist()
+
+
+class ScoringEngine:
+    """기사별 점수 + 기자별 합계를 미리 계산해 두고 평가 저장 시 증분 갱신"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.load([], {})
+
+    def load(self, articles, evaluations):
+        """기사/평가 전체 다시 계산 (XML 로드 시)"""
+        with self._lock:
+            self.article_writer = {}
+            self.quant_scores = {}
+            self.qual_scores = {}
+            self.reporters = {}
+            self.total_chars = 0
+            for article in articles:
+                self._add_article(article, evaluations.get(article['id'], {}))
+            self._ranking = None
+
+    def _add_article(self, article, eval_data):
+        writer = article['writer']
+        quant = calculate_quant_score(article)
+        qual = calculate_qual_score(eval_data)
+        self.article_writer[article['id']] = writer
+        self.quant_scores[article['id']] = quant
+        self.qual_scores[article['id']] = qual
+        self.total_chars += article['char_count']
+        
+        stats = self.reporters.get(writer)
+        if stats is None:
+            stats = self.reporters[writer] = {
+                'name': writer,
+                'article_count': 0,
+                'total_chars': 0,
+                'front_page': 0,
+                'quant_score': 0,
+                'qual_score': 0
+            }
+        stats['article_count'] += 1
+        stats['total_chars'] += article['char_count']
+        if str(article['page_number']) == '1':
+            stats['front_page'] += 1
+        stats['quant_score'] += quant
+        stats['qual_score'] += qual
+
+    def apply_evaluation(self, article_id, eval_data):
+        """평가 저장 반영: 해당 기사 정성 점수 차이만 기자 합계에 더함"""
+        with self._lock:
+            writer = self.article_writer.get(article_id)
+            if writer is None:
+                return
+            qual = calculate_qual_score(eval_data)
+            delta = qual - self.qual_scores[article_id]
+            if delta:
+                self.qual_scores[article_id] = qual
+                self.reporters[writer]['qual_score'] += delta
+                self._ranking = None
+
+    def quant_score(self, article_id):
+        return self.quant_scores[article_id]
+
+    def ranking(self):
+        """기자별 통계 + 총점/상대평가/순위 (총점 내림차순)
+        기사 수와 무관하게 기자 수만큼만 계산, 바뀌지 않았으면 이전 결과 재사용
+        """
+        with self._lock:
+            if self._ranking is None:
+                result = [dict(r, total_score=r['quant_score'] + r['qual_score']) for r in self.reporters.values()]
+                result.sort(key=lambda x: x['total_score'], reverse=True)
+                relative = convert_to_relative([r['total_score'] for r in result])
+                for i, r in enumerate(result):
+                    r['relative_score'] = relative[i]
+                    r['rank'] = i + 1
+                self._ranking = result
+            return self._ranking
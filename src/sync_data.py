@@ -3,24 +3,20 @@ S3 XML 데이터 동기화 스크립트
 """
 import os
 import sys
+from contextlib import closing
 sys.path.insert(0, os.path.dirname(__file__))
 
-from database import init_db, insert_article, get_connection
+from database import init_db, insert_articles, get_connection, close_db
 from xml_parser import parse_local_xml, download_xml_from_s3, list_available_dates
 
 def sync_from_local(xml_path):
     """로컬 XML 파일에서 동기화"""
     init_db()
     articles = parse_local_xml(xml_path)
+    result = insert_articles(articles)
     
-    count = 0
-    for article in articles:
-        result = insert_article(article)
-        if result:
-            count += 1
-    
-    print(f"✅ {len(articles)}건 파싱, DB 저장 완료")
-    return count
+    print(f"✅ {len(articles)}건 파싱, {result['inserted']}건 저장, {result['ignored']}건 중복")
+    return result['inserted']
 
 def sync_from_s3(date_str=None, days=7):
     """S3에서 동기화"""
@@ -28,27 +24,29 @@ def sync_from_s3(date_str=None, days=7):
     
     if date_str:
         # 특정 날짜만
-        xml_content = download_xml_from_s3(date_str)
-        if xml_content:
+        body = download_xml_from_s3(date_str)
+        if body is not None:
             from xml_parser import parse_xml_content
-            articles = parse_xml_content(xml_content)
-            for article in articles:
-                insert_article(article)
-            print(f"✅ {date_str}: {len(articles)}건 동기화")
+            with closing(body):
+                articles = parse_xml_content(body, date=date_str)
+            result = insert_articles(articles)
+            print(f"✅ {date_str}: {len(articles)}건 동기화 (저장 {result['inserted']}건, 중복 {result['ignored']}건)")
     else:
         # 최근 N일
         dates = list_available_dates(days)
         total = 0
+        inserted = 0
         for d in dates:
-            xml_content = download_xml_from_s3(d)
-            if xml_content:
+            body = download_xml_from_s3(d)
+            if body is not None:
                 from xml_parser import parse_xml_content
-                articles = parse_xml_content(xml_content)
-                for article in articles:
-                    insert_article(article)
+                with closing(body):
+                    articles = parse_xml_content(body, date=d)
+                result = insert_articles(articles)
                 total += len(articles)
-                print(f"  - {d}: {len(articles)}건")
-        print(f"✅ 총 {total}건 동기화 완료")
+                inserted += result['inserted']
+                print(f"  - {d}: {len(articles)}건 (저장 {result['inserted']}건)")
+        print(f"✅ 총 {total}건 동기화 완료 (저장 {inserted}건)")
 
 def show_stats():
     """현재 DB 통계"""
@@ -87,18 +85,22 @@ def show_stats():
 if __name__ == '__main__':
     if len(sys.argv) > 1:
         arg = sys.argv[1]
-        if arg.endswith('.xml'):
-            # 로컬 파일
-            sync_from_local(arg)
-        elif arg == 'stats':
-            show_stats()
-        elif arg == 's3':
-            # S3 동기화
-            days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
-            sync_from_s3(days=days)
-        else:
-            # 특정 날짜 (YYYYMMDD)
-            sync_from_s3(date_str=arg)
+        try:
+            if arg.endswith('.xml'):
+                # 로컬 파일
+                sync_from_local(arg)
+            elif arg == 'stats':
+                show_stats()
+            elif arg == 's3':
+                # S3 동기화
+                days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+                sync_from_s3(days=days)
+            else:
+                # 특정 날짜 (YYYYMMDD)
+                sync_from_s3(date_str=arg)
+        finally:
+            # 저장에 쓴 스레드 DB 연결 닫기 (Flask teardown 밖)
+            close_db()
     else:
         print("사용법:")
         print("  python sync_data.py sample.xml     # 로컬 XML 동기화")
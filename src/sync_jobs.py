@@ -0,0 +1,162 @@
+"""
+S3 XML 동기화 작업 큐 (Flask 프로세스 안에서 실행)
+- /api/sync 요청은 작업만 등록하고 바로 응답, 진행 상황은 작업 ID로 조회
+- 같은 요청(같은 날짜 / 같은 최근 N일)이 진행 중이면 새로 만들지 않고 기존 작업 반환
+- 날짜별로 작업자 풀에서 동시에 처리, 다른 작업과 겹치는 날짜는 한 번만 처리
+  (파싱/저장 건수는 처리한 작업에만 더하고, 기다린 작업의 날짜 상태는 'shared')
+"""
+import copy
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from xml_parser import ingest_date, list_available_dates
+from database import close_db
+
+# 날짜 동시 처리 수 (다운로드/파싱은 동시에, DB 쓰기는 SQLite가 순서대로)
+SYNC_WORKERS = int(os.environ.get('SYNC_WORKERS', '4'))
+# 완료된 작업 보관 개수
+MAX_FINISHED_JOBS = 50
+
+_lock = threading.RLock()
+_jobs = OrderedDict()   # 작업 ID → 작업
+_inflight = {}          # 요청 키 → 진행 중 작업 ID
+_date_futures = {}      # 날짜 → (진행 중 Future, 처리하는 작업 ID) (작업 간 공유)
+
+# 작업 진행(날짜 목록 조회 + 날짜 완료 대기)과 날짜 처리는 풀을 나눔 (서로 기다리다 멈추지 않게)
+_job_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sync-job')
+_date_pool = ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix='sync-date')
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def submit_sync(date_str=None, days=7):
+    """동기화 작업 등록
+    
+    Returns:
+        (작업 상태, 새로 만들었는지 여부) - 같은 요청이 진행 중이면 기존 작업
+    """
+    key = f'date:{date_str}' if date_str else f'days:{days}'
+    with _lock:
+        if key in _inflight:
+            return copy.deepcopy(_jobs[_inflight[key]]), False
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'key': key,
+            'status': 'queued',
+            'created_at': _now(),
+            'started_at': None,
+            'finished_at': None,
+            'total_dates': None,
+            'done_dates': 0,
+            'parsed': 0,
+            'inserted': 0,
+            'dates': {},
+            'error': None,
+        }
+        _jobs[job['id']] = job
+        _inflight[key] = job['id']
+        _prune()
+        snapshot = copy.deepcopy(job)
+    _job_pool.submit(_run_job, job['id'], date_str, days)
+    return snapshot, True
+
+
+def get_job(job_id):
+    """작업 상태 (없으면 None)"""
+    with _lock:
+        job = _jobs.get(job_id)
+        return copy.deepcopy(job) if job else None
+
+
+def list_jobs():
+    """최근 작업 목록 (최신순, 날짜별 상세 제외)"""
+    with _lock:
+        return [{k: v for k, v in job.items() if k != 'dates'} for job in reversed(_jobs.values())]
+
+
+def _prune():
+    """오래된 완료 작업 정리 (_lock 안에서 호출)"""
+    finished = [job_id for job_id, job in _jobs.items() if job['finished_at']]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[job_id]
+
+
+def _ingest_date(date_str):
+    """날짜 처리 (작업자 스레드) - Flask teardown이 없으므로 스레드의 DB 연결은 여기서 닫음"""
+    try:
+        return ingest_date(date_str)
+    finally:
+        close_db()
+
+
+def _date_future(date_str, job_id):
+    """날짜 처리 Future - 다른 작업이 같은 날짜를 처리 중이면 그 Future 공유
+    
+    Returns:
+        (Future, 처리하는 작업 ID) - 작업 ID가 job_id와 다르면 공유
+    """
+    with _lock:
+        entry = _date_futures.get(date_str)
+        if entry is None:
+            future = _date_pool.submit(_ingest_date, date_str)
+            entry = _date_futures[date_str] = (future, job_id)
+            future.add_done_callback(lambda _: _forget_date(date_str, future))
+        return entry
+
+
+def _forget_date(date_str, future):
+    with _lock:
+        entry = _date_futures.get(date_str)
+        if entry and entry[0] is future:
+            del _date_futures[date_str]
+
+
+def _update(job_id, **fields):
+    with _lock:
+        _jobs[job_id].update(fields)
+
+
+def _run_job(job_id, date_str, days):
+    _update(job_id, status='running', started_at=_now())
+    try:
+        dates = [date_str] if date_str else list_available_dates(days)
+        with _lock:
+            job = _jobs[job_id]
+            job['total_dates'] = len(dates)
+            job['dates'] = {d: {'status': 'running'} for d in dates}
+        
+        futures = [(d, *_date_future(d, job_id)) for d in dates]
+        for d, future, owner_id in futures:
+            try:
+                result = future.result()
+                if owner_id != job_id:
+                    # 다른 작업이 처리한 날짜 - 건수는 그 작업에만 집계
+                    date_status = {'status': 'shared', 'job_id': owner_id}
+                else:
+                    date_status = {'status': 'done' if result['found'] else 'missing', **result}
+            except Exception as e:
+                date_status = {'status': 'failed', 'error': str(e)}
+            with _lock:
+                job = _jobs[job_id]
+                job['dates'][d] = date_status
+                job['done_dates'] += 1
+                job['parsed'] += date_status.get('parsed', 0)
+                job['inserted'] += date_status.get('inserted', 0)
+        
+        failed = [d for d, st in get_job(job_id)['dates'].items() if st['status'] == 'failed']
+        _update(job_id, status='failed' if failed else 'done',
+                error=f'실패한 날짜: {", ".join(failed)}' if failed else None)
+    except Exception as e:
+        _update(job_id, status='failed', error=str(e))
+    finally:
+        with _lock:
+            job = _jobs[job_id]
+            job['finished_at'] = _now()
+            if _inflight.get(job['key']) == job_id:
+                del _inflight[job['key']]
@@ -1,12 +1,26 @@
 """
 S3 XML 파서 - 서울경제신문 기사 XML 파싱
 """
-import xml.etree.ElementTree as ET
-import re
 import html
 import boto3
 from datetime import datetime, timedelta
 import os
+import re
+import sys
+from contextlib import closing
+
+# Lambda와 공용 모듈 (lambda/common)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda', 'common'))
+from s3_listing import iter_xml_objects, latest_xml_objects
+from xml_stream import iter_records
+# 기자명 추출: Lambda와 같은 바이라인 엔진 사용
+# extract_reporter_name: '워싱턴=이태규 특파원(email)' → '이태규'
+# extract_multiple_reporters: '홍길동·김철수 기자' → ['홍길동', '김철수']
+from byline import extract_reporter_name, extract_reporters as extract_multiple_reporters
+# 본문 정리(태그/공백) + 글자수를 한 번에
+from content import clean_content, normalize_content
+# 새 형식(<article>) 입력일자: Lambda와 같은 신문 발행일 규칙
+from paper_date import paper_date_from_pubdate
 
 # S3 설정
 S3_BUCKET = 'sedaily-news-xml-storage'
@@ -16,88 +30,41 @@ def get_s3_client():
     """S3 클라이언트"""
     return boto3.client('s3', region_name='us-east-1')
 
-def extract_reporter_name(author_str):
-    """기자명 추출
-    '조양준 기자(email)' → '조양준'
-    '워싱턴=이태규 특파원(email)' → '이태규'
-    '뉴욕=홍길동 기자(email)' → '홍길동'
-    """
-    if not author_str:
-        return ''
-    
-    # '지역=이름' 패턴 처리 (워싱턴=이태규, 뉴욕=홍길동 등)
-    if '=' in author_str:
-        author_str = author_str.split('=')[1]
-    
-    # 이름 추출 (한글 이름 + 직함)
-    match = re.match(r'^([가-힣]{2,4})\s*(기자|특파원|선임기자|차장|부장|국장|위원)?', author_str)
-    if match:
-        return match.group(1)
-    
-    # 그래도 안되면 첫 단어
-    first_word = author_str.split()[0] if author_str else ''
-    # 한글만 추출
-    korean_only = re.sub(r'[^가-힣]', '', first_word)
-    return korean_only if len(korean_only) >= 2 else first_word
-
-def clean_content(content_str):
-    """HTML 태그 제거하고 순수 텍스트만"""
-    if not content_str:
-        return ''
-    # HTML 엔티티 디코딩
-    text = html.unescape(content_str)
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-    # 공백 정리
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def parse_xml_content(xml_content, print_only=True):
-    """XML 문자열 파싱
+def parse_xml_content(xml_content, print_only=True, date=None):
+    """XML 파싱 (iterparse 스트리밍, 기존 <item>/새 <article> 형식 모두 한 번에)
     
     Args:
-        xml_content: XML 문자열
+        xml_content: 바이너리 파일 객체 (S3 Body, open(..., 'rb')) 또는 파일 경로
+                     (XML 문자열/bytes는 고정 데이터용)
         print_only: True면 지면기사만 (paperNumber >= 1), False면 전체
+        date: XML 파일 날짜 'YYYYMMDD' (새 형식 pubDate에 시각이 없을 때 입력일자)
     """
     articles = []
-    root = ET.fromstring(xml_content)
     
-    for item in root.findall('.//item'):
-        if item.get('type') != 'text':
+    for record in iter_records(xml_content):
+        paper_number = record['paper_number']
+        
+        # 지면기사만 필터링 (print_only=True일 때)
+        if print_only and paper_number < 1:
             continue
         
         # 기본 정보
-        title = item.findtext('title', '').strip()
+        title = record['title'].strip()
         title = html.unescape(title).replace('&quot;', '"')
         
-        author = item.findtext('author', '')
+        author = record['author']
         
-        content = item.findtext('content', '')
-        clean_text = clean_content(content)
-        char_count = len(clean_text.replace(' ', ''))
+        clean_text, char_count = normalize_content(record['content'])
         
-        # URL
-        url_elem = item.find('url')
-        url = url_elem.get('href', '') if url_elem is not None else ''
+        # 입력일자: 기존 형식은 <date>, 새 형식은 pubDate에 신문 발행일 규칙 (Lambda와 같음)
+        pub_date, pub_time = record['date'], record['time']
+        if record['format'] == 'article':
+            file_date = date or record['pub_datetime'][:10].replace('-', '')
+            if file_date:
+                pub_date, pub_time = paper_date_from_pubdate(record['pub_datetime'], file_date)
         
         # 지면 정보
-        paper = item.find('paper')
-        paper_number = 0
-        paper_position = ''
-        if paper is not None:
-            editing = paper.find('editingInfo')
-            if editing is not None:
-                pn = editing.findtext('paperNumber', '0')
-                paper_number = int(pn) if pn.isdigit() else 0
-                paper_position = editing.findtext('position', '').strip()
-        
-        # 지면기사만 필터링 (print_only=True일 때)
-        if print_only and paper_number < 1:
-            continue
-        
-        # 카테고리
-        category_elem = item.find('category')
-        category = category_elem.get('name', '') if category_elem is not None else ''
+        paper_position = record['paper_position'].strip()
         
         # 공동 기자 처리: 쉼표나 · 로 구분된 기자명 분리
         reporter_names = extract_multiple_reporters(author)
@@ -110,68 +77,38 @@ def parse_xml_content(xml_content, print_only=True):
         # 각 기자별로 기사 생성 (공동 기자 분리)
         for reporter_name in reporter_names:
             article = {
-                'nsid': item.findtext('nsid', ''),
+                'nsid': record['nsid'],
                 'title': title,
                 'author': author,
                 'reporter_name': reporter_name,
-                'pub_date': item.findtext('date', ''),
-                'pub_time': item.findtext('time', ''),
+                'pub_date': pub_date,
+                'pub_time': pub_time,
                 'content': clean_text[:500],
                 'char_count': char_count,
-                'url': url,
+                'url': record['url'],
                 'paper_number': paper_number,
                 'paper_position': paper_position,
                 'position': position,  # 톱 자동 설정
-                'category': category
+                'category': record['category']
             }
             articles.append(article)
     
     return articles
 
 
-def extract_multiple_reporters(author_str):
-    """공동 기자 분리
-    '홍길동·김철수 기자' → ['홍길동', '김철수']
-    '홍길동, 김철수 기자' → ['홍길동', '김철수']
-    '워싱턴=이태규·김민수 특파원' → ['이태규', '김민수']
-    """
-    if not author_str:
-        return ['']
-    
-    # 지역= 패턴 제거
-    if '=' in author_str:
-        author_str = author_str.split('=')[1]
-    
-    # 이메일 제거
-    author_str = re.sub(r'\([^)]*@[^)]*\)', '', author_str)
-    
-    # 직함 제거
-    author_str = re.sub(r'\s*(기자|특파원|선임기자|차장|부장|국장|위원|대기자)\s*', ' ', author_str)
-    
-    # 구분자로 분리 (·, ,, /)
-    names = re.split(r'[·,/]', author_str)
-    
-    result = []
-    for name in names:
-        name = name.strip()
-        # 한글 이름만 추출 (2~4자)
-        match = re.match(r'^([가-힣]{2,4})', name)
-        if match:
-            result.append(match.group(1))
-    
-    return result if result else ['']
-
 def download_xml_from_s3(date_str):
-    """S3에서 특정 날짜 XML 다운로드
+    """S3에서 특정 날짜 XML 본문 스트림 (전체를 읽지 않음, 다 쓰면 close)
     date_str: 'YYYYMMDD' 형식
+    
+    Returns:
+        S3 Body (바이너리 파일 객체), 없거나 오류면 None
     """
     s3 = get_s3_client()
     key = f"{S3_PREFIX}{date_str}.xml"
     
     try:
         response = s3.get_object(Bucket=S3_BUCKET, Key=key)
-        xml_content = response['Body'].read().decode('utf-8')
-        return xml_content
+        return response['Body']
     except s3.exceptions.NoSuchKey:
         print(f"❌ XML 파일 없음: {key}")
         return None
@@ -179,61 +116,71 @@ def download_xml_from_s3(date_str):
         print(f"❌ S3 다운로드 오류: {e}")
         return None
 
-def list_available_dates(days=30):
-    """S3에서 사용 가능한 날짜 목록"""
+def list_available_dates(days=30, start_date=None, end_date=None):
+    """S3에서 사용 가능한 날짜 목록 (최신순)
+    
+    Args:
+        days: 최근 N개 날짜 (월 단위 접두어로 최신 달부터 조회)
+        start_date, end_date: 'YYYYMMDD' 구간 지정 시 해당 구간 전체
+    """
     s3 = get_s3_client()
-    dates = []
     
     try:
-        response = s3.list_objects_v2(Bucket=S3_BUCKET, Prefix=S3_PREFIX)
-        for obj in response.get('Contents', []):
-            key = obj['Key']
-            # daily-xml/20260109.xml → 20260109
-            match = re.search(r'(\d{8})\.xml$', key)
-            if match:
-                dates.append(match.group(1))
-        return sorted(dates, reverse=True)[:days]
+        if start_date or end_date:
+            objects = iter_xml_objects(s3, S3_BUCKET, S3_PREFIX, start_date, end_date)
+            return sorted((obj.date for obj in objects), reverse=True)
+        return [obj.date for obj in latest_xml_objects(s3, S3_BUCKET, days, prefix=S3_PREFIX)]
     except Exception as e:
         print(f"❌ S3 목록 조회 오류: {e}")
         return []
 
-def sync_date(date_str):
-    """특정 날짜 XML을 S3에서 가져와 DB에 저장"""
-    from database import insert_article
+def ingest_date(date_str):
+    """특정 날짜 XML을 S3에서 가져와 DB에 저장
+    
+    Returns:
+        {'found': XML 있음 여부, 'parsed': 파싱 건수, 'inserted': 저장 건수, 'ignored': 중복 건수}
+    """
+    from database import insert_articles
     
-    xml_content = download_xml_from_s3(date_str)
-    if not xml_content:
-        return 0
+    body = download_xml_from_s3(date_str)
+    if body is None:
+        return {'found': False, 'parsed': 0, 'inserted': 0, 'ignored': 0}
     
-    articles = parse_xml_content(xml_content)
-    count = 0
-    for article in articles:
-        if insert_article(article):
-            count += 1
+    # S3 Body를 그대로 스트리밍 파싱 (파일 전체를 문자열로 읽지 않음)
+    with closing(body):
+        articles = parse_xml_content(body, date=date_str)
+    result = insert_articles(articles)
     
-    print(f"✅ {date_str}: {len(articles)}건 파싱, {count}건 저장")
-    return len(articles)
+    print(f"✅ {date_str}: {len(articles)}건 파싱, {result['inserted']}건 저장, {result['ignored']}건 중복")
+    return {'found': True, 'parsed': len(articles), **result}
+
+def sync_date(date_str):
+    """특정 날짜 XML을 S3에서 가져와 DB에 저장 → 파싱 건수"""
+    return ingest_date(date_str)['parsed']
 
 def sync_recent_days(days=7):
-    """최근 N일 동기화"""
-    from database import init_db
+    """최근 N일 동기화 (CLI용, 끝나면 현재 스레드의 DB 연결을 닫음)"""
+    from database import init_db, close_db
     init_db()
     
     total = 0
     available = list_available_dates(days)
     
-    for date_str in available:
-        count = sync_date(date_str)
-        total += count
+    try:
+        for date_str in available:
+            count = sync_date(date_str)
+            total += count
+    finally:
+        close_db()
     
     print(f"✅ 총 {total}건 동기화 완료")
     return total
 
 def parse_local_xml(file_path):
-    """로컬 XML 파일 파싱"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        xml_content = f.read()
-    return parse_xml_content(xml_content)
+    """로컬 XML 파일 파싱 (파일 전체를 읽지 않고 스트리밍, 파일명의 YYYYMMDD를 XML 날짜로)"""
+    match = re.search(r'(\d{8})\.xml$', file_path)
+    with open(file_path, 'rb') as f:
+        return parse_xml_content(f, date=match.group(1) if match else None)
 
 if __name__ == '__main__':
     # 테스트: 로컬 파일 파싱